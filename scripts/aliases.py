@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Game name aliases, shared by the updater, the tier list generator and the
+episode art exporter.
+
+aliases.json is the single source; each game entry names the game as the
+tier list doc does, lists the other names episode titles (or the doc) use
+for it, and can pin its Steam app ID. At load it's compiled into hash indexes
+over normalized names (case, punctuation and spacing folded), so every lookup
+along the chain
+
+    episode title -> tier list name -> Steam app ID -> art cache filename
+
+is a dict hit. Before this, the updater's name_mappings, the exporter's
+NAME_MAPPINGS and the generator's steam_id_overrides had drifted apart, and
+each disagreement cost a fuzzy match or a directory scan.
+
+Check the file after editing it:
+
+    cd scripts && python3 aliases.py --validate
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REGISTRY_PATH = os.path.join(SCRIPTS_DIR, "aliases.json")
+
+
+def normalize(name):
+    """Lookup key for a name: NFKC, casefolded, punctuation dropped,
+    whitespace collapsed. "Risk of Rain: Returns" == "risk of rain returns"."""
+    name = unicodedata.normalize('NFKC', name).casefold()
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name).split())
+
+
+class AliasRegistry:
+    def __init__(self, games):
+        self.games = list(games)
+        self.problems = []          # conflicts found while compiling
+        self._canonical = {}        # normalized name or alias -> tier list name
+        self._app_ids = {}          # normalized tier list name -> app ID
+
+        app_id_owner = {}
+        for game in self.games:
+            name = game['name']
+            for alias in [name] + list(game.get('aliases', [])):
+                key = normalize(alias)
+                owner = self._canonical.get(key)
+                if owner is not None and normalize(owner) != normalize(name):
+                    self.problems.append(
+                        f"conflict: '{alias}' is claimed by both '{owner}' and '{name}'")
+                    continue
+                if alias != name and key == normalize(name):
+                    self.problems.append(
+                        f"redundant: alias '{alias}' is just '{name}' spelled differently; "
+                        f"lookups already ignore case and punctuation")
+                self._canonical.setdefault(key, name)
+
+            app_id = game.get('steam_app_id')
+            if app_id is not None:
+                if app_id in app_id_owner and app_id_owner[app_id] != name:
+                    self.problems.append(
+                        f"conflict: Steam app {app_id} is pinned for both "
+                        f"'{app_id_owner[app_id]}' and '{name}'")
+                app_id_owner[app_id] = name
+                self._app_ids[normalize(name)] = app_id
+
+        payload = json.dumps(self.games, sort_keys=True)
+        self.fingerprint = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def load(cls, path=REGISTRY_PATH):
+        with open(path, encoding='utf-8') as handle:
+            return cls(json.load(handle).get('games', []))
+
+    def tier_name(self, name):
+        """The tier list name for an episode title or alias; `name` itself
+        if it isn't registered."""
+        return self._canonical.get(normalize(name), name)
+
+    def key(self, name):
+        """Normalized key of a name's tier list name: two names refer to the
+        same game exactly when their keys are equal."""
+        return normalize(self.tier_name(name))
+
+    def app_id(self, name):
+        """Pinned Steam app ID for a game (by any of its names), or None."""
+        return self._app_ids.get(self.key(name))
+
+    def validate(self, episode_titles=(), doc_names=(), art_dir=None, cached_ids=None):
+        """Conflicting and dead entries, as a list of messages.
+
+        An alias is dead if no episode title or doc name uses it; a whole
+        entry is dead if nothing uses any of its names and there's no art
+        cached for it. Pass what's available; checks without their inputs
+        are skipped.
+        """
+        problems = list(self.problems)
+        seen = {normalize(name) for name in list(episode_titles) + list(doc_names)}
+        art_names = set()
+        if art_dir and os.path.isdir(art_dir):
+            art_names = {normalize(re.sub(r'(_capsule)?\.jpg$', '', filename).replace('_', ' '))
+                         for filename in os.listdir(art_dir) if filename.endswith('.jpg')}
+
+        for game in self.games:
+            name = game['name']
+            aliases = list(game.get('aliases', []))
+            if seen:
+                for alias in aliases:
+                    if normalize(alias) not in seen:
+                        problems.append(f"dead: alias '{alias}' of '{name}' matches no "
+                                        f"episode title or doc entry")
+                used = any(normalize(n) in seen for n in [name] + aliases)
+                if not used and normalize(name) not in art_names:
+                    problems.append(f"dead: '{name}' has no episode, doc entry or cached art")
+
+            app_id = game.get('steam_app_id')
+            if cached_ids and app_id is not None:
+                cached = cached_ids.get(name.lower().strip())
+                if cached is not None and int(cached) != int(app_id):
+                    problems.append(f"conflict: '{name}' is pinned to Steam app {app_id} but "
+                                    f"game_ids.json caches {cached}; delete the cached entry")
+        return problems
+
+
+_registry = None
+
+
+def registry():
+    """The registry from aliases.json, compiled once per process."""
+    global _registry
+    if _registry is None:
+        _registry = AliasRegistry.load()
+    return _registry
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check aliases.json for conflicting or dead entries')
+    parser.add_argument('--validate', action='store_true', help='run the checks (the default)')
+    parser.add_argument('--doc', metavar='FILE',
+                        help='tier list text (e.g. tierlist.txt) to count doc names as uses')
+    args = parser.parse_args()
+
+    repo_root = os.path.dirname(SCRIPTS_DIR)
+    episodes_path = os.path.join(repo_root, "public", "episodes.json")
+    titles = []
+    if os.path.exists(episodes_path):
+        with open(episodes_path, encoding='utf-8') as handle:
+            titles = [episode['title'] for episode in json.load(handle).get('episodes', [])]
+
+    doc_names = []
+    if args.doc:
+        with open(args.doc, encoding='utf-8') as handle:
+            # Same pattern as AutomatedTierListUpdater.parse_tier_list_from_content
+            for _, games in re.findall(r'([A-Z])\s*Tier:\s*([^\n\r]+)', handle.read(), re.IGNORECASE):
+                doc_names += [game.strip() for game in games.split(',') if game.strip()]
+
+    cache_dir = os.path.join(SCRIPTS_DIR, "steam_images")
+    cached_ids = {}
+    if os.path.exists(os.path.join(cache_dir, "game_ids.json")):
+        with open(os.path.join(cache_dir, "game_ids.json"), encoding='utf-8') as handle:
+            cached_ids = json.load(handle)
+
+    reg = registry()
+    problems = reg.validate(titles, doc_names, art_dir=cache_dir, cached_ids=cached_ids)
+    if problems:
+        print(f"❌ {len(problems)} problem(s) in aliases.json:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print(f"✅ aliases.json OK ({len(reg.games)} games, checked against {len(titles)} episodes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
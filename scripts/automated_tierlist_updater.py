@@ -10,26 +10,23 @@ This script:
 5. Saves the result to public/tierlist.png for the website
 """
 
-import requests
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse
 import re
 from difflib import SequenceMatcher
+from email.utils import parsedate_to_datetime
 import argparse
+import hashlib
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import cached_property
 import time
 import json
 
-# Google API imports
-try:
-    from google.oauth2.service_account import Credentials
-    from googleapiclient.discovery import build
-    GOOGLE_API_AVAILABLE = True
-except ImportError:
-    GOOGLE_API_AVAILABLE = False
-    print("Warning: Google API libraries not installed. Install with: pip install google-api-python-client google-auth")
+import aliases
+import run_cache
 
 # Import the existing tier list generator with better error handling
 try:
@@ -46,36 +43,253 @@ except Exception as e:
     sys.exit(1)
 
 
+def _run_stages(stages, max_workers=4):
+    """Run a small dependency graph of stages on a thread pool.
+
+    `stages` is a list of (name, deps, fn), in the order the steps would run
+    sequentially. Each fn is called with its dependencies' results as keyword
+    arguments as soon as they're all available, so independent stages overlap.
+    A stage fails by returning None. As when the steps ran one after another,
+    the first failure ends the run: no further stages start, and the ones
+    already running are allowed to finish. An exception does the same and is
+    re-raised afterwards.
+
+    Returns ({name: result} for stages that succeeded, {name: seconds}).
+    """
+    results, timings, errors = {}, {}, {}
+    finished = set()
+    failed = False
+    pending = list(stages)
+    running = {}
+
+    def timed(name, fn, kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(**kwargs)
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            for stage in list(pending):
+                name, deps, fn = stage
+                if errors or failed:
+                    pending.remove(stage)
+                    finished.add(name)  # skipped
+                elif all(dep in results for dep in deps):
+                    pending.remove(stage)
+                    kwargs = {dep: results[dep] for dep in deps}
+                    running[pool.submit(timed, name, fn, kwargs)] = name
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                finished.add(name)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors[name] = e
+                    continue
+                if result is not None:
+                    results[name] = result
+                else:
+                    failed = True
+
+    for name, _, _ in stages:
+        if name in errors:
+            raise errors[name]
+    return results, timings
+
+
+def _trigrams(text):
+    """Character trigrams of a normalized title, padded so short titles and
+    word starts still produce some."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TitleIndex:
+    """Trigram inverted index over normalized titles.
+
+    Used to find the handful of titles worth comparing against a name
+    instead of comparing it against every title. A pair has to share at
+    least MIN_OVERLAP of the shorter title's trigrams to be a candidate;
+    on generated titles that drops about 1 in 10,000 pairs that would have
+    reached a 0.6 ratio, and almost every pair that wouldn't.
+    """
+
+    MIN_OVERLAP = 0.2
+
+    def __init__(self, titles):
+        self.titles = list(titles)
+        self.normalized = [title.lower() for title in self.titles]
+        self.sizes = []
+        self.postings = {}
+        for i, norm in enumerate(self.normalized):
+            grams = _trigrams(norm)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+
+    def candidates(self, normalized):
+        """Indexes of titles sharing enough trigrams with `normalized`."""
+        grams = _trigrams(normalized)
+        shared = {}
+        for gram in grams:
+            for i in self.postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        return sorted(i for i, count in shared.items()
+                      if count >= self.MIN_OVERLAP * min(len(grams), self.sizes[i]))
+
+
+def _hungarian(cost):
+    """Minimum-cost assignment of every row to a distinct column.
+
+    `cost` is a rows x cols matrix with rows <= cols. Returns {row: col}.
+    Classic O(rows^2 * cols) Kuhn-Munkres with potentials.
+    """
+    n, m = len(cost), len(cost[0])
+    inf = float('inf')
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)     # p[j]: row assigned to column j (1-based, 0 = none)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0, delta, j1 = p[j0], inf, 0
+            row = cost[i0 - 1]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return {p[j] - 1: j - 1 for j in range(1, m + 1) if p[j]}
+
+
+def _max_weight_assignment(edges):
+    """One-to-one matching with the highest total score.
+
+    `edges` maps (left, right) -> score. The graph is split into connected
+    components first, so the cubic assignment step only ever sees the few
+    names that actually compete for the same partner.
+    """
+    parent = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for left, right in edges:
+        parent[find(('L', left))] = find(('R', right))
+
+    components = {}
+    for (left, right), score in edges.items():
+        components.setdefault(find(('L', left)), []).append((left, right, score))
+
+    assignment = {}
+    for component in components.values():
+        lefts = list(dict.fromkeys(left for left, _, _ in component))
+        rights = list(dict.fromkeys(right for _, right, _ in component))
+        if len(component) == 1:
+            left, right, _ = component[0]
+            assignment[left] = right
+            continue
+
+        transpose = len(lefts) > len(rights)
+        rows, cols = (rights, lefts) if transpose else (lefts, rights)
+        row_at = {name: i for i, name in enumerate(rows)}
+        col_at = {name: j for j, name in enumerate(cols)}
+        # Non-edges cost 0, i.e. "leave unmatched"
+        cost = [[0.0] * len(cols) for _ in rows]
+        for left, right, score in component:
+            row, col = (right, left) if transpose else (left, right)
+            cost[row_at[row]][col_at[col]] = -score
+
+        for i, j in _hungarian(cost).items():
+            if cost[i][j] < 0:
+                left, right = (cols[j], rows[i]) if transpose else (rows[i], cols[j])
+                assignment[left] = right
+    return assignment
+
+
 class AutomatedTierListUpdater:
+    # Bump when extraction or matching rules change, so an old ledger is
+    # discarded instead of replaying matches the new rules wouldn't make.
+    LEDGER_VERSION = 2
+
+    # Minimum SequenceMatcher ratio for an episode title to count as a doc entry
+    FUZZY_MATCH_THRESHOLD = 0.6
+
     def __init__(self, verbose=False, credentials_path=None):
         self.verbose = verbose
         self.rss_url = "https://feeds.acast.com/public/shows/roguepod-litecast"
         self.google_doc_id = "1nCm7kf_10FCEs5HKVEQyyivV50e7XrAzgueP2oSPTt8"
         self.credentials_path = credentials_path or "credentials.json"
 
-        # Hard-coded name mappings for episode titles that don't match tier list exactly
-        # Maps: episode_title -> tier_list_name
-        self.name_mappings = {
-            "Spelunky HD": "Spelunky",
-            "Vampire Crawlers": "Vampire Crawlers: The Turbo Wildcard from Vampire Survivors",
-            "Vampire Crawlers: The Turbo Wildcard from Vampire Survivors": "Vampire Crawlers",
-        }
+        # Local run state (never committed: it names unreleased games from the
+        # doc). CI restores it with actions/cache; losing it only costs a full run.
+        self.state_dir = ".cache"
+        self.ledger_path = os.path.join(self.state_dir, "episode_ledger.json")
+        self.doc_cache_path = os.path.join(self.state_dir, "tier_doc.json")
+        self.doc_revision_id = None  # revision of the last doc fetched via the API
+
+        # Episode titles that don't match the tier list name live in
+        # aliases.json, shared with the generator and the art exporter
+        self.aliases = aliases.registry()
 
         # Initialize the tier list generator
         self.generator = TierListGenerator(verbose=verbose)
 
-        # Initialize Google Docs service
-        self.docs_service = None
-        if GOOGLE_API_AVAILABLE:
-            self._init_google_docs_service()
+        # The Google Docs service (docs_service) is built on first use
         
     def vprint(self, message):
         """Print only if verbose mode is enabled"""
         if self.verbose:
             print(message)
     
+    @cached_property
+    def docs_service(self):
+        """Google Docs API service, or None if it can't be set up.
+
+        Built on first use rather than in __init__: the client libraries take
+        longer to import than most runs spend doing anything else, and the
+        doc stage already runs alongside the feed fetch.
+        """
+        return self._init_google_docs_service()
+
     def _init_google_docs_service(self):
         """Initialize Google Docs API service"""
+        try:
+            from google.oauth2.service_account import Credentials
+            from googleapiclient.discovery import build
+        except ImportError:
+            print("Warning: Google API libraries not installed. Install with: pip install google-api-python-client google-auth")
+            return None
+
         try:
             self.vprint("Initializing Google Docs API...")
             
@@ -102,39 +316,41 @@ class AutomatedTierListUpdater:
                 raise FileNotFoundError(f"No credentials found. Either set GOOGLE_CREDENTIALS environment variable or provide {self.credentials_path}")
             
             # Build the service
-            self.docs_service = build('docs', 'v1', credentials=credentials)
+            docs_service = build('docs', 'v1', credentials=credentials)
             self.vprint("Google Docs API initialized successfully")
+            return docs_service
             
         except Exception as e:
             print(f"Warning: Failed to initialize Google Docs API: {e}")
-            self.docs_service = None
+            return None
     
-    def fetch_rss_episodes(self, max_retries=3):
-        """Fetch and parse RSS feed to get episode titles with automatic retries"""
+    @cached_property
+    def session(self):
+        """HTTP session for feed requests, so a long-running process (--watch)
+        reuses its connection to the feed host."""
+        import requests
+        return requests.Session()
+
+    def fetch_rss_episodes(self, max_retries=3, watermark=None):
+        """Fetch and parse RSS feed to get episode titles with automatic retries.
+
+        The feed is stream-parsed newest first. With a `watermark` (the newest
+        episode seen by the previous run) parsing stops once it reaches that
+        episode, which is included in the result so a successful incremental
+        fetch is never empty.
+        """
         for attempt in range(max_retries):
             try:
                 self.vprint(f"Fetching RSS feed (attempt {attempt + 1}/{max_retries})...")
-                response = requests.get(self.rss_url, timeout=30)
+                response = self.session.get(self.rss_url, timeout=30, stream=True)
                 response.raise_for_status()
-                
-                # Parse XML
-                root = ET.fromstring(response.content)
-                
-                episodes = []
-                items = root.findall('.//item')
-                
-                for item in items:
-                    title_elem = item.find('title')
-                    pub_date_elem = item.find('pubDate')
-                    
-                    if title_elem is not None:
-                        title = title_elem.text.strip()
-                        pub_date = pub_date_elem.text if pub_date_elem is not None else "Unknown"
-                        episodes.append({
-                            'title': title,
-                            'pub_date': pub_date
-                        })
-                
+                response.raw.decode_content = True
+
+                try:
+                    episodes = self._parse_feed(response.raw, watermark)
+                finally:
+                    response.close()
+
                 self.vprint(f"✅ Successfully found {len(episodes)} episodes in RSS feed")
                 return episodes
                 
@@ -146,7 +362,107 @@ class AutomatedTierListUpdater:
                 else:
                     print(f"❌ Error fetching RSS feed after {max_retries} attempts: {e}")
                     return []
-    
+
+    def probe_feed(self, validators=None):
+        """Cheap check for a new episode, for --watch.
+
+        A conditional GET using the ETag/Last-Modified `validators` from the
+        previous probe; a 304 costs no body at all. Otherwise only the first
+        <item> is parsed. Returns (newest episode guid, validators), with a
+        guid of None if the feed is unchanged since `validators`. Raises on
+        network errors.
+        """
+        validators = dict(validators or {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self.session.get(self.rss_url, timeout=30, stream=True, headers=headers)
+        try:
+            if response.status_code == 304:
+                return None, validators
+            response.raise_for_status()
+            response.raw.decode_content = True
+            head = self._parse_feed(response.raw, limit=1)
+        finally:
+            response.close()
+
+        validators = {'etag': response.headers.get('ETag'),
+                      'last_modified': response.headers.get('Last-Modified')}
+        return (head[0]['guid'] if head else ''), validators
+
+    def _parse_feed(self, stream, watermark=None, limit=None):
+        """Read <item>s from an RSS byte stream, stopping at the watermark
+        (or after `limit` items)."""
+        stop_guid = watermark.get('guid') if watermark else None
+        stop_date = self._parse_pub_date(watermark.get('pub_date')) if watermark else None
+
+        episodes = []
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if elem.tag != 'item':
+                continue
+
+            title_elem = elem.find('title')
+            pub_date_elem = elem.find('pubDate')
+            guid_elem = elem.find('guid')
+
+            if title_elem is not None and title_elem.text:
+                title = title_elem.text.strip()
+                pub_date = pub_date_elem.text if pub_date_elem is not None else "Unknown"
+                guid = (guid_elem.text or '').strip() if guid_elem is not None else ''
+                episodes.append({
+                    'title': title,
+                    'pub_date': pub_date,
+                    # Title stands in for feeds that omit GUIDs
+                    'guid': guid or title,
+                })
+
+                # Newest first, so everything past here is already known. The
+                # date check covers a watermark episode that was pulled.
+                if stop_guid and episodes[-1]['guid'] == stop_guid:
+                    break
+                if limit and len(episodes) >= limit:
+                    break
+                published = self._parse_pub_date(pub_date)
+                if stop_date and published and published < stop_date:
+                    break
+
+            elem.clear()
+
+        return episodes
+
+    @staticmethod
+    def _parse_pub_date(pub_date):
+        try:
+            return parsedate_to_datetime(pub_date)
+        except (TypeError, ValueError):
+            return None
+
+    def _extract_game_name(self, title):
+        """Game name for one episode title ('' if nothing is left)."""
+        # Clean up the title to extract game name
+        # Remove common podcast prefixes/suffixes
+        cleaned_title = title
+
+        # Remove episode numbers (e.g., "Episode 1:", "Ep. 2:", etc.)
+        cleaned_title = re.sub(r'^(Episode\s*\d+:?\s*|Ep\.?\s*\d+:?\s*)', '', cleaned_title, flags=re.IGNORECASE)
+
+        # Remove common suffixes
+        cleaned_title = re.sub(r'\s*-\s*(Review|Discussion|Podcast).*$', '', cleaned_title, flags=re.IGNORECASE)
+
+        # Clean up extra whitespace
+        cleaned_title = cleaned_title.strip()
+
+        # Apply registered aliases (aliases.json)
+        tier_name = self.aliases.tier_name(cleaned_title)
+        if tier_name != cleaned_title:
+            self.vprint(f"  Applied name mapping: '{cleaned_title}' -> '{tier_name}'")
+            cleaned_title = tier_name
+
+        return cleaned_title
+
     def extract_game_names_from_episodes(self, episodes):
         """Extract game names from episode titles"""
         game_names = []
@@ -155,24 +471,7 @@ class AutomatedTierListUpdater:
             title = episode['title']
             pub_date = episode['pub_date']
 
-            # Clean up the title to extract game name
-            # Remove common podcast prefixes/suffixes
-            cleaned_title = title
-
-            # Remove episode numbers (e.g., "Episode 1:", "Ep. 2:", etc.)
-            cleaned_title = re.sub(r'^(Episode\s*\d+:?\s*|Ep\.?\s*\d+:?\s*)', '', cleaned_title, flags=re.IGNORECASE)
-
-            # Remove common suffixes
-            cleaned_title = re.sub(r'\s*-\s*(Review|Discussion|Podcast).*$', '', cleaned_title, flags=re.IGNORECASE)
-
-            # Clean up extra whitespace
-            cleaned_title = cleaned_title.strip()
-
-            # Apply hard-coded name mappings
-            if cleaned_title in self.name_mappings:
-                original_title = cleaned_title
-                cleaned_title = self.name_mappings[cleaned_title]
-                self.vprint(f"  Applied name mapping: '{original_title}' -> '{cleaned_title}'")
+            cleaned_title = self._extract_game_name(title)
 
             if cleaned_title:
                 game_names.append(cleaned_title)
@@ -180,16 +479,105 @@ class AutomatedTierListUpdater:
 
         print(f"Extracted {len(game_names)} game names from episodes")
         return game_names
-    
+
+    # ------------------------------------------------------------------
+    # Incremental ingestion: watermark + match ledger
+    # ------------------------------------------------------------------
+
+    def _ledger_fingerprint(self):
+        """Changes whenever an alias does, invalidating the ledger."""
+        payload = json.dumps([self.LEDGER_VERSION, self.aliases.fingerprint], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    def load_ledger(self):
+        """Load the episode/match ledger, or start an empty one if it's
+        missing, unreadable or was written under different rules."""
+        fingerprint = self._ledger_fingerprint()
+        if os.path.exists(self.ledger_path):
+            try:
+                with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                    ledger = json.load(f)
+                if ledger.get('fingerprint') == fingerprint:
+                    self.vprint(f"Loaded ledger: {len(ledger.get('episodes', []))} episodes, "
+                                f"watermark {ledger.get('watermark', {}).get('guid')}")
+                    return ledger
+                print("Episode ledger is from older matching rules; starting fresh")
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable episode ledger: {e}")
+        return {'fingerprint': fingerprint}
+
+    def save_ledger(self, ledger):
+        """Write the ledger atomically, so a killed run can't leave half a file."""
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.ledger_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(ledger, f, indent=2)
+        os.replace(tmp_path, self.ledger_path)
+        self.vprint(f"Saved episode ledger to {self.ledger_path}")
+
+    def ingest_episodes(self, ledger):
+        """Episodes for this run, parsing only the part of the feed that is
+        newer than the ledger's watermark.
+
+        Returns the full episode list (newest first), each with a 'game' key,
+        and records it in `ledger`. Only new episodes, and known ones whose
+        title changed, go through name extraction. Returns [] on fetch failure.
+        """
+        known = {ep['guid']: ep for ep in ledger.get('episodes', [])}
+        head = self.fetch_rss_episodes(watermark=ledger.get('watermark'))
+        if not head:
+            return []
+
+        fresh = 0
+        for episode in head:
+            previous = known.get(episode['guid'])
+            if previous and previous['title'] == episode['title']:
+                episode['game'] = previous['game']
+                continue
+            episode['game'] = self._extract_game_name(episode['title'])
+            fresh += 1
+            if episode['game']:
+                self.vprint(f"  New episode: '{episode['title']}' -> Game: '{episode['game']}' "
+                            f"(Published: {episode['pub_date']})")
+
+        head_guids = {episode['guid'] for episode in head}
+        episodes = head + [ep for ep in ledger.get('episodes', []) if ep['guid'] not in head_guids]
+
+        print(f"Ingested {len(episodes)} episodes ({fresh} new or changed since last run)")
+
+        ledger['watermark'] = {'guid': head[0]['guid'], 'pub_date': head[0]['pub_date']}
+        ledger['episodes'] = episodes
+        return episodes
+
+    # Partial response: the paragraph text runs are all the parser reads, so
+    # skip styles, lists, inline objects and the rest of the document tree.
+    DOC_TEXT_FIELDS = 'revisionId,body/content/paragraph/elements/textRun/content'
+
+    def fetch_doc_revision(self):
+        """The doc's current revisionId (a tiny request), or None."""
+        if not self.docs_service:
+            return None
+        try:
+            document = self.docs_service.documents().get(
+                documentId=self.google_doc_id, fields='revisionId').execute()
+            return document.get('revisionId')
+        except Exception as e:
+            self.vprint(f"Couldn't read the Google Doc revision: {e}")
+            return None
+
     def fetch_google_doc_content(self):
         """Fetch the tier list from Google Doc using API"""
+        self.doc_revision_id = None
+
         # Try Google Docs API first
         if self.docs_service:
             try:
                 self.vprint("Fetching Google Doc content via API...")
                 
                 # Get the document
-                document = self.docs_service.documents().get(documentId=self.google_doc_id).execute()
+                document = self.docs_service.documents().get(
+                    documentId=self.google_doc_id, fields=self.DOC_TEXT_FIELDS).execute()
+                self.doc_revision_id = document.get('revisionId')
                 
                 # Extract text content
                 content = self._extract_text_from_document(document)
@@ -250,51 +638,165 @@ class AutomatedTierListUpdater:
         
         return tiers
     
-    def fuzzy_match_games(self, released_games, tier_list_games):
-        """Use fuzzy matching to correlate released episodes with tier list games"""
+    def _load_doc_cache(self):
+        if os.path.exists(self.doc_cache_path):
+            try:
+                with open(self.doc_cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('document_id') == self.google_doc_id:
+                    return cache
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable tier doc cache: {e}")
+        return {}
+
+    def _save_doc_cache(self, revision_id, tiers):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.doc_cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'document_id': self.google_doc_id,
+                       'revision_id': revision_id,
+                       'tiers': tiers}, f, indent=2)
+        os.replace(tmp_path, self.doc_cache_path)
+
+    def fetch_tier_list(self):
+        """Fetch and parse the doc's tier list, reusing the previous parse
+        when the doc hasn't been edited since. Returns {} on failure.
+
+        An unchanged revisionId means an unchanged doc, so the common
+        no-edit week costs one revisionId-only request. (A changed ID doesn't
+        always mean an edit — Google can reissue IDs — which only costs a
+        refetch.)
+        """
+        cache = self._load_doc_cache()
+        revision_id = self.fetch_doc_revision()
+        if revision_id and cache.get('revision_id') == revision_id and cache.get('tiers'):
+            tiers = cache['tiers']
+            total_games = sum(len(games) for games in tiers.values())
+            print(f"Google Doc unchanged since last run; reusing parsed tier list "
+                  f"({len(tiers)} tiers, {total_games} games)")
+            return tiers
+
+        doc_content = self.fetch_google_doc_content()
+        if not doc_content:
+            print("❌ Failed to fetch tier list content")
+            return {}
+
+        tiers = self.parse_tier_list_from_content(doc_content)
+        if not tiers:
+            print("❌ Failed to parse tier list")
+            return {}
+
+        # Only API fetches have a revision to key on; the local tierlist.txt
+        # fallback is never cached.
+        if self.doc_revision_id:
+            self._save_doc_cache(self.doc_revision_id, tiers)
+        return tiers
+
+    def _score_pairs(self, tier_games, released_games):
+        """Similarity of every (tier game, episode) pair that can reach the
+        match threshold, as {(tier_game, released_game): score}.
+
+        Each episode is normalized once and compared only against tier games
+        it shares a trigram with. real_quick_ratio() and quick_ratio() are
+        cheap upper bounds on ratio(), so most candidates are rejected before
+        the full comparison. The matcher keeps the episode as its second
+        sequence, whose analysis SequenceMatcher caches across comparisons.
+        """
+        edges = {}
+        if not tier_games or not released_games:
+            return edges
+
+        threshold = self.FUZZY_MATCH_THRESHOLD
+        index = _TitleIndex(tier_games)
+        matcher = SequenceMatcher(None)
+        for released_game in released_games:
+            normalized = released_game.lower()
+            matcher.set_seq2(normalized)
+            for i in index.candidates(normalized):
+                matcher.set_seq1(index.normalized[i])
+                if (matcher.real_quick_ratio() < threshold
+                        or matcher.quick_ratio() < threshold):
+                    continue
+                score = matcher.ratio()
+                if score >= threshold:
+                    edges[(index.titles[i], released_game)] = score
+        return edges
+
+    def fuzzy_match_games(self, released_games, tier_list_games, ledger=None):
+        """Use fuzzy matching to correlate released episodes with tier list games
+
+        Exact matches are taken first: names equal ignoring case and
+        punctuation, or registered as the same game in aliases.json. The remaining tier
+        games and episodes are paired one-to-one: among all pairs scoring at
+        least FUZZY_MATCH_THRESHOLD, the assignment with the highest total
+        similarity wins, so two doc entries can never claim the same episode.
+
+        With a `ledger` from a previous run, only pairs involving a new doc
+        entry or a new episode are scored; earlier candidate pairs are
+        replayed from the ledger. The ledger is then updated in place.
+        """
         matched_games = set()
         match_details = []
-
-        def similarity(a, b):
-            return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        tier_list_games = list(dict.fromkeys(tier_list_games))
+        released_games = list(dict.fromkeys(released_games))
 
         # First pass: find all exact matches (1.0 similarity)
-        # This prevents fuzzy matches from stealing exact matches
+        # This prevents fuzzy matches from stealing exact matches.
+        # Keyed on the alias registry's normalized names, so this is a dict
+        # lookup rather than a SequenceMatcher per pair.
         exact_matched_released = set()
+        released_by_key = {}
+        for released_game in released_games:
+            released_by_key.setdefault(self.aliases.key(released_game), released_game)
 
         for tier_game in tier_list_games:
-            for released_game in released_games:
-                if similarity(tier_game, released_game) == 1.0:
-                    exact_matched_released.add(released_game)
-                    matched_games.add(tier_game)
-                    match_details.append({
-                        'tier_game': tier_game,
-                        'episode_title': released_game,
-                        'similarity': 1.0
-                    })
-                    self.vprint(f"  ✓ Exact match: '{tier_game}' with '{released_game}'")
-                    break  # Stop looking for this tier_game
+            released_game = released_by_key.get(self.aliases.key(tier_game))
+            if released_game is not None and released_game not in exact_matched_released:
+                exact_matched_released.add(released_game)
+                matched_games.add(tier_game)
+                match_details.append({
+                    'tier_game': tier_game,
+                    'episode_title': released_game,
+                    'similarity': 1.0
+                })
+                self.vprint(f"  ✓ Exact match: '{tier_game}' with '{released_game}'")
 
         # Second pass: fuzzy match remaining games
         # But only match to released games that weren't exactly matched
         unmatched_tier_games = [g for g in tier_list_games if g not in matched_games]
+        available = [g for g in released_games if g not in exact_matched_released]
 
-        for tier_game in unmatched_tier_games:
-            best_match = None
-            best_score = 0.0
+        # What the previous run already scored. Its ledger holds every pair
+        # that cleared the threshold among the names it saw, so only pairs with
+        # a new name on at least one side need scoring now.
+        seen_tier = set(ledger.get('tier_games', [])) if ledger else set()
+        seen_released = set(ledger.get('released_games', [])) if ledger else set()
+        previous_exact = set(ledger.get('exact_episodes', [])) if ledger else set()
+        for m in (ledger.get('matches', []) if ledger else []):
+            if m['episode_title'] in previous_exact:
+                # Never fuzzy-scored, so it has no candidate pairs to replay
+                seen_tier.discard(m['tier_game'])
 
-            for released_game in released_games:
-                # Skip released games that had exact matches
-                if released_game in exact_matched_released:
-                    continue
+        # New episodes, plus ones an exact match no longer claims
+        fresh_released = [g for g in available
+                          if g not in seen_released or g in previous_exact]
+        old_tier = [g for g in unmatched_tier_games if g in seen_tier]
+        new_tier = [g for g in unmatched_tier_games if g not in seen_tier]
 
-                score = similarity(tier_game, released_game)
-                if score > best_score:
-                    best_score = score
-                    best_match = released_game
+        edges = {}
+        in_play_tier, in_play_released = set(old_tier), set(available)
+        for tier_game, released_game, score in (ledger.get('edges', []) if ledger else []):
+            if tier_game in in_play_tier and released_game in in_play_released:
+                edges[(tier_game, released_game)] = score
+        edges.update(self._score_pairs(new_tier, available))
+        edges.update(self._score_pairs(old_tier, fresh_released))
 
-            # Consider it a match if similarity is high enough
-            if best_score >= 0.6:  # 60% similarity threshold
+        assignment = _max_weight_assignment(edges)
+
+        for tier_game in unmatched_tier_games:
+            best_match = assignment.get(tier_game)
+            if best_match is not None:
+                best_score = edges[(tier_game, best_match)]
                 matched_games.add(tier_game)
                 match_details.append({
                     'tier_game': tier_game,
@@ -303,12 +805,28 @@ class AutomatedTierListUpdater:
                 })
                 self.vprint(f"  ✓ Fuzzy matched '{tier_game}' with '{best_match}' (similarity: {best_score:.2f})")
             else:
-                self.vprint(f"  ✗ No good match for '{tier_game}' (best: '{best_match}' at {best_score:.2f})")
+                contenders = [(score, released) for (tier, released), score in edges.items()
+                              if tier == tier_game]
+                if contenders:
+                    score, released = max(contenders)
+                    self.vprint(f"  ✗ No good match for '{tier_game}' ('{released}' at {score:.2f} "
+                                f"went to a closer doc entry)")
+                else:
+                    self.vprint(f"  ✗ No good match for '{tier_game}'")
+
+        if ledger is not None:
+            self.vprint(f"  {len(edges)} candidate pairs, "
+                        f"{len(new_tier)} new doc entries, {len(fresh_released)} new episodes")
+            ledger['tier_games'] = tier_list_games
+            ledger['released_games'] = released_games
+            ledger['exact_episodes'] = sorted(exact_matched_released)
+            ledger['edges'] = sorted([t, r, score] for (t, r), score in edges.items())
+            ledger['matches'] = match_details
 
         print(f"Matched {len(matched_games)} games from tier list with released episodes")
         return matched_games, match_details
     
-    def filter_tier_list(self, full_tier_list, released_games):
+    def filter_tier_list(self, full_tier_list, released_games, ledger=None):
         """Filter tier list to only include games that have been released"""
         # Get all games from the tier list
         all_tier_games = []
@@ -316,7 +834,7 @@ class AutomatedTierListUpdater:
             all_tier_games.extend(games)
         
         # Find matches between released episodes and tier list games
-        matched_games, match_details = self.fuzzy_match_games(released_games, all_tier_games)
+        matched_games, match_details = self.fuzzy_match_games(released_games, all_tier_games, ledger)
         
         # Filter the tier list
         filtered_tiers = {}
@@ -361,7 +879,7 @@ class AutomatedTierListUpdater:
         for game in unplaced:
             print(f"  - {game}")
         print("  Add them to an 'X Tier:' line in the Google Doc, or add a")
-        print("  name_mappings entry if the title just doesn't match.")
+        print("  scripts/aliases.json entry if the title just doesn't match.")
 
         # Surfaces on the run's page, so a missed game is visible without
         # reading the log.
@@ -384,63 +902,330 @@ class AutomatedTierListUpdater:
         
         print(f"Debug information saved to {output_dir}/ directory")
     
-    def update_tier_list(self, output_path="../public/tierlist.png", save_debug=False):
-        """Main method to update the tier list"""
-        print("🚀 Starting automated tier list update...")
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
+    def _released_games_stage(self, ledger):
+        """Steps 1-2: released game names from the feed, or None."""
         # Step 1: Fetch RSS episodes
-        episodes = self.fetch_rss_episodes()
+        if ledger is not None:
+            episodes = self.ingest_episodes(ledger)
+        else:
+            episodes = self.fetch_rss_episodes()
         if not episodes:
             print("❌ Failed to fetch episodes from RSS feed")
-            return False
-        
+            return None
+
         # Step 2: Extract game names from episodes
-        released_games = self.extract_game_names_from_episodes(episodes)
+        if ledger is not None:
+            released_games = [episode['game'] for episode in episodes if episode['game']]
+        else:
+            released_games = self.extract_game_names_from_episodes(episodes)
         if not released_games:
             print("❌ No game names extracted from episodes")
-            return False
-        
-        # Step 3: Fetch current tier list from Google Doc
-        doc_content = self.fetch_google_doc_content()
-        if not doc_content:
-            print("❌ Failed to fetch tier list content")
-            return False
-        
-        # Step 4: Parse tier list
-        full_tier_list = self.parse_tier_list_from_content(doc_content)
-        if not full_tier_list:
-            print("❌ Failed to parse tier list")
-            return False
-        
-        # Step 5: Filter tier list to only released games
-        filtered_tier_list, match_details = self.filter_tier_list(full_tier_list, released_games)
+            return None
+        return released_games
+
+    def _match_stage(self, released_games, full_tier_list, ledger):
+        """Step 5: (filtered tier list, match details), or None."""
+        filtered_tier_list, match_details = self.filter_tier_list(
+            full_tier_list, released_games, ledger)
         if not filtered_tier_list:
             print("❌ No games matched between episodes and tier list")
+            return None
+        return filtered_tier_list, match_details
+
+    def update_tier_list(self, output_path="../public/tierlist.png", save_debug=False,
+                         incremental=False, skip_unchanged=False, deadline=None):
+        """Main method to update the tier list
+
+        The steps run as a small dependency graph: the RSS feed and the Google
+        Doc are fetched concurrently, and Steam art for every doc game is
+        prefetched while episodes are matched. Rendering waits for both.
+
+        `incremental` reads only the new part of the feed and replays earlier
+        matches from the ledger in .cache/ (see ingest_episodes).
+
+        `skip_unchanged` skips the render when the output already shows the
+        same games and art (per the render manifest --dry-run uses).
+
+        `deadline` (seconds) bounds the run's Steam traffic: once it has
+        passed, or Steam keeps failing, the remaining tiles are drawn from
+        cached art (see http_guard.py) and reported as degraded. The render
+        is recorded as degraded too, so the next run re-renders and
+        backfills them even if nothing else changed.
+
+        Afterwards `last_output_changed` says whether the image was written,
+        `last_timings` holds the per-stage times and `last_degraded_tiles`
+        the tiles drawn without Steam.
+        """
+        print("🚀 Starting automated tier list update...")
+        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        started = time.perf_counter()
+        self.generator.net.begin(deadline)
+
+        ledger = self.load_ledger() if incremental else None
+
+        def steam(doc):
+            # Every doc game, released or not. Art for games that turn out to
+            # be unreleased stays staged outside steam_images/.
+            doc_games = [game for games in doc.values() for game in games]
+            return self.generator.prefetch_tile_art(doc_games)
+
+        def match(feed, doc):
+            result = self._match_stage(feed, doc, ledger)
+            if result is not None and ledger is not None:
+                self.save_ledger(ledger)
+            return result
+
+        def render(feed, match, steam):
+            filtered_tier_list, match_details = match
+
+            # Step 6: Save debug info if requested
+            if save_debug:
+                self.save_debug_info(feed, match_details)
+
+            if skip_unchanged and os.path.exists(output_path):
+                recorded = self._load_render_manifest().get(os.path.abspath(output_path))
+                if recorded == self.generator.render_signature(filtered_tier_list):
+                    print(f"✅ {output_path} already up to date; not re-rendering")
+                    return 'unchanged'
+
+            # Step 7: Generate tier list image
+            print("\n🎨 Generating tier list image...")
+            try:
+                # Ensure output directory exists
+                output_dir = os.path.dirname(output_path)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+
+                # Generate the tier list
+                self.generator.generate_tier_list(filtered_tier_list, output_path)
+                self._record_render(output_path, self.generator.last_render_signature)
+
+                print(f"✅ Tier list successfully saved to {output_path}")
+                self.report_degraded(self.generator.degraded_tiles)
+                return 'rendered'
+
+            except Exception as e:
+                print(f"❌ Error generating tier list: {e}")
+                return None
+
+        results, timings = _run_stages([
+            ('feed', (), lambda: self._released_games_stage(ledger)),
+            ('doc', (), lambda: self.fetch_tier_list() or None),
+            ('steam', ('doc',), steam),
+            ('match', ('feed', 'doc'), match),
+            ('render', ('feed', 'match', 'steam'), render),
+        ])
+        self.report_timings(timings, time.perf_counter() - started)
+        self.last_timings = timings
+        self.last_output_changed = results.get('render') == 'rendered'
+        self.last_degraded_tiles = (dict(self.generator.degraded_tiles)
+                                    if self.last_output_changed else {})
+        return 'render' in results
+
+    def report_degraded(self, degraded_tiles):
+        """Print the tiles drawn from cached art only, and why Steam wasn't asked."""
+        if not degraded_tiles:
+            return
+        reason = self.generator.net.snapshot()['reason'] or "Steam requests failed"
+        print(f"\n⚠️  {len(degraded_tiles)} tiles drawn from cached art only ({reason}); "
+              f"the next run backfills them:")
+        for game, kind in degraded_tiles.items():
+            print(f"  - {game} ({'header art' if kind == 'fallback' else 'placeholder'})")
+        if os.environ.get('GITHUB_ACTIONS'):
+            print(f"::warning::Degraded tiles ({reason}): {', '.join(degraded_tiles)}")
+
+    # ------------------------------------------------------------------
+    # Dry run: plan a run without Steam traffic or image decoding
+    # ------------------------------------------------------------------
+
+    def _load_render_manifest(self):
+        path = os.path.join(self.state_dir, "render_manifest.json")
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _record_render(self, output_path, signature):
+        """Remember what an output was rendered from, for --dry-run to diff."""
+        if signature is None:
+            return
+        manifest = self._load_render_manifest()
+        manifest[os.path.abspath(output_path)] = signature
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = os.path.join(self.state_dir, "render_manifest.json")
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def plan_update(self, output_path="../public/tierlist.png", save_debug=True,
+                    incremental=False):
+        """Dry run: do the cheap steps (feed, doc, matching), then report what
+        rendering would cost and whether the output would change — with no
+        Steam traffic and no image decoding. Nothing is rendered, and the episode
+        ledger isn't advanced. Fails exactly when update_tier_list would fail
+        before rendering.
+        """
+        print("🚀 Planning tier list update (dry run)...")
+        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        started = time.perf_counter()
+
+        ledger = self.load_ledger() if incremental else None
+        results, timings = _run_stages([
+            ('feed', (), lambda: self._released_games_stage(ledger)),
+            ('doc', (), lambda: self.fetch_tier_list() or None),
+            ('match', ('feed', 'doc'), lambda feed, doc: self._match_stage(feed, doc, ledger)),
+        ])
+        if 'match' not in results:
+            self.report_timings(timings, time.perf_counter() - started)
             return False
-        
-        # Step 6: Save debug info if requested
+
+        filtered_tier_list, match_details = results['match']
         if save_debug:
-            self.save_debug_info(released_games, match_details)
-        
-        # Step 7: Generate tier list image
-        print("\n🎨 Generating tier list image...")
-        try:
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-            
-            # Generate the tier list
-            self.generator.generate_tier_list(filtered_tier_list, output_path)
-            
-            print(f"✅ Tier list successfully saved to {output_path}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error generating tier list: {e}")
+            self.save_debug_info(results['feed'], match_details)
+
+        self.print_render_plan(filtered_tier_list, output_path)
+        self.report_timings(timings, time.perf_counter() - started)
+        return True
+
+    def print_render_plan(self, tiers, output_path):
+        generator = self.generator
+        tile_size = (generator.TILE_WIDTH, (generator.TILE_WIDTH * 3) // 2)
+        games = [game for tier in ['S', 'A', 'B', 'C', 'D', 'E', 'F']
+                 for game in tiers.get(tier, [])]
+
+        plans = {}
+        for game in games:
+            plans.setdefault(generator.plan_tile(game, tile_size), []).append(game)
+
+        labels = [
+            ('warm', "cache hits (pre-scaled tile ready)"),
+            ('resize', "capsule cached, tile needs re-rendering"),
+            ('staged', "prefetched, promoted and re-rendered on render"),
+            ('probe', "app ID known, needs capsule probes + download"),
+            ('search', "need a Steam search, probes + download"),
+            ('unmatched', "searched recently with no match, placeholder"),
+        ]
+        print(f"\n🧪 Render plan for {len(games)} tiles (no Steam traffic, no image decoding):")
+        for plan, label in labels:
+            names = plans.get(plan, [])
+            if plan == 'warm' or not names:
+                print(f"  {len(names):3d} {label}")
+            else:
+                print(f"  {len(names):3d} {label}: {', '.join(names)}")
+
+        requests_, downloads, resizes = (
+            sum(generator.TILE_PLAN_COST[plan][i] * len(names) for plan, names in plans.items())
+            for i in range(3))
+        print(f"  Predicted cost: up to {requests_} Steam requests, "
+              f"{downloads} image downloads, {resizes} tile resizes")
+
+        previous = self._load_render_manifest().get(os.path.abspath(output_path))
+        planned = generator.render_signature(tiers)
+        if not os.path.exists(output_path):
+            verdict = "would be created"
+        elif previous is None:
+            verdict = "unknown (no record of the last render)"
+        elif previous == planned:
+            verdict = "unchanged"
+        else:
+            verdict = "would change: " + self._describe_render_changes(previous, planned)
+        print(f"  Output {output_path}: {verdict}")
+
+    @staticmethod
+    def _describe_render_changes(previous, planned):
+        changes = []
+        old_tier = {g: t for t, games in previous['tiers'].items() for g in games}
+        new_tier = {g: t for t, games in planned['tiers'].items() for g in games}
+        for game, tier in new_tier.items():
+            if game not in old_tier:
+                changes.append(f"+{game} ({tier})")
+            elif old_tier[game] != tier:
+                changes.append(f"{game} {old_tier[game]}→{tier}")
+        changes.extend(f"-{game}" for game in old_tier if game not in new_tier)
+        changes.extend(f"new art for {game}" for game in new_tier
+                       if game in old_tier and planned['tiles'].get(game) != previous['tiles'].get(game))
+        changes.extend(f"backfill {game}" for game in previous.get('degraded', [])
+                       if game in new_tier)
+        if previous['layout'] != planned['layout']:
+            changes.append("layout")
+        if not changes:
+            changes.append("tile order")
+        return ', '.join(changes)
+
+    def warm_cache(self):
+        """Prefetch tile art for every game in the doc, released or not.
+
+        Meant to run ahead of release day (after a game is added to the doc),
+        so the weekly run finds the new game's capsule, pre-scaled tile or
+        fallback art already on disk instead of resolving it on the critical
+        path. Returns False only if the doc can't be read.
+        """
+        print("🔥 Warming Steam art for every game in the doc...")
+        started = time.perf_counter()
+
+        full_tier_list = self.fetch_tier_list()
+        if not full_tier_list:
             return False
 
+        doc_games = list(dict.fromkeys(game for games in full_tier_list.values() for game in games))
+        failed = self.generator.warm_tile_cache(doc_games)
+
+        print(f"Art ready for {len(doc_games) - len(failed)}/{len(doc_games)} doc games "
+              f"in {time.perf_counter() - started:.1f}s")
+        if failed:
+            print("\n⚠️  No Steam art found for (these would render as placeholders):")
+            for game in failed:
+                print(f"  - {game}")
+            print("  Pin their steam_app_id in scripts/aliases.json if the")
+            print("  search name is unusual.")
+            if os.environ.get('GITHUB_ACTIONS'):
+                print(f"::warning::No Steam art for: {', '.join(failed)}")
+        return True
+
+    def rescore_search(self):
+        """Re-score every cached Steam search (.cache/storesearch.json) with
+        the current matching rules, offline, and print the names whose answer
+        would change. Cached app IDs aren't touched: a name that used to
+        match keeps its ID (and art) until it's removed from game_ids.json."""
+        results = self.generator.rescore_search_cache()
+        if not results:
+            print("No cached Steam searches to re-score (.cache/storesearch.json)")
+            return True
+
+        changed = [r for r in results if r['app_id'] != r['cached']]
+        print(f"🔁 Re-scored {len(results)} cached Steam searches: "
+              f"{len(results) - len(changed)} unchanged, {len(changed)} would change")
+        for r in changed:
+            now = (f"'{r['name']}' ({r['app_id']}, score {r['score']:.2f})" if r['app_id']
+                   else f"no match (best '{r['name']}' at {r['score']:.2f})" if r['name']
+                   else "no match (no results)")
+            if r['cached'] is None:
+                print(f"  + {r['term']}: unmatched -> {now}; picked up on the next run")
+            else:
+                print(f"  ~ {r['term']}: cached {r['cached']} -> {now}; remove it from "
+                      f"steam_images/game_ids.json (and its art) to apply")
+        return True
+
+    def report_timings(self, timings, wall_time):
+        """Print per-stage and end-to-end wall time."""
+        stages = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+        print(f"\n⏱️  Stages: {stages}")
+        print(f"⏱️  Wall time: {wall_time:.2f}s "
+              f"(stages add up to {sum(timings.values()):.2f}s)")
+        tiles = self.generator.tiles.stats()
+        print(f"🧠 {run_cache.format_process_stats()}; tile pool {tiles['entries']} tiles, "
+              f"{tiles['bytes'] / 1024 / 1024:.1f}MB of {tiles['budget_bytes'] / 1024 / 1024:.0f}MB "
+              f"({tiles['evictions']} evicted)")
+        net = self.generator.net.snapshot()
+        if net['failures'] or net['refused']:
+            tripped = [host for host, state in net['hosts'].items() if state['trips']]
+            print(f"🌐 Steam: {net['requests']} requests, {net['failures']} failed, "
+                  f"{net['refused']} refused"
+                  + (f"; circuit tripped for {', '.join(tripped)}" if tripped else ""))
+
 
 def main():
     parser = argparse.ArgumentParser(description='Automatically update tier list from RSS feed and Google Doc')
@@ -451,24 +1236,88 @@ def main():
     parser.add_argument('--debug', action='store_true',
                       help='Save debug information to debug/ directory')
     parser.add_argument('--dry-run', action='store_true',
-                      help='Run without generating the final image (for testing)')
+                      help='Plan the run without generating the image: match episodes, then report '
+                           'tile cache hits, predicted Steam work and whether the output would '
+                           'change. No Steam traffic or image decoding; always saves debug info')
     parser.add_argument('--credentials', default='credentials.json',
                       help='Path to Google API credentials JSON file (default: credentials.json)')
+    parser.add_argument('--warm-cache', action='store_true',
+                      help='Only prefetch Steam art and pre-scaled tiles for every game in the '
+                           'doc (released or not), then exit; no tier list is rendered')
+    parser.add_argument('--rescore-search', action='store_true',
+                      help='Re-score every cached Steam search with the current matching rules '
+                           'and report what would change, then exit; no network')
+    parser.add_argument('--incremental', action='store_true',
+                      help='Only ingest episodes newer than the last run, reusing earlier '
+                           'matches from .cache/episode_ledger.json')
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                      help='Stop contacting Steam this many seconds into the run and draw the '
+                           'remaining tiles from cached art, reporting them (default: no deadline)')
+    parser.add_argument('--watch', action='store_true',
+                      help='Keep running: poll the feed and doc revision and update incrementally '
+                           'whenever either changes (see tierlist_watch.py)')
+    parser.add_argument('--poll-interval', type=float, default=60,
+                      help='--watch: seconds between polls after a change (default: 60)')
+    parser.add_argument('--max-interval', type=float, default=1800,
+                      help='--watch: longest gap between polls when nothing changes (default: 1800)')
+    parser.add_argument('--health-port', type=int, default=8787,
+                      help='--watch: local port for /healthz and /metrics; 0 disables (default: 8787)')
+    parser.add_argument('--on-update', metavar='COMMAND',
+                      help='--watch: shell command to run after the image changes (e.g. commit and push)')
     
     args = parser.parse_args()
     
     # Create updater
     updater = AutomatedTierListUpdater(verbose=args.verbose, credentials_path=args.credentials)
+
+    if args.watch:
+        import signal
+        from tierlist_watch import TierListWatcher
+
+        watcher = TierListWatcher(updater, output_path=args.output,
+                                  min_interval=args.poll_interval,
+                                  max_interval=args.max_interval,
+                                  on_update=args.on_update,
+                                  deadline=args.deadline)
+        if args.health_port:
+            watcher.serve(args.health_port)
+            print(f"🩺 Health and metrics on http://127.0.0.1:{args.health_port}/healthz, /metrics")
+        signal.signal(signal.SIGTERM, lambda signum, frame: watcher.stop())
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        print("\n👋 Stopped watching")
+        sys.exit(0)
+
+    if args.rescore_search:
+        sys.exit(0 if updater.rescore_search() else 1)
+
+    if args.warm_cache:
+        if updater.warm_cache():
+            print("\n🎉 Cache warm-up completed!")
+            sys.exit(0)
+        print("\n💥 Cache warm-up failed!")
+        sys.exit(1)
     
     if args.dry_run:
         print("🧪 DRY RUN MODE - Will not generate final image")
-        # Implement dry run logic here if needed
-        args.debug = True  # Always save debug info in dry run
+        success = updater.plan_update(
+            output_path=args.output,
+            incremental=args.incremental
+        )
+        if success:
+            print("\n🎉 Dry run completed successfully!")
+            sys.exit(0)
+        print("\n💥 Dry run failed!")
+        sys.exit(1)
     
     # Run the update
     success = updater.update_tier_list(
         output_path=args.output,
-        save_debug=args.debug
+        save_debug=args.debug,
+        incremental=args.incremental,
+        deadline=args.deadline
     )
     
     if success:
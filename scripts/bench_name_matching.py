@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Accuracy and speed of the name matching, on a golden corpus of our own
+names (matching_corpus.json).
+
+Two matchers, each scored at TierListGenerator.MIN_MATCH_SCORE and at the
+updater's FUZZY_MATCH_THRESHOLD (0.6):
+
+- Steam search: which storesearch result each tier list name resolves to
+  (TierListGenerator.best_candidate over recorded responses, so offline)
+- episodes: which feed title each doc name is matched to
+  (AutomatedTierListUpdater.fuzzy_match_games, aliases.json included)
+
+and for each reports precision (matches that were right), recall (games with
+an answer that got it), the wrong-match rate (names given a wrong answer,
+of all names) and throughput.
+
+The checks hold each matcher, at the threshold it actually uses, to what it
+gets right today: any wrong match or miss not in KNOWN_WRONG / KNOWN_MISSED
+fails. A wrong match is the expensive mistake — the wrong art rendered and
+cached, or an episode credited to the wrong game. When a change fixes a known
+failure, the run says so; take it out of the list.
+
+Only storesearch responses fetched live ("recorded" set in the corpus) are
+gated on. A hand-seeded response measures the scorer against a guess at what
+Steam returns, so the Steam half is scored but flagged, not gated, until
+--record has been run. Run with:
+
+    cd scripts && python3 bench_name_matching.py [--record]
+
+--record re-fetches every storesearch response live and writes them back to
+the corpus; the expected answers are left alone.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from datetime import date
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aliases  # noqa: E402
+from automated_tierlist_updater import AutomatedTierListUpdater  # noqa: E402
+from tier_list_generator import TierListGenerator  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "matching_corpus.json")
+# What each matcher gets wrong on the corpus today, at the threshold it uses
+KNOWN_WRONG = {
+    "steam": set(),
+    "episodes": set(),
+}
+KNOWN_MISSED = {
+    "steam": set(),
+    "episodes": set(),
+}
+# Time each matcher for at least this long
+MIN_SECONDS = 0.5
+
+
+def load_corpus(path=CORPUS):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def make_generator():
+    # Scoring only: no caches, no network
+    generator = TierListGenerator.__new__(TierListGenerator)
+    generator.verbose = False
+    return generator
+
+
+def make_updater():
+    # Matching only: no Google client, no generator, no ledger
+    updater = AutomatedTierListUpdater.__new__(AutomatedTierListUpdater)
+    updater.verbose = False
+    updater.aliases = aliases.registry()
+    return updater
+
+
+def score(answers, expected):
+    """Precision, recall and wrong-match rate of {name: answer} against
+    {name: expected answer or None}, with the names that went wrong."""
+    right = [name for name, answer in answers.items()
+             if answer is not None and answer == expected[name]]
+    wrong = [name for name, answer in answers.items()
+             if answer is not None and answer != expected[name]]
+    missed = [name for name, answer in answers.items()
+              if answer is None and expected[name] is not None]
+    answered = len(right) + len(wrong)
+    positives = sum(1 for answer in expected.values() if answer is not None)
+    return {
+        "precision": len(right) / answered if answered else 1.0,
+        "recall": len(right) / positives if positives else 1.0,
+        "wrong_rate": len(wrong) / len(answers) if answers else 0.0,
+        "wrong": wrong,
+        "missed": missed,
+    }
+
+
+def unrecorded(corpus):
+    """Steam queries whose response was seeded by hand, not fetched live."""
+    return {case["query"] for case in corpus["steam"] if not case.get("recorded")}
+
+
+def steam_answers(generator, cases, threshold):
+    """{query: app ID it resolves to, or None below `threshold`}"""
+    answers = {}
+    for case in cases:
+        item, best = generator.best_candidate(case["query"], case["response"]["items"])
+        answers[case["query"]] = item["id"] if item and best >= threshold else None
+    return answers
+
+
+def episode_answers(updater, corpus, threshold):
+    """{doc name: episode title it's matched to, or None}"""
+    updater.FUZZY_MATCH_THRESHOLD = threshold
+    names = [entry["name"] for entry in corpus["doc"]]
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, details = updater.fuzzy_match_games(corpus["titles"], names)
+    answers = dict.fromkeys(names)
+    answers.update({m["tier_game"]: m["episode_title"] for m in details})
+    return answers
+
+
+def throughput(run, per_run):
+    """Names matched per second by run(), which matches `per_run` names."""
+    runs, started = 0, time.perf_counter()
+    while True:
+        run()
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_SECONDS:
+            return runs * per_run / elapsed
+
+
+def evaluate(corpus):
+    """{matcher: {"production": threshold, "thresholds": {threshold: score()},
+    "per_sec": names matched per second}}"""
+    generator, updater = make_generator(), make_updater()
+    thresholds = sorted({TierListGenerator.MIN_MATCH_SCORE,
+                         AutomatedTierListUpdater.FUZZY_MATCH_THRESHOLD})
+    cases, episodes = corpus["steam"], corpus["episodes"]
+    steam_expected = {case["query"]: case["expected"] for case in cases}
+    episode_expected = {entry["name"]: entry["episode"] for entry in episodes["doc"]}
+
+    production = AutomatedTierListUpdater.FUZZY_MATCH_THRESHOLD
+    return {
+        "steam": {
+            "production": TierListGenerator.MIN_MATCH_SCORE,
+            "thresholds": {t: score(steam_answers(generator, cases, t), steam_expected)
+                           for t in thresholds},
+            "per_sec": throughput(
+                lambda: steam_answers(generator, cases, TierListGenerator.MIN_MATCH_SCORE),
+                len(cases)),
+        },
+        "episodes": {
+            "production": production,
+            "thresholds": {t: score(episode_answers(updater, episodes, t), episode_expected)
+                           for t in thresholds},
+            "per_sec": throughput(lambda: episode_answers(updater, episodes, production),
+                                  len(episodes["doc"])),
+        },
+    }
+
+
+def record(path=CORPUS):
+    """Replace every recorded storesearch response with a live one."""
+    import requests
+    corpus = load_corpus(path)
+    for case in corpus["steam"]:
+        url = (f"https://store.steampowered.com/api/storesearch/"
+               f"?term={quote(case['query'])}&l=english&cc=US")
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        case["response"] = {
+            "total": data.get("total", 0),
+            "items": [{key: item.get(key) for key in ("type", "name", "id")}
+                      for item in data.get("items", [])],
+        }
+        case["recorded"] = date.today().isoformat()
+        print(f"  {case['query']}: {len(case['response']['items'])} results")
+        time.sleep(0.5)  # storesearch rate-limits bursts
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(corpus, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+    print(f"Recorded {len(corpus['steam'])} responses to {os.path.basename(path)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark name matching on the golden corpus")
+    parser.add_argument("--record", action="store_true",
+                        help="re-fetch the storesearch responses live first")
+    args = parser.parse_args(argv)
+    if args.record:
+        record()
+
+    corpus = load_corpus()
+    results = evaluate(corpus)
+    sizes = {"steam": len(corpus["steam"]), "episodes": len(corpus["episodes"]["doc"])}
+
+    # Only live responses are held to KNOWN_*; names in here are reported, not gated
+    ungated = {"steam": unrecorded(corpus), "episodes": set()}
+
+    ok = True
+    for matcher, result in results.items():
+        print(f"{matcher} ({sizes[matcher]} names, {result['per_sec']:,.0f} matches/sec):")
+        for threshold, metrics in result["thresholds"].items():
+            marker = "  <- in use" if threshold == result["production"] else ""
+            print(f"  at {threshold:.2f}: precision {metrics['precision']:.1%}, "
+                  f"recall {metrics['recall']:.1%}, "
+                  f"wrong matches {metrics['wrong_rate']:.1%}{marker}")
+            for name in metrics["wrong"]:
+                print(f"    ✗ wrong: {name}")
+            for name in metrics["missed"]:
+                print(f"    · missed: {name}")
+
+        if ungated[matcher]:
+            print(f"⚠️  {matcher}: {len(ungated[matcher])} of {sizes[matcher]} responses are "
+                  f"hand-seeded, not recorded; not gated on them until "
+                  f"`bench_name_matching.py --record` has been run")
+
+        in_use = result["thresholds"][result["production"]]
+        for kind, known in (("wrong", KNOWN_WRONG[matcher]), ("missed", KNOWN_MISSED[matcher])):
+            seen = set(in_use[kind]) - ungated[matcher]
+            new = sorted(seen - known)
+            fixed = sorted(known - seen)
+            if new:
+                print(f"❌ {matcher}: newly {kind} at the threshold in use: {', '.join(new)}")
+                ok = False
+            if fixed:
+                print(f"🎉 {matcher}: no longer {kind}: {', '.join(fixed)} "
+                      f"— take them out of KNOWN_{kind.upper()}")
+
+    if ok:
+        print("\nAll checks passed ✅")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
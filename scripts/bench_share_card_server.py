@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Request latency for the on-demand share card service, against its p95
+targets.
+
+Serves the first few episodes' cards (from public/episodes.json and
+public/episode-art/) over HTTP on a free local port, with a throwaway disk
+cache and build manifest so nothing counts as already built:
+
+- cold: each card's first request, which renders it
+- disk: the same cards from a new server sharing the disk cache
+- memory: repeated requests, answered from the in-memory LRU
+- burst: CONCURRENCY clients asking for the same unbuilt cards at once, which
+  should render each card once
+
+Nothing in public/ is written. Run with:
+
+    cd scripts && python3 bench_share_card_server.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import build_manifest  # noqa: E402
+import export_share_cards as cards  # noqa: E402
+import run_cache  # noqa: E402
+from request_cache import percentile
+from share_card_server import ShareCardServer  # noqa: E402
+
+CARDS = 8
+MEMORY_REQUESTS = 200
+CONCURRENCY = 8
+# p95 targets, per request. A cold card is one render plus a JPEG encode
+# (~150ms here); a link preview fetcher typically gives up after a few seconds.
+P95_TARGET_MS = {"cold": 600.0, "disk": 25.0, "memory": 10.0, "burst": 1500.0}
+
+
+def fetch(base, slug):
+    started = time.perf_counter()
+    with urllib.request.urlopen(f"{base}/episode-share/{slug}.jpg") as response:
+        response.read()
+    return (time.perf_counter() - started) * 1000
+
+
+def serve(cache_dir):
+    service = ShareCardServer(cache_dir=cache_dir)
+    server = service.serve(0)
+    return service, server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    data = run_cache.shared().json(cards.EPISODES_JSON)
+    slugs = [episode["slug"] for episode in data.get("episodes", [])
+             if os.path.exists(cards.art_path(episode))][:CARDS * 2 + 1]
+    if len(slugs) < 3:
+        print("No episode art in public/episode-art/ — run export_episode_art.py first")
+        return 1
+    warmup, slugs = slugs[0], slugs[1:]
+    slugs, burst_slugs = slugs[:CARDS], slugs[CARDS:] or slugs[-1:]
+
+    build_manifest.MANIFEST_PATH = os.path.join(tempfile.mkdtemp(), "build_manifest.json")
+    cache_dir = tempfile.mkdtemp()
+    latencies = {}
+
+    service, server, base = serve(cache_dir)
+    try:
+        fetch(base, warmup)  # fonts, the mark and the glyph masks warm
+        latencies["cold"] = [fetch(base, slug) for slug in slugs]
+        latencies["memory"] = [fetch(base, slugs[i % len(slugs)]) for i in range(MEMORY_REQUESTS)]
+    finally:
+        server.shutdown()
+
+    service, server, base = serve(cache_dir)
+    try:
+        latencies["disk"] = [fetch(base, slug) for slug in slugs]
+
+        burst = []
+        lock = threading.Lock()
+
+        def client():
+            for slug in burst_slugs:
+                elapsed = fetch(base, slug)
+                with lock:
+                    burst.append(elapsed)
+
+        threads = [threading.Thread(target=client) for _ in range(CONCURRENCY)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        latencies["burst"] = burst
+        rendered = service.counts["rendered"]
+    finally:
+        server.shutdown()
+
+    print(f"{len(slugs)} cards, per request:")
+    ok = True
+    for phase in ("cold", "disk", "memory", "burst"):
+        p50, p95 = percentile(latencies[phase], 0.5), percentile(latencies[phase], 0.95)
+        target = P95_TARGET_MS[phase]
+        print(f"  {phase:7} p50 {p50:7.1f} ms   p95 {p95:7.1f} ms   (target {target:g} ms, "
+              f"{len(latencies[phase])} requests)")
+        if p95 > target:
+            print(f"❌ {phase} p95 is over its {target:g} ms target")
+            ok = False
+    print(f"  burst: {CONCURRENCY} clients x {len(burst_slugs)} cards, {rendered} renders")
+    if rendered != len(burst_slugs):
+        print("❌ Concurrent requests for the same card rendered it more than once")
+        ok = False
+    if ok:
+        print("\nAll checks passed ✅")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
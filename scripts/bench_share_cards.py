@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Per-card render time for the share cards, against the full-resolution
+reference they're allowed to approximate.
+
+Renders the first few episodes' cards (from public/episodes.json and
+public/episode-art/) three ways:
+
+- reference: the ambient background blurred at full card size and the
+  shadow blurred over a full-card layer, as the cards were first drawn
+- cold: the current renderer with an empty background cache
+- warm: the current renderer with the blurred backgrounds cached
+
+and checks the speedup and that every card stays within PSNR_FLOOR of the
+reference (measured before JPEG encoding). Nothing in public/ is written.
+Run with:
+
+    cd scripts && python3 bench_share_cards.py
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import build_manifest  # noqa: E402
+import export_share_cards as cards  # noqa: E402
+import run_cache  # noqa: E402
+
+CARDS = 8
+# Differences below ~40dB aren't visible on photographic content; the blur
+# approximation lands well above this
+PSNR_FLOOR = 40.0
+MIN_SPEEDUP = 1.5
+
+
+def reference_background(art, key, digest=None):
+    from PIL import Image, ImageEnhance
+    bg = ImageEnhance.Color(cards.cover(art, (cards.WIDTH, cards.HEIGHT),
+                                        blur=cards.BACKGROUND_BLUR)).enhance(1.3)
+    card = Image.blend(bg, Image.new("RGB", (cards.WIDTH, cards.HEIGHT), cards.INK),
+                       0.62).convert("RGBA")
+    card = Image.alpha_composite(card, cards.hgrad((cards.WIDTH, cards.HEIGHT), 78, 0,
+                                                   cards.mix(key, cards.INK, 0.5), power=0.8))
+    return Image.alpha_composite(card, cards.vgrad((cards.WIDTH, cards.HEIGHT), 0, 120))
+
+
+def reference_shadow(card, box, radius, blur=32, alpha=175, offset=(0, 16)):
+    from PIL import Image, ImageDraw, ImageFilter
+    layer = Image.new("RGBA", card.size, (0, 0, 0, 0))
+    x0, y0, x1, y1 = box
+    ImageDraw.Draw(layer).rounded_rectangle(
+        [x0 + offset[0], y0 + offset[1], x1 + offset[0], y1 + offset[1]],
+        radius=radius, fill=(0, 0, 0, alpha))
+    return Image.alpha_composite(card, layer.filter(ImageFilter.GaussianBlur(blur)))
+
+
+def psnr(a, b):
+    from PIL import ImageChops, ImageStat
+    diff = ImageChops.difference(a.convert("RGB"), b.convert("RGB"))
+    mse = sum(ImageStat.Stat(diff).sum2) / (3 * a.width * a.height)
+    return 10 * math.log10(255 ** 2 / mse) if mse else float("inf")
+
+
+def render_all(episodes, mark):
+    """Render each card, returning (ms per card, {slug: card before encoding})."""
+    rendered = {}
+    cards.save = lambda card, path: rendered.__setitem__(os.path.basename(path), card)
+    started = time.perf_counter()
+    for episode in episodes:
+        cards.write_episode_card(episode, mark)
+    return (time.perf_counter() - started) * 1000 / len(episodes), rendered
+
+
+def main():
+    data = run_cache.shared().json(cards.EPISODES_JSON)
+    episodes = [episode for episode in data.get("episodes", [])
+                if os.path.exists(cards.art_path(episode))][:CARDS]
+    if not episodes:
+        print("No episode art in public/episode-art/ — run export_episode_art.py first")
+        return 1
+
+    save, background, shadow = cards.save, cards.ambient_background, cards.drop_shadow
+    build_manifest.MANIFEST_PATH = os.path.join(tempfile.mkdtemp(), "build_manifest.json")
+    mark = cards.show_mark(cards.MARK, 15)
+    try:
+        render_all(episodes[:1], mark)  # fonts, sprites and the accent code path warm
+
+        cards.ambient_background, cards.drop_shadow = reference_background, reference_shadow
+        reference_ms, reference = render_all(episodes, mark)
+        cards.ambient_background, cards.drop_shadow = background, shadow
+
+        cold_ms, _ = render_all(episodes, mark)
+        warm_ms, current = render_all(episodes, mark)
+    finally:
+        cards.save = save
+        cards.ambient_background, cards.drop_shadow = background, shadow
+
+    worst = min(psnr(reference[name], current[name]) for name in reference)
+    print(f"{len(episodes)} cards, per card (before JPEG encoding):")
+    print(f"  reference  {reference_ms:7.1f} ms")
+    print(f"  cold       {cold_ms:7.1f} ms  ({reference_ms / cold_ms:.1f}x)")
+    print(f"  warm       {warm_ms:7.1f} ms  ({reference_ms / warm_ms:.1f}x)")
+    print(f"  worst PSNR vs reference: {worst:.1f} dB")
+
+    ok = True
+    if worst < PSNR_FLOOR:
+        print(f"❌ A card drifted below {PSNR_FLOOR:g} dB from the reference")
+        ok = False
+    if reference_ms / warm_ms < MIN_SPEEDUP:
+        print(f"❌ Less than {MIN_SPEEDUP:g}x faster than the reference")
+        ok = False
+    if ok:
+        print("\nAll checks passed ✅")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Startup budget check for the Python scripts.
+
+Cheap invocations (--dry-run, --help, cache checks, weeks with nothing new)
+shouldn't pay for PIL, requests or the Google client libraries before they
+know they need them. This imports each script in a fresh interpreter under
+`-X importtime` and fails if the import pulls in a heavy dependency or goes
+over its time budget. Run with:
+
+    cd scripts && python3 bench_startup.py
+
+Times are the median of a few runs, and only count the script's own import
+(not interpreter startup or site-packages hooks).
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Module -> import-time budget in milliseconds. Generous on purpose: these
+# take ~10-50ms locally, and the point is catching a heavy import creeping
+# back in, not shaving milliseconds on a slow CI runner.
+IMPORT_BUDGET_MS = {
+    'tier_list_generator': 150,
+    'automated_tierlist_updater': 200,
+    'export_episode_art': 150,
+    'export_share_cards': 100,
+    'share_card_server': 150,
+    'tierlist_server': 200,
+    'export_tierlist_highlights': 200,
+}
+
+# Only imported by the code that actually renders or talks to the network
+HEAVY_MODULES = ('PIL', 'requests', 'urllib3', 'googleapiclient', 'google.oauth2', 'numpy')
+
+# Whole-process budget for a command that exits before doing any work
+HELP_BUDGET_MS = 1000
+RUNS = 5
+
+
+def import_profile(module):
+    """(cumulative import ms, set of modules imported) for `import module`."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True)
+    total_us, imported = None, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            total_us = int(cumulative)
+    return total_us / 1000, imported
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def bench_imports():
+    print("Import time:")
+    ok = True
+    for module, budget in IMPORT_BUDGET_MS.items():
+        profiles = [import_profile(module) for _ in range(RUNS)]
+        median = statistics.median(ms for ms, _ in profiles)
+        heavy = sorted({heavy for _, imported in profiles for heavy in HEAVY_MODULES
+                        if any(name == heavy or name.startswith(heavy + '.')
+                               for name in imported)})
+        ok &= check(not heavy, f"{module} imports no heavy dependencies"
+                    + (f" (got {', '.join(heavy)})" if heavy else ""))
+        ok &= check(median <= budget, f"{module}: {median:.1f}ms (budget {budget}ms)")
+    return ok
+
+
+def bench_help():
+    print("Cheap invocation:")
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'automated_tierlist_updater.py', '--help'],
+                       cwd=SCRIPTS_DIR, capture_output=True, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(times)
+    return check(median <= HELP_BUDGET_MS,
+                 f"automated_tierlist_updater.py --help: {median:.0f}ms (budget {HELP_BUDGET_MS}ms)")
+
+
+if __name__ == "__main__":
+    results = [
+        bench_imports(),
+        bench_help(),
+    ]
+    if all(results):
+        print("\nAll checks passed ✅")
+        sys.exit(0)
+    print("\nSome checks FAILED ❌")
+    sys.exit(1)
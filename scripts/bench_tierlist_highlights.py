@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Time to export a highlighted tier list for every game, against one render
+of the tier list itself.
+
+Lays out every capsule cached in steam_images/ as a tier list, renders it
+once as the updater does (generate_tier_list, optimized PNG), then writes a
+'dim' highlight variant for every game with generate_highlights across all
+cores, and checks the whole batch costs at most MAX_MULTIPLE renders. Steam
+lookups are stubbed out and nothing in public/ is written. Run with:
+
+    cd scripts && python3 bench_tierlist_highlights.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tier_list_generator import TierListGenerator  # noqa: E402
+
+TIERS = "SABCDF"
+# The variants share one composed canvas and only encode their own copy, so
+# however many episodes there are they should stay a small multiple of the
+# single render the updater already pays for
+MAX_MULTIPLE = 3.0
+
+
+def cached_tiers(generator):
+    """Every cached capsule, dealt out across the tiers."""
+    suffix = "_capsule.jpg"
+    games = sorted(name[:-len(suffix)].replace("_", " ")
+                   for name in os.listdir(generator.cache_dir) if name.endswith(suffix))
+    return {tier: games[i::len(TIERS)] for i, tier in enumerate(TIERS)}
+
+
+def main():
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    generator = TierListGenerator(verbose=False)
+    generator.search_steam_game = lambda name, persist=True: None  # offline
+    tiers = cached_tiers(generator)
+    games = [game for tier_games in tiers.values() for game in tier_games]
+    if not games:
+        print("No capsules in steam_images/ — run the tier list updater first")
+        return 1
+
+    out = tempfile.mkdtemp()
+    generator.generate_tier_list(tiers, os.path.join(out, "warmup.png"))  # tiles cached
+
+    started = time.perf_counter()
+    generator.generate_tier_list(tiers, os.path.join(out, "tierlist.png"))
+    render_s = time.perf_counter() - started
+
+    jobs = os.cpu_count() or 1
+    started = time.perf_counter()
+    written = generator.generate_highlights(
+        tiers, {os.path.join(out, f"{index}.jpg"): game for index, game in enumerate(games)},
+        jobs=jobs)
+    highlights_s = time.perf_counter() - started
+
+    multiple = highlights_s / render_s
+    print(f"{len(games)} games, {jobs} process(es):")
+    print(f"  one tier list render  {render_s * 1000:8.0f} ms")
+    print(f"  every highlight       {highlights_s * 1000:8.0f} ms  "
+          f"({highlights_s * 1000 / len(written):.0f} ms each, {multiple:.1f}x one render)")
+    print(f"  a render per variant  {render_s * len(games) * 1000:8.0f} ms  (estimated)")
+
+    ok = True
+    if len(written) != len(games):
+        print(f"❌ Only {len(written)} of {len(games)} variants written")
+        ok = False
+    if multiple > MAX_MULTIPLE:
+        print(f"❌ Every variant together took more than {MAX_MULTIPLE:g}x one render")
+        ok = False
+    if ok:
+        print("\nAll checks passed ✅")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
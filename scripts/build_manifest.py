@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Dependency tracking for the episode art and share card exporters.
+
+Both exporters used to rebuild every output on every run: a WebP re-encode at
+method=6 per episode, and a 1200x630 card with two large blurs per episode,
+when normally one episode is new. Now each output is recorded with a
+signature of everything it was built from:
+
+- the content hashes of its source files (capsule, art, fonts, cover)
+- the episode fields it draws
+- the hash of the exporter's own source, so a template or code change
+  rebuilds everything it touches
+- the encoder settings and the Pillow version
+
+It's only rebuilt when that signature changes, or when the output is missing or
+no longer the file that was written. `--force` on either exporter (or on
+pipeline.py) rebuilds regardless.
+
+The manifest lives in scripts/.cache/build_manifest.json, next to the
+updater's run state; CI restores it with actions/cache. Losing it just means
+one full rebuild.
+"""
+
+import hashlib
+import json
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+MANIFEST_PATH = os.path.join(SCRIPTS_DIR, ".cache", "build_manifest.json")
+
+
+def file_digest(path):
+    """sha256 of a file's contents, or None if it doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    def __init__(self, path=None, force=False):
+        self.path = path or MANIFEST_PATH
+        self.force = force
+        self.entries = {}
+        self._digests = {}      # per-run memo: fonts etc. are inputs to every card
+        self.built = self.skipped = 0
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as handle:
+                    self.entries = json.load(handle)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def digest(self, path):
+        """Memoized file_digest. Only for inputs that don't change mid-run."""
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def signature(self, **inputs):
+        """Hash of an output's inputs. Values must be JSON-serialisable; pass
+        file contents as digests (see digest())."""
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _key(output):
+        return os.path.relpath(os.path.abspath(output), REPO_ROOT).replace(os.sep, '/')
+
+    def is_current(self, output, signature):
+        """True if `output` was built from `signature` and is still the file
+        that build wrote. Counts a skip when it is."""
+        if self.force:
+            return False
+        entry = self.entries.get(self._key(output))
+        if (entry is None or entry.get('signature') != signature
+                or entry.get('output') != file_digest(output)):
+            return False
+        self.skipped += 1
+        return True
+
+    def record(self, output, signature):
+        self.entries[self._key(output)] = {'signature': signature,
+                                           'output': file_digest(output)}
+        self.built += 1
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as handle:
+            json.dump(self.entries, handle, indent=2, sort_keys=True)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def code_version(*paths):
+    """Hash of source files, for signatures that should change with the code."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update((file_digest(path) or '').encode('ascii'))
+    return digest.hexdigest()[:16]
+
+
+def pillow_version():
+    # Imported here rather than at module level: checking signatures shouldn't
+    # cost a PIL import when nothing needs rebuilding.
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('Pillow')
+    except PackageNotFoundError:
+        return None
+
+
+def state_path(name):
+    """A path next to the manifest, for the exporters' other cached state."""
+    return os.path.join(os.path.dirname(MANIFEST_PATH), name)
@@ -12,38 +12,52 @@ Filename resolution deliberately reuses TierListGenerator._safe_filename so the
 naming stays identical to the tier list cache. Episodes with no matching capsule
 are simply skipped — the site falls back to a typographic card.
 
-This script only writes images; fetch-episodes.js picks them up by looking for a
-matching file, so a plain `npm run build` needs no Python.
+This script only writes files; fetch-episodes.js picks them up by looking for a
+matching file, so a plain `npm run build` needs no Python. Alongside the images
+it writes public/episode-art.json, which fetch-episodes.js merges into
+episodes.json: each WebP's pixel size, dominant colour and a tiny inline
+placeholder (an 8px-wide WebP data URI, for the browser to stretch and blur)
+so cards keep their shape and colour while the art loads.
 
-Run after scripts/fetch-episodes.js:
+Only art whose capsule (or this script) changed since the last run is
+re-encoded; see build_manifest.py. Placeholders are kept per capsule content
+hash in scripts/.cache/art_meta.json, so unchanged art isn't decoded for them
+either. Run after scripts/fetch-episodes.js:
 
-    python scripts/export_episode_art.py
+    python scripts/export_episode_art.py [--force]
 """
 
+import argparse
+import base64
+import difflib
+import io
 import json
 import os
 import re
 import sys
 
-from PIL import Image
-
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import aliases  # noqa: E402
+import run_cache  # noqa: E402
+from build_manifest import BuildManifest, code_version, pillow_version, state_path  # noqa: E402
 from tier_list_generator import TierListGenerator  # noqa: E402
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(REPO_ROOT, "scripts", "steam_images")
 EPISODES_JSON = os.path.join(REPO_ROOT, "public", "episodes.json")
 OUTPUT_DIR = os.path.join(REPO_ROOT, "public", "episode-art")
+META_JSON = os.path.join(REPO_ROOT, "public", "episode-art.json")
 
 # Cards render the capsule at roughly 230px wide; 2x covers retina.
 TARGET_WIDTH = 460
-
-# Same mappings the updater applies when turning an episode title into a game
-# name. Kept in sync with name_mappings in automated_tierlist_updater.py.
-NAME_MAPPINGS = {
-    "Spelunky HD": "Spelunky",
-    "Vampire Crawlers: The Turbo Wildcard from Vampire Survivors": "Vampire Crawlers",
-}
+WEBP_SETTINGS = {"quality": 78, "method": 6}
+# ~110 bytes of WebP (~150 characters as a data URI) per episode
+PLACEHOLDER_WIDTH = 8
+PLACEHOLDER_WEBP = {"quality": 50, "method": 6}
+# Colours the art is reduced to when picking its dominant one
+DOMINANT_COLOURS = 8
+# Bump when art_meta() changes what it computes
+ART_META_VERSION = 1
 
 
 def slugify(title):
@@ -51,65 +65,222 @@ def slugify(title):
     return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
 
 
-def find_capsule(generator, title):
-    """Locate the cached capsule for an episode title, if one exists."""
-    candidates = [title]
-    if title in NAME_MAPPINGS:
-        candidates.insert(0, NAME_MAPPINGS[title])
-    # Titles like "The Binding of Isaac: Rebirth" are cached under a shorter name.
-    if ":" in title:
-        candidates.append(title.split(":")[0].strip())
+def _compact(name):
+    """Case-, punctuation- and spacing-blind key: "Binding_of_Isaac" and
+    "The Binding of Isaac" differ only by the article."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+class CapsuleIndex:
+    """The capsules in the tier list cache, scanned once per run.
+
+    Maps exact cache filenames and compacted game names to paths, so every
+    episode resolves with dict lookups instead of a directory scan per miss.
+    Build a new one after the cache changes (the tier list stage downloads
+    into it).
+    """
+
+    SUFFIX = "_capsule.jpg"
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.by_filename = {}
+        self.by_key = {}
+        if os.path.isdir(cache_dir):
+            with os.scandir(cache_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.name.endswith(self.SUFFIX):
+                        self.by_filename[entry.name] = entry.path
+                        self.by_key.setdefault(_compact(entry.name[: -len(self.SUFFIX)]), entry.path)
+
+    @staticmethod
+    def candidates(title):
+        """Names an episode's capsule may be cached under, most specific first."""
+        candidates = [title]
+        # Same aliases the updater applies (aliases.json)
+        tier_name = aliases.registry().tier_name(title)
+        if tier_name != title:
+            candidates.insert(0, tier_name)
+        # Titles like "The Binding of Isaac: Rebirth" are cached under a shorter name.
+        if ":" in title:
+            candidates.append(title.split(":")[0].strip())
+        return candidates
+
+    def find(self, title):
+        candidates = self.candidates(title)
+        for name in candidates:
+            path = self.by_filename.get(f"{TierListGenerator._safe_filename(name)}{self.SUFFIX}")
+            if path:
+                return path
+        # Last resort: case/punctuation-insensitive match
+        for name in candidates:
+            path = self.by_key.get(_compact(name))
+            if path:
+                return path
+        return None
+
+    def suggest(self, title, limit=3):
+        """Cached capsule names closest to an unmatched title, for the miss report."""
+        by_key_name = {key: os.path.basename(path)[: -len(self.SUFFIX)]
+                       for key, path in self.by_key.items()}
+        close = []
+        for name in self.candidates(title):
+            for key in difflib.get_close_matches(_compact(name), by_key_name, n=limit, cutoff=0.6):
+                if by_key_name[key] not in close:
+                    close.append(by_key_name[key])
+        return close[:limit]
+
+
+def art_meta(img):
+    """{width, height, color, placeholder} for an exported image: its pixel
+    size, its most common colour once reduced to DOMINANT_COLOURS (as
+    #rrggbb), and a PLACEHOLDER_WIDTH-wide copy as a WebP data URI."""
+    from PIL import Image
+    width, height = img.size
+    tiny = img.resize((PLACEHOLDER_WIDTH, max(1, round(PLACEHOLDER_WIDTH * height / width))),
+                      Image.Resampling.BOX)
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", **PLACEHOLDER_WEBP)
+
+    # Small enough to quantize in no time, large enough to keep the colours
+    sample = img.resize((32, max(1, round(32 * height / width))), Image.Resampling.BOX)
+    reduced = sample.quantize(DOMINANT_COLOURS)
+    _, index = max(reduced.getcolors())
+    red, green, blue = reduced.getpalette()[index * 3:index * 3 + 3]
+    return {
+        "width": width,
+        "height": height,
+        "color": f"#{red:02x}{green:02x}{blue:02x}",
+        "placeholder": "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii"),
+    }
 
-    for name in candidates:
-        path = os.path.join(CACHE_DIR, f"{generator._safe_filename(name)}_capsule.jpg")
+
+class ArtMetaCache:
+    """art_meta() results by capsule content hash, kept across runs, so an
+    unchanged capsule isn't decoded again just for its placeholder. Dropped
+    whole when the settings behind them change."""
+
+    def __init__(self, path):
+        self.path = path
+        self.settings = {"version": ART_META_VERSION, "width": TARGET_WIDTH,
+                         "placeholder": [PLACEHOLDER_WIDTH, PLACEHOLDER_WEBP],
+                         "colours": DOMINANT_COLOURS}
+        self.entries = {}
         if os.path.exists(path):
-            return path
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if data.get("settings") == self.settings:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
 
-    # Last resort: case/punctuation-insensitive match against the cache.
-    def norm(s):
-        return re.sub(r"[^a-z0-9]", "", s.lower())
+    def get(self, digest):
+        return self.entries.get(digest)
 
-    wanted = {norm(c) for c in candidates}
-    for filename in os.listdir(CACHE_DIR):
-        if not filename.endswith("_capsule.jpg"):
-            continue
-        if norm(filename[: -len("_capsule.jpg")]) in wanted:
-            return os.path.join(CACHE_DIR, filename)
-    return None
+    def put(self, digest, meta):
+        self.entries[digest] = meta
+
+    def save(self, digests):
+        """Write the entries for `digests` (this run's capsules) only."""
+        self.entries = {digest: self.entries[digest] for digest in digests if digest in self.entries}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump({"settings": self.settings, "entries": self.entries}, handle, indent=2,
+                      sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+
+def write_meta(path, meta):
+    """Write {slug: art_meta()} to `path` unless it already holds exactly
+    that, so an unchanged run leaves the committed file alone. Returns
+    whether it was written."""
+    serialised = json.dumps(meta, indent=2, sort_keys=True) + "\n"
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            if handle.read() == serialised:
+                return False
+    except OSError:
+        pass
+    with open(path + ".tmp", "w", encoding="utf-8") as handle:
+        handle.write(serialised)
+    os.replace(path + ".tmp", path)
+    return True
 
 
-def main():
+def find_capsule(title, index=None):
+    """Locate the cached capsule for an episode title, if one exists. Pass an
+    index when resolving many titles; without one the cache is scanned."""
+    return (index or CapsuleIndex(CACHE_DIR)).find(title)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export web-sized episode art")
+    parser.add_argument("--force", action="store_true",
+                        help="re-encode every episode's art, even if it's up to date")
+    args = parser.parse_args(argv)
+
     if not os.path.exists(EPISODES_JSON):
         print("No public/episodes.json — run scripts/fetch-episodes.js first")
         return 1
 
-    with open(EPISODES_JSON, encoding="utf-8") as handle:
-        data = json.load(handle)
+    cache = run_cache.shared()
+    data = cache.json(EPISODES_JSON)
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    generator = TierListGenerator(verbose=False)
 
+    manifest = BuildManifest(force=args.force)
+    version = code_version(os.path.abspath(__file__))
+    pillow = pillow_version()
+    index = CapsuleIndex(CACHE_DIR)
+    meta_cache = ArtMetaCache(state_path("art_meta.json"))
+    meta, digests = {}, []
     exported, missing = 0, []
     for episode in data.get("episodes", []):
         title = episode["title"]
         slug = slugify(title)
-        source = find_capsule(generator, title)
+        source = index.find(title)
 
         if not source:
             missing.append(title)
             continue
 
-        with Image.open(source) as img:
-            img = img.convert("RGB")
-            height = round(img.height * TARGET_WIDTH / img.width)
-            img = img.resize((TARGET_WIDTH, height), Image.LANCZOS)
-            img.save(os.path.join(OUTPUT_DIR, f"{slug}.webp"), quality=78, method=6)
-
+        output = os.path.join(OUTPUT_DIR, f"{slug}.webp")
+        digest = manifest.digest(source)
+        signature = manifest.signature(
+            source=digest, width=TARGET_WIDTH, encoder=WEBP_SETTINGS,
+            code=version, pillow=pillow)
         exported += 1
+        digests.append(digest)
+        current = manifest.is_current(output, signature)
+        meta[slug] = meta_cache.get(digest)
+        if current and meta[slug]:
+            continue
+
+        # Through the shared cache: in a pipeline run the tier list stage has
+        # usually decoded this capsule already
+        capsule = cache.image(source)
+        height = round(capsule.height * TARGET_WIDTH / capsule.width)
+        img = cache.resized(source, (TARGET_WIDTH, height), mode="RGB")
+        if not current:
+            img.save(output, **WEBP_SETTINGS)
+            manifest.record(output, signature)
+        if not meta[slug]:
+            meta[slug] = art_meta(img)
+            meta_cache.put(digest, meta[slug])
 
-    print(f"Exported art for {exported}/{len(data.get('episodes', []))} episodes")
+    manifest.save()
+    meta_cache.save(digests)
+    if write_meta(META_JSON, meta):
+        print(f"Wrote sizes and placeholders for {len(meta)} episodes to public/episode-art.json")
+    print(f"Exported art for {exported}/{len(data.get('episodes', []))} episodes "
+          f"({manifest.built} encoded, {manifest.skipped} up to date)")
     if missing:
-        print(f"  No cached capsule for: {', '.join(missing)}")
+        print(f"  No cached capsule for {len(missing)} episode(s):")
+        for title in missing:
+            close = index.suggest(title)
+            hint = f" (closest cached: {', '.join(close)})" if close else ""
+            print(f"    - {title}{hint}")
+        print("  If one of those is the same game, add the episode title as an alias in aliases.json")
     return 0
 
 
@@ -20,17 +20,34 @@ and it means 47 cards read as a set without being identical.
 Deliberately says nothing about where the game landed on the tier list. The card
 is an invitation to listen, not a summary of the verdict.
 
-Run after scripts/fetch-episodes.js and scripts/export_episode_art.py:
+Cards whose art, episode fields, fonts and template are unchanged since the
+last run are left alone; see build_manifest.py. Run after
+scripts/fetch-episodes.js and scripts/export_episode_art.py:
 
-    python scripts/export_share_cards.py
+    python scripts/export_share_cards.py [--force] [--jobs N]
+
+Rendering is CPU-bound (two large blurs and a progressive JPEG per card), so
+--jobs spreads the cards that need rebuilding over N worker processes
+(0 = one per core). Each card is independent, so the output is the same
+either way.
 """
 
+import argparse
 import colorsys
+import functools
 import json
+import math
 import os
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
-from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import build_manifest  # noqa: E402
+import run_cache  # noqa: E402
+import typography  # noqa: E402
+from build_manifest import (  # noqa: E402
+    BuildManifest, code_version, file_digest, pillow_version, state_path)
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 EPISODES_JSON = os.path.join(REPO_ROOT, "public", "episodes.json")
@@ -38,6 +55,7 @@ ART_DIR = os.path.join(REPO_ROOT, "public", "episode-art")
 BRAND_DIR = os.path.join(REPO_ROOT, "public", "brand")
 OUTPUT_DIR = os.path.join(REPO_ROOT, "public", "episode-share")
 SHOW_CARD = os.path.join(BRAND_DIR, "share-card.jpg")
+SHOW_COVER = os.path.join(BRAND_DIR, "cover-1080.webp")
 
 # Vendored rather than looked up by name: CI has no fonts installed, and the
 # silent fallback to DejaVu Sans is how these cards ended up set in a face that
@@ -73,70 +91,131 @@ BODY = (168, 174, 184)
 LABEL = (128, 134, 145)
 
 MARK = 76          # show art in the byline lockup
+PILL_HEIGHT = 44   # listen row platform pills
 CAPSULE_RADIUS = 20
 
+# The ambient background is blurred at 1/BACKGROUND_SCALE of the card's size
+# and upsampled: at this radius the result is within a few levels of a
+# full-size blur (PSNR > 50dB before it's darkened) at a tenth of the cost.
+BACKGROUND_BLUR = 56
+BACKGROUND_SCALE = 4
+
+# JPEG, not PNG: these are photographic-ish and PNG lands ~550KB each. Every
+# major link unfurler (Reddit, Discord, Bluesky, X) handles JPEG.
+#
+# subsampling=0 is not optional. The default 4:2:0 stores chroma at half
+# resolution, and red-on-ink text is almost pure chroma — it is the one
+# element on the card that visibly falls apart without this.
+JPEG_SETTINGS = {"quality": 90, "subsampling": 0, "optimize": True, "progressive": True}
+
+# The episode fields a card draws; a change to any other field doesn't
+# rebuild it.
+CARD_FIELDS = ("slug", "number", "title", "duration")
+
 
 def grotesk(size, weight="Bold"):
-    font = ImageFont.truetype(GROTESK, size)
-    font.set_variation_by_name(weight)
-    return font
+    return typography.font(GROTESK, size, weight)
 
 
 def inter(size, weight="Regular"):
-    font = ImageFont.truetype(INTER, size)
-    font.set_variation_by_name(weight)
-    return font
+    return typography.font(INTER, size, weight)
+
+
+# Everything on a card that doesn't depend on the episode — gradient ramps,
+# the capsule's shadow and corner mask, the listen row's pills, the byline —
+# is built once per process by the lru_cached helpers below and composited
+# over just its bounding box. Composited layers are straight (not
+# premultiplied) RGBA, since that's what alpha_composite takes; outside a
+# layer's box it's fully transparent, which alpha_composite leaves untouched,
+# so cards come out byte-identical to full-card compositing.
+
 
+def placed(layer, offset=(0, 0)):
+    """`layer` cropped to its visible pixels, with where the crop goes:
+    (image, (x, y)), or None if it's entirely transparent."""
+    bbox = layer.getchannel("A").getbbox()
+    if bbox is None:
+        return None
+    return layer.crop(bbox), (offset[0] + bbox[0], offset[1] + bbox[1])
 
-def tracked(draw, xy, text, font, fill, tracking=0):
-    """Draw text with letter-spacing, which PIL has no native support for."""
-    x, y = xy
-    for char in text:
-        draw.text((x, y), char, font=font, fill=fill)
-        x += draw.textlength(char, font=font) + tracking
+
+def stamp(card, layer):
+    """Composite a placed() layer onto `card` in place."""
+    if layer is not None:
+        image, xy = layer
+        card.alpha_composite(image, xy)
+    return card
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_mask(size, radius):
+    from PIL import Image, ImageDraw
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        [0, 0, size[0] - 1, size[1] - 1], radius=radius, fill=255)
+    return mask
 
 
 def rounded(img, radius):
     """RGBA copy with rounded corners."""
     img = img.convert("RGBA")
-    mask = Image.new("L", img.size, 0)
-    ImageDraw.Draw(mask).rounded_rectangle(
-        [0, 0, img.width - 1, img.height - 1], radius=radius, fill=255)
-    img.putalpha(mask)
+    img.putalpha(_rounded_mask(img.size, radius))
     return img
 
 
-def drop_shadow(card, box, radius, blur=32, alpha=175, offset=(0, 16)):
-    layer = Image.new("RGBA", card.size, (0, 0, 0, 0))
-    x0, y0, x1, y1 = box
+@functools.lru_cache(maxsize=8)
+def _shadow(card_size, box, radius, blur, alpha, offset):
+    from PIL import Image, ImageDraw, ImageFilter
+    x0, y0, x1, y1 = (box[0] + offset[0], box[1] + offset[1],
+                      box[2] + offset[0], box[3] + offset[1])
+    reach = blur * 3
+    left, top = max(x0 - reach, 0), max(y0 - reach, 0)
+    right, bottom = min(x1 + reach + 1, card_size[0]), min(y1 + reach + 1, card_size[1])
+    layer = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
     ImageDraw.Draw(layer).rounded_rectangle(
-        [x0 + offset[0], y0 + offset[1], x1 + offset[0], y1 + offset[1]],
-        radius=radius, fill=(0, 0, 0, alpha))
-    return Image.alpha_composite(card, layer.filter(ImageFilter.GaussianBlur(blur)))
+        [x0 - left, y0 - top, x1 - left, y1 - top], radius=radius, fill=(0, 0, 0, alpha))
+    return placed(layer.filter(ImageFilter.GaussianBlur(blur)), (left, top))
+
+
+def drop_shadow(card, box, radius, blur=32, alpha=175, offset=(0, 16)):
+    """Composite a blurred rounded-rectangle shadow onto `card`, in place.
+
+    Only the shadow's box plus the blur's reach (3 x blur, the full extent of
+    PIL's box-blur approximation) is blurred and composited; the rest of a
+    full-card layer would be transparent. Byte-identical to blurring a
+    full-card layer. Built once per box.
+    """
+    return stamp(card, _shadow(card.size, tuple(box), radius, blur, alpha, offset))
+
+
+@functools.lru_cache(maxsize=8)
+def _ramp(size, start_a, end_a, power, vertical):
+    """Alpha ramp across `size`: top to bottom if `vertical`, else left to right."""
+    from PIL import Image
+    length = size[1] if vertical else size[0]
+    ramp = Image.new("L", (1, length) if vertical else (length, 1))
+    ramp.putdata([int(start_a + (end_a - start_a) * ((i / max(length - 1, 1)) ** power))
+                  for i in range(length)])
+    return ramp.resize(size)
 
 
 def vgrad(size, top_a, bottom_a, color=(0, 0, 0)):
-    width, height = size
-    ramp = Image.new("L", (1, height))
-    ramp.putdata([int(top_a + (bottom_a - top_a) * (i / max(height - 1, 1)))
-                  for i in range(height)])
+    from PIL import Image
     layer = Image.new("RGBA", size, color + (0,))
-    layer.putalpha(ramp.resize(size))
+    layer.putalpha(_ramp(size, top_a, bottom_a, 1.0, True))
     return layer
 
 
 def hgrad(size, left_a, right_a, color=(0, 0, 0), power=1.0):
-    width, height = size
-    ramp = Image.new("L", (width, 1))
-    ramp.putdata([int(left_a + (right_a - left_a) * ((i / max(width - 1, 1)) ** power))
-                  for i in range(width)])
+    from PIL import Image
     layer = Image.new("RGBA", size, color + (0,))
-    layer.putalpha(ramp.resize(size))
+    layer.putalpha(_ramp(size, left_a, right_a, power, False))
     return layer
 
 
 def cover(img, size, blur=0):
     """Scale to fill `size`, centre-cropped."""
+    from PIL import Image, ImageFilter
     width, height = size
     scale = max(width / img.width, height / img.height)
     out = img.resize((max(round(img.width * scale), width),
@@ -148,75 +227,128 @@ def cover(img, size, blur=0):
     return out.crop((left, top, left + width, top + height))
 
 
+HUE_BUCKETS = 18
+# Bump when accent() changes, so colours cached by earlier versions are dropped
+ACCENT_VERSION = 2
+
+
+def _band_sum(band):
+    return math.fsum(struct.unpack(f"{band.width * band.height}f", band.tobytes()))
+
+
 def accent(img):
     """The art's most saturated, reasonably bright hue — the card's key colour.
 
     Averaging the whole image gives mud; this buckets by hue and takes the
     bucket carrying the most saturation-weighted colour, then floors the
     brightness so dark art still yields something usable.
+
+    The per-pixel HSV work is float image math in PIL rather than a Python
+    loop. It runs in float32, so a pixel whose hue lands exactly on a bucket
+    edge can fall the other side of it than it did with colorsys. On our
+    episode art that moved the key colour by at most 1 per channel; on art
+    whose top buckets are near-tied (random noise, say) it can pick a
+    different bucket, and so a different colour, altogether.
     """
+    from PIL import Image, ImageMath
     small = img.convert("RGB").resize((64, 96), Image.LANCZOS)
-    buckets = {}
-    for r, g, b in small.getdata():
-        hue, sat, val = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-        if sat < 0.35 or val < 0.25:
-            continue
-        weight = sat * val
-        acc = buckets.setdefault(int(hue * 18), [0.0, 0.0, 0.0, 0.0])
-        acc[0] += r * weight
-        acc[1] += g * weight
-        acc[2] += b * weight
-        acc[3] += weight
-    if not buckets:
+    r, g, b = (band.convert("F") for band in small.split())
+
+    def hsv(x):
+        # colorsys.rgb_to_hsv, per pixel; division by zero yields 0 here
+        r, g, b, lo, hi = x["r"], x["g"], x["b"], x["min"], x["max"]
+        mx = hi(hi(r, g), b)
+        delta = mx - lo(lo(r, g), b)
+        rc, gc, bc = (mx - r) / delta, (mx - g) / delta, (mx - b) / delta
+        r_max = r == mx
+        g_max = (g == mx) * (1 - r_max)
+        b_max = (1 - r_max) * (1 - g_max)
+        hue = (r_max * (bc - gc) + g_max * (2 + rc - bc) + b_max * (4 + gc - rc)) / 6
+        return hue + (hue < 0), delta / mx, mx / 255
+
+    def weight(x):
+        _, sat, val = hsv(x)
+        return sat * val * (sat >= 0.35) * (val >= 0.25)
+
+    bucket = ImageMath.lambda_eval(
+        lambda x: x["float"](x["int"](hsv(x)[0] * HUE_BUCKETS)), r=r, g=g, b=b)
+    weights = ImageMath.lambda_eval(weight, r=r, g=g, b=b)
+
+    best, best_weight = None, 0.0
+    for index in range(HUE_BUCKETS):
+        in_bucket = ImageMath.lambda_eval(lambda x: x["w"] * (x["k"] == index),
+                                          w=weights, k=bucket)
+        total = _band_sum(in_bucket)
+        if total > best_weight:
+            best, best_weight = in_bucket, total
+    if best is None:
         return (120, 130, 150)
-    r, g, b, weight = max(buckets.values(), key=lambda a: a[3])
+    r, g, b = (_band_sum(ImageMath.lambda_eval(lambda x: x["c"] * x["w"], c=c, w=best))
+               for c in (r, g, b))
+    weight = best_weight
     hue, sat, val = colorsys.rgb_to_hsv(r / weight / 255, g / weight / 255, b / weight / 255)
     r, g, b = colorsys.hsv_to_rgb(hue, min(sat * 1.15, 1.0), max(val, 0.72))
     return (round(r * 255), round(g * 255), round(b * 255))
 
 
-def mix(c1, c2, t):
-    return tuple(round(a + (b - a) * t) for a, b in zip(c1, c2))
+class AccentCache:
+    """Key colours by art content hash, kept across runs, so a rebuilt card
+    (after a template change, or with --force) doesn't analyse its art again."""
 
+    def __init__(self, path):
+        self.path = path
+        self.accents = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if data.get("version") == ACCENT_VERSION:
+                    self.accents = data.get("accents", {})
+            except (OSError, ValueError):
+                pass
 
-def fit_lines(draw, text, loader, max_width, high, low, max_lines=2):
-    """Largest size at which `text` wraps to at most `max_lines`."""
-    font, lines = loader(low), [text]
-    for size in range(high, low - 1, -2):
-        font = loader(size)
-        lines, current = [], ""
-        for word in text.split():
-            trial = f"{current} {word}".strip()
-            if draw.textlength(trial, font=font) <= max_width:
-                current = trial
-            else:
-                lines.append(current)
-                current = word
-        if current:
-            lines.append(current)
-        if len(lines) <= max_lines:
-            return font, lines
-    return font, lines[:max_lines]
+    def get(self, digest):
+        colour = self.accents.get(digest)
+        return tuple(colour) if colour else None
 
+    def put(self, digest, colour):
+        self.accents[digest] = list(colour)
 
-def show_mark(size, radius):
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump({"version": ACCENT_VERSION, "accents": self.accents}, handle, indent=2,
+                      sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+
+def mix(c1, c2, t):
+    return tuple(round(a + (b - a) * t) for a, b in zip(c1, c2))
+
+
+def mark_source():
+    """The cover the byline mark is drawn from, or None."""
     for name in ("cover-720.webp", "cover-1080.webp", "cover-480.webp"):
         path = os.path.join(BRAND_DIR, name)
         if os.path.exists(path):
-            with Image.open(path) as src:
-                return rounded(src.convert("RGB").resize((size, size), Image.LANCZOS), radius)
+            return path
     return None
 
 
-def byline(card, x, bottom, mark):
-    """Show lockup: art, name, domain — bottom-aligned to `bottom`."""
-    if mark is None:
-        return card
-    size = mark.size[0]
-    top = bottom - size
-    card.alpha_composite(mark, (x, top))
-
-    draw = ImageDraw.Draw(card)
+def show_mark(size, radius):
+    from PIL import Image
+    path = mark_source()
+    if path is None:
+        return None
+    with Image.open(path) as src:
+        return rounded(src.convert("RGB").resize((size, size), Image.LANCZOS), radius)
+
+
+@functools.lru_cache(maxsize=4)
+def _byline_text(x, top, size):
+    """Where the byline's two lines go, beside a mark of `size` at (x, top)."""
+    from PIL import Image, ImageDraw
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
     name_font = grotesk(30, "Bold")
     domain_font = inter(21, "Regular")
     text_x = x + size + 20
@@ -231,23 +363,29 @@ def byline(card, x, bottom, mark):
     second = name_font.size + gap
     ink_top, ink_bottom = name_box[1], second + domain_box[3]
     y = top + (size - (ink_bottom - ink_top)) / 2 - ink_top
+    return (text_x, y), (text_x, y + second)
 
-    draw.text((text_x, y), SHOW_NAME, font=name_font, fill=WHITE)
-    draw.text((text_x, y + second), DOMAIN, font=domain_font, fill=LABEL)
-    return card
 
+def byline(card, x, bottom, mark):
+    """Show lockup: art, name, domain — bottom-aligned to `bottom`."""
+    if mark is None:
+        return card
+    size = mark.size[0]
+    top = bottom - size
+    card.alpha_composite(mark, (x, top))
 
-def listen_row(card, x, y, width):
-    """Where to hear it and how often — the two things a stranger seeing this
-    card in a Reddit thread doesn't know.
+    name_xy, domain_xy = _byline_text(x, top, size)
+    typography.draw_text(card, name_xy, SHOW_NAME, grotesk(30, "Bold"), WHITE)
+    typography.draw_text(card, domain_xy, DOMAIN, inter(21, "Regular"), LABEL)
+    return card
 
-    Platform names rather than logos: the marks are SVG and the pipeline has no
-    rasteriser, and hand-tracing four brand logos into PIL primitives would look
-    worse than type does.
-    """
-    draw = ImageDraw.Draw(card)
+
+@functools.lru_cache(maxsize=4)
+def _listen_layout(x, y, width):
+    """The listen row at (x, y) in `width`: (top of the pills, pill font,
+    [(pill x, pill width, name)], the placed pill layer)."""
+    from PIL import Image, ImageDraw
     label_font = inter(15, "Bold")
-    tracked(draw, (x, y), "LISTEN ON", label_font, LABEL, 3.0)
     top = y + label_font.size + 18
 
     # Shrink the row to fit rather than dropping a platform off the end. The
@@ -256,12 +394,12 @@ def listen_row(card, x, y, width):
     gap = 10
     for size, pad_x in ((19, 17), (18, 15), (17, 14), (16, 13)):
         pill_font = inter(size, "Medium")
-        widths = [round(draw.textlength(n, font=pill_font)) + pad_x * 2 for n in PLATFORMS]
+        widths = [round(typography.advance(pill_font, n)) + pad_x * 2 for n in PLATFORMS]
         if sum(widths) + gap * (len(PLATFORMS) - 1) <= width:
             break
 
-    height = 44
-    layer = Image.new("RGBA", card.size, (0, 0, 0, 0))
+    height = PILL_HEIGHT
+    layer = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 0))
     layer_draw = ImageDraw.Draw(layer)
     cursor, pills = x, []
     for name, pill_w in zip(PLATFORMS, widths):
@@ -272,47 +410,102 @@ def listen_row(card, x, y, width):
                                      outline=(255, 255, 255, 46), width=2)
         pills.append((cursor, pill_w, name))
         cursor += pill_w + gap
-    card = Image.alpha_composite(card, layer)
+    return top, pill_font, pills, placed(layer)
+
+
+def listen_row(card, x, y, width):
+    """Where to hear it and how often — the two things a stranger seeing this
+    card in a Reddit thread doesn't know.
+
+    Platform names rather than logos: the marks are SVG and the pipeline has no
+    rasteriser, and hand-tracing four brand logos into PIL primitives would look
+    worse than type does.
+    """
+    typography.tracked(card, (x, y), "LISTEN ON", inter(15, "Bold"), LABEL, 3.0)
+    top, pill_font, pills, layer = _listen_layout(x, y, width)
+    stamp(card, layer)
 
-    draw = ImageDraw.Draw(card)
     for pill_x, pill_w, name in pills:
-        text_w = draw.textlength(name, font=pill_font)
-        draw.text((pill_x + (pill_w - text_w) / 2, top + (height - pill_font.size) / 2 - 3),
-                  name, font=pill_font, fill=(214, 218, 224))
-    draw.text((x, top + height + 20), CADENCE, font=inter(21), fill=(138, 144, 154))
+        text_w = typography.advance(pill_font, name)
+        typography.draw_text(card, (pill_x + (pill_w - text_w) / 2,
+                                    top + (PILL_HEIGHT - pill_font.size) / 2 - 3),
+                             name, pill_font, (214, 218, 224))
+    typography.draw_text(card, (x, top + PILL_HEIGHT + 20), CADENCE, inter(21), (138, 144, 154))
     return card
 
 
-def ambient_background(art):
-    """The art itself, blurred and pushed to ink, with a wash in its own hue."""
-    key = accent(art)
-    bg = ImageEnhance.Color(cover(art, (WIDTH, HEIGHT), blur=56)).enhance(1.3)
+def blurred_cover(art, digest=None):
+    """cover(art, card size, blur=BACKGROUND_BLUR), computed at
+    1/BACKGROUND_SCALE size and upsampled.
+
+    With the art's content hash as `digest`, the small blurred image is kept in
+    .cache/backgrounds/ and reused by later runs.
+    """
+    from PIL import Image
+    path = None
+    if digest:
+        path = os.path.join(state_path("backgrounds"),
+                            f"{digest[:32]}-{BACKGROUND_BLUR}-{BACKGROUND_SCALE}.png")
+    small = None
+    if path and os.path.exists(path):
+        try:
+            with Image.open(path) as cached:
+                small = cached.convert("RGB")
+        except OSError:
+            small = None
+    if small is None:
+        small = cover(art, (round(WIDTH / BACKGROUND_SCALE), round(HEIGHT / BACKGROUND_SCALE)),
+                      blur=BACKGROUND_BLUR / BACKGROUND_SCALE)
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Per-process temp name: pool workers may write the same art at once
+            small.save(f"{path}.{os.getpid()}.tmp", format="PNG")
+            os.replace(f"{path}.{os.getpid()}.tmp", path)
+    return small.resize((WIDTH, HEIGHT), Image.BILINEAR)
+
+
+@functools.lru_cache(maxsize=2)
+def _bottom_shade(size):
+    return placed(vgrad(size, 0, 120))
+
+
+def ambient_background(art, key, digest=None):
+    """The art itself, blurred and pushed to ink, with a wash in `key`, its
+    accent colour. `digest` (the art's content hash) caches the blur."""
+    from PIL import Image, ImageEnhance
+    bg = ImageEnhance.Color(blurred_cover(art, digest)).enhance(1.3)
     card = Image.blend(bg, Image.new("RGB", (WIDTH, HEIGHT), INK), 0.62).convert("RGBA")
-    card = Image.alpha_composite(
-        card, hgrad((WIDTH, HEIGHT), 78, 0, mix(key, INK, 0.5), power=0.8))
-    return Image.alpha_composite(card, vgrad((WIDTH, HEIGHT), 0, 120))
+    card.alpha_composite(hgrad((WIDTH, HEIGHT), 78, 0, mix(key, INK, 0.5), power=0.8))
+    return stamp(card, _bottom_shade((WIDTH, HEIGHT)))
 
 
 def save(card, path):
-    # JPEG, not PNG: these are photographic-ish and PNG lands ~550KB each. Every
-    # major link unfurler (Reddit, Discord, Bluesky, X) handles JPEG.
-    #
-    # subsampling=0 is not optional. The default 4:2:0 stores chroma at half
-    # resolution, and red-on-ink text is almost pure chroma — it is the one
-    # element on the card that visibly falls apart without this.
-    card.convert("RGB").save(path, quality=90, subsampling=0, optimize=True,
-                             progressive=True)
-
-
-def write_episode_card(episode, mark):
-    art_path = os.path.join(ART_DIR, f"{episode['slug']}.webp")
-    if not os.path.exists(art_path):
-        return False
-
-    with Image.open(art_path) as src:
-        art = src.convert("RGB")
+    card.convert("RGB").save(path, **JPEG_SETTINGS)
+
+
+def encode(card):
+    """The JPEG bytes save() would write."""
+    import io
+    buffer = io.BytesIO()
+    card.convert("RGB").save(buffer, format="JPEG", **JPEG_SETTINGS)
+    return buffer.getvalue()
+
+
+def art_path(episode):
+    return os.path.join(ART_DIR, f"{episode['slug']}.webp")
+
 
-    card = ambient_background(art)
+def card_path(episode):
+    return os.path.join(OUTPUT_DIR, f"{episode['slug']}.jpg")
+
+
+def episode_card(episode, art, mark, key=None, digest=None):
+    """Draw an episode's card from its `art` (RGB). `key` is the art's accent
+    colour if already known; `digest`, its content hash, caches the background
+    blur. Returns (card, accent colour used)."""
+    from PIL import Image, ImageDraw
+    key = key or accent(art)
+    card = ambient_background(art, key, digest)
     card = drop_shadow(card, (PAD, PAD, PAD + CAPSULE_W, PAD + CAPSULE_H), CAPSULE_RADIUS)
     card.alpha_composite(
         rounded(art.resize((CAPSULE_W, CAPSULE_H), Image.LANCZOS), CAPSULE_RADIUS), (PAD, PAD))
@@ -324,11 +517,11 @@ def write_episode_card(episode, mark):
     y = PAD + 4
     if episode.get("number"):
         eyebrow_font = inter(23, "Bold")
-        tracked(draw, (text_x, y), f"EPISODE {episode['number']}", eyebrow_font, RED, 2.8)
+        typography.tracked(card, (text_x, y), f"EPISODE {episode['number']}", eyebrow_font, RED, 2.8)
         y += eyebrow_font.size + 24
 
-    title_font, lines = fit_lines(
-        draw, episode["title"], lambda s: grotesk(s, "Bold"), text_w, 76, 36)
+    title_font, lines = typography.fit_lines(
+        episode["title"], lambda s: grotesk(s, "Bold"), text_w, 76, 36)
     for line in lines:
         draw.text((text_x, y), line, font=title_font, fill=WHITE)
         y += round(title_font.size * 1.06)
@@ -339,26 +532,43 @@ def write_episode_card(episode, mark):
 
     card = listen_row(card, text_x, HEIGHT - PAD - MARK - 40 - 113, text_w)
     card = byline(card, text_x, HEIGHT - PAD, mark)
+    return card, key
+
+
+def write_episode_card(episode, mark, key=None):
+    """Render an episode's card to public/episode-share/. `key` is its art's
+    accent colour if already known. Returns the accent colour used, or None if
+    the episode has no art."""
+    from PIL import Image
+    source = art_path(episode)
+    if not os.path.exists(source):
+        return None
+
+    with Image.open(source) as src:
+        art = src.convert("RGB")
 
-    save(card, os.path.join(OUTPUT_DIR, f"{episode['slug']}.jpg"))
-    return True
+    card, key = episode_card(episode, art, mark, key, file_digest(source))
+    save(card, card_path(episode))
+    return key
 
 
-def write_show_card():
+def write_show_card(key=None):
     """The site-wide card: cover art left, show name and tagline right.
 
     No byline lockup here — the cover fills the left half and the show name is
     the headline, so the lockup would say the same thing a third time.
+    Returns the cover's accent colour, or None if there's no cover.
     """
-    cover_path = os.path.join(BRAND_DIR, "cover-1080.webp")
-    if not os.path.exists(cover_path):
+    from PIL import Image, ImageDraw
+    if not os.path.exists(SHOW_COVER):
         print("No public/brand/cover-1080.webp — skipping site-wide card")
-        return False
+        return None
 
-    with Image.open(cover_path) as src:
+    with Image.open(SHOW_COVER) as src:
         art = src.convert("RGB")
 
-    card = ambient_background(art)
+    key = key or accent(art)
+    card = ambient_background(art, key, file_digest(SHOW_COVER))
     size = HEIGHT - PAD * 2
     card = drop_shadow(card, (PAD, PAD, PAD + size, PAD + size), 22, blur=34, alpha=180)
     card.alpha_composite(rounded(art.resize((size, size), Image.LANCZOS), 22), (PAD, PAD))
@@ -385,7 +595,7 @@ def write_show_card():
         y += round(name_font.size * 1.04)
 
     y += 8
-    tracked(draw, (x, y), EYEBROW, eyebrow_font, RED, 2.8)
+    typography.tracked(card, (x, y), EYEBROW, eyebrow_font, RED, 2.8)
     y += eyebrow_font.size + 30
 
     for line in TAGLINE:
@@ -394,25 +604,141 @@ def write_show_card():
 
     card = listen_row(card, x, y + 34, column)
     save(card, SHOW_CARD)
-    return True
+    return key
 
 
-def main():
+# Per worker process: the byline mark, decoded once in the pool initializer.
+# Fonts need nothing extra; run_cache.shared() is already per process.
+_worker_mark = None
+
+
+def _worker_paths():
+    """Where a worker reads art and writes cards and cached backgrounds: the
+    parent's current settings, handed over explicitly rather than trusting
+    a fork to carry them (spawned workers re-import this module)."""
+    return {"art": ART_DIR, "brand": BRAND_DIR, "output": OUTPUT_DIR,
+            "manifest": build_manifest.MANIFEST_PATH}
+
+
+def _init_worker(paths):
+    global _worker_mark, ART_DIR, BRAND_DIR, OUTPUT_DIR
+    ART_DIR, BRAND_DIR, OUTPUT_DIR = paths["art"], paths["brand"], paths["output"]
+    build_manifest.MANIFEST_PATH = paths["manifest"]
+    _worker_mark = show_mark(MARK, 15)
+
+
+def _render_in_worker(episode, key):
+    return write_episode_card(episode, _worker_mark, key)
+
+
+def render_cards(cards, jobs=1):
+    """Render (episode, accent colour or None) pairs' cards, in `jobs`
+    processes if more than one.
+
+    Yields (episode, accent colour used, error) in input order, with error None
+    on success, so a failing card is reported without stopping the rest.
+    """
+    if jobs == 1 or len(cards) < 2:
+        mark = show_mark(MARK, 15) if cards else None
+        for episode, key in cards:
+            try:
+                yield episode, write_episode_card(episode, mark, key), None
+            except Exception as e:
+                yield episode, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(cards)),
+                             initializer=_init_worker, initargs=(_worker_paths(),)) as pool:
+        futures = [pool.submit(_render_in_worker, episode, key) for episode, key in cards]
+        for (episode, _), future in zip(cards, futures):
+            try:
+                yield episode, future.result(), None
+            except Exception as e:
+                yield episode, None, e
+
+
+def template_inputs(manifest):
+    """Inputs every card shares: the fonts, the byline mark, the template (this
+    file) and the encoder."""
+    mark_path = mark_source()
+    return {
+        "fonts": [manifest.digest(GROTESK), manifest.digest(INTER)],
+        "mark": manifest.digest(mark_path) if mark_path else None,
+        "code": code_version(os.path.abspath(__file__), typography.__file__),
+        "encoder": JPEG_SETTINGS,
+        "pillow": pillow_version(),
+    }
+
+
+def card_signature(manifest, shared, episode, art_digest):
+    """The build signature of `episode`'s card, drawn from art with content
+    hash `art_digest`."""
+    return manifest.signature(
+        art=art_digest, episode={field: episode.get(field) for field in CARD_FIELDS}, **shared)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the social preview cards")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every card, even if it's up to date")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="render cards in N processes (0 = one per core; default 1)")
+    args = parser.parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+
     if not os.path.exists(EPISODES_JSON):
         print("No public/episodes.json — run scripts/fetch-episodes.js first")
         return 1
 
-    with open(EPISODES_JSON, encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = run_cache.shared().json(EPISODES_JSON)
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    mark = show_mark(MARK, 15)
 
-    made = sum(write_episode_card(ep, mark) for ep in data.get("episodes", []))
-    print(f"Generated {made} share cards in public/episode-share/")
-    if write_show_card():
-        print("Generated public/brand/share-card.jpg")
-    return 0
+    manifest = BuildManifest(force=args.force)
+    shared = template_inputs(manifest)
+    accents = AccentCache(state_path("accents.json"))
+
+    made, stale = 0, {}
+    for episode in data.get("episodes", []):
+        if not os.path.exists(art_path(episode)):
+            continue
+        signature = card_signature(manifest, shared, episode, manifest.digest(art_path(episode)))
+        made += 1
+        if not manifest.is_current(card_path(episode), signature):
+            stale[episode["slug"]] = (episode, signature)
+
+    failed = []
+    cards = [(episode, accents.get(manifest.digest(art_path(episode))))
+             for episode, _ in stale.values()]
+    for episode, key, error in render_cards(cards, jobs):
+        if error is None and key is None:
+            # The art went away between planning and rendering: no card
+            error = FileNotFoundError(f"no art at {art_path(episode)}")
+        if error is None:
+            manifest.record(card_path(episode), stale[episode["slug"]][1])
+            accents.put(manifest.digest(art_path(episode)), key)
+        else:
+            failed.append((episode, error))
+    print(f"Generated {made - len(failed)} share cards in public/episode-share/ "
+          f"({manifest.built} rendered, {manifest.skipped} up to date)")
+    for episode, error in failed:
+        print(f"  ❌ {episode['slug']}: {error}")
+
+    cover_digest = manifest.digest(SHOW_COVER)
+    # No byline on the site card, so the mark isn't one of its inputs
+    signature = manifest.signature(cover=cover_digest, **{
+        name: value for name, value in shared.items() if name != "mark"})
+    if manifest.is_current(SHOW_CARD, signature):
+        print("public/brand/share-card.jpg is up to date")
+    else:
+        key = write_show_card(accents.get(cover_digest))
+        if key:
+            manifest.record(SHOW_CARD, signature)
+            accents.put(cover_digest, key)
+            print("Generated public/brand/share-card.jpg")
+    manifest.save()
+    accents.save()
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
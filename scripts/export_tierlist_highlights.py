@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Exports a tier list per episode that picks out the episode's game, for the
+episode pages: the same tiers as public/tierlist.png with every other tile
+dimmed (or, with --style outline, just an outline around the game's tile).
+
+Built with TierListGenerator.generate_highlights: the tier list is composed
+once and each variant only patches its game's tile on a copy, so all of them
+together cost a small multiple of one tier list render. The tiers are the
+ones the updater last rendered (scripts/.cache/render_manifest.json), so run
+it after the tier list stage; episodes are matched to tier list games by name
+and aliases.json, as for the episode art, and each episode gets its own image
+even when another episode covers the same game.
+
+Only variants whose inputs changed (the tier list, its art, the style, this
+code) are rewritten; see build_manifest.py.
+
+    python scripts/export_tierlist_highlights.py [--style dim|outline] [--jobs N] [--force]
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+import aliases  # noqa: E402
+import run_cache  # noqa: E402
+from build_manifest import BuildManifest, code_version, pillow_version  # noqa: E402
+from export_episode_art import CapsuleIndex  # noqa: E402
+from tier_list_generator import HIGHLIGHT_JPEG, HIGHLIGHT_STYLES, TierListGenerator  # noqa: E402
+
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+EPISODES_JSON = os.path.join(REPO_ROOT, "public", "episodes.json")
+TIERLIST = os.path.join(REPO_ROOT, "public", "tierlist.png")
+RENDER_MANIFEST = os.path.join(SCRIPTS_DIR, ".cache", "render_manifest.json")
+OUTPUT_DIR = os.path.join(REPO_ROOT, "public", "tierlist-highlights")
+# Where the generator runs: its caches (steam_images/, .cache/) are relative
+GENERATOR_DIR = SCRIPTS_DIR
+
+
+def rendered_tiers():
+    """The tiers the updater last rendered to public/tierlist.png, or None."""
+    if not os.path.exists(RENDER_MANIFEST):
+        return None
+    signature = run_cache.shared().json(RENDER_MANIFEST).get(os.path.abspath(TIERLIST))
+    return signature and signature.get('tiers')
+
+
+def episode_games(episodes, tiers):
+    """{episode slug: tier list game} for the episodes whose game is on the
+    tier list, matched on any name CapsuleIndex.candidates() gives the
+    title. Several episodes can share a game."""
+    registry = aliases.registry()
+    by_key = {registry.key(game): game for games in tiers.values() for game in games}
+    matched = {}
+    for episode in episodes:
+        for name in CapsuleIndex.candidates(episode["title"]):
+            game = by_key.get(registry.key(name))
+            if game is not None:
+                matched[episode["slug"]] = game
+                break
+    return matched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export per-episode highlighted tier lists")
+    parser.add_argument("--style", choices=HIGHLIGHT_STYLES, default="dim")
+    parser.add_argument("--force", action="store_true",
+                        help="rewrite every variant, even if it's up to date")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="encode variants in N processes (0 = one per core; default 1)")
+    args = parser.parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    if not os.path.exists(EPISODES_JSON):
+        print("No public/episodes.json — run scripts/fetch-episodes.js first")
+        return 1
+    tiers = rendered_tiers()
+    if not tiers:
+        print("No rendered tier list in .cache/render_manifest.json — run the updater first")
+        return 1
+
+    os.chdir(GENERATOR_DIR)
+    generator = TierListGenerator()
+    matched = episode_games(run_cache.shared().json(EPISODES_JSON).get("episodes", []), tiers)
+
+    manifest = BuildManifest(force=args.force)
+    render = generator.render_signature(tiers)
+    version = code_version(os.path.abspath(__file__),
+                           os.path.join(SCRIPTS_DIR, "tier_list_generator.py"))
+    pillow = pillow_version()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    stale = {}  # output: (game, signature)
+    for slug, game in matched.items():
+        output = os.path.join(OUTPUT_DIR, f"{slug}.jpg")
+        signature = manifest.signature(render=render, game=game, style=args.style,
+                                       encoder=HIGHLIGHT_JPEG, code=version, pillow=pillow)
+        if not manifest.is_current(output, signature):
+            stale[output] = (game, signature)
+
+    if stale:
+        written = generator.generate_highlights(
+            tiers, {output: game for output, (game, _) in stale.items()},
+            style=args.style, jobs=jobs)
+        for output in written:
+            manifest.record(output, stale[output][1])
+    manifest.save()
+    print(f"Exported {len(matched)} highlighted tier lists to public/tierlist-highlights/ "
+          f"({manifest.built} written, {manifest.skipped} up to date)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,7 @@ const ACAST_SHOW_ID = '670c223adf4dd6f896322012';
 const APPLE_ID = '1774367401';
 const APPLE_LOOKUP = `https://itunes.apple.com/lookup?id=${APPLE_ID}&entity=podcastEpisode&limit=200`;
 const OUTPUT_FILE = path.join(__dirname, '../public/episodes.json');
+const ART_META_FILE = path.join(__dirname, '../public/episode-art.json');
 
 /** Boilerplate the hosts append to every episode description. */
 const BOILERPLATE = [
@@ -188,6 +189,12 @@ async function main() {
   }
 
   const appleUrls = await fetchAppleUrls();
+  /*
+   * Pixel size, dominant colour and a tiny inline placeholder for each
+   * exported art file, written by export_episode_art.py alongside the WebPs,
+   * so cards hold their shape and colour while the art loads.
+   */
+  const artMeta = readJson(ART_META_FILE) || {};
   const now = Date.now();
   const items = xml.match(/<item>[\s\S]*?<\/item>/g) || [];
 
@@ -199,6 +206,7 @@ async function main() {
       const guid = tag(item, 'guid');
       const blocks = describe(tag(item, 'description'));
       const slug = slugify(title);
+      const art = assetFor('episode-art', slug, 'webp');
 
       /*
        * Lead the description with "A Podcast Review of <Game>: ..." for search.
@@ -231,7 +239,8 @@ async function main() {
         embed: guid ? `https://embed.acast.com/${ACAST_SHOW_ID}/${guid}` : null,
         audio: attr(item, 'enclosure', 'url'),
         apple: appleUrls[guid] || null,
-        art: assetFor('episode-art', slug, 'webp'),
+        art,
+        artMeta: (art && artMeta[slug]) || null,
         share: assetFor('episode-share', slug, 'jpg'),
         blurb: firstProse ? firstProse.text : '',
         blocks,
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Bounds the Steam traffic of one run: a run deadline and a circuit breaker
+per host.
+
+Every Steam request the tier list generator makes goes through one
+HttpGuard. A timeout, a connection error or a 5xx/429 response counts as a
+failure against the request's host; after FAILURES_TO_TRIP of them in a row
+that host's breaker opens, and for COOLDOWN_S the guard refuses its requests
+outright (raising Offline) instead of waiting out another timeout. Other
+hosts are still asked. After the cooldown a single trial request is let
+through, and the host's other requests are refused while it's out: success
+closes the breaker, a failure opens it again.
+
+Once the deadline has passed, or the breaker of an essential host is open
+(ESSENTIAL_HOSTS: storesearch, without which no game can be looked up), the
+guard is `degraded` and refuses every request; the generator then renders
+from what's cached (see TierListGenerator.get_game_tile_image) and reports
+the tiles it drew that way. Timeouts are clamped to the time left before the
+deadline, so one slow request can't run past it. A guard made with offline=True refuses
+everything from the start, for callers that must never reach Steam.
+
+requests is imported on the first request, so importing this is free.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+FAILURES_TO_TRIP = 3
+COOLDOWN_S = 300
+# Hosts a run can't do without: while one's breaker is open, the guard refuses
+# every host's requests
+ESSENTIAL_HOSTS = ('store.steampowered.com',)
+
+
+class Offline(Exception):
+    """A request the guard refused: the deadline passed, a breaker is open
+    or the guard is offline."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one host. Not thread-safe on its
+    own; HttpGuard holds its lock around every call."""
+
+    def __init__(self, failures_to_trip=FAILURES_TO_TRIP, cooldown_s=COOLDOWN_S):
+        self.failures_to_trip = failures_to_trip
+        self.cooldown_s = cooldown_s
+        self.failures = 0        # in a row
+        self.opened_at = None    # clock time it last opened, None while closed
+        self.probing = False     # a half-open trial request is out
+        self.trips = 0
+
+    def is_open(self, now):
+        """Open, and still cooling down. A breaker past its cooldown is
+        half-open: it lets one trial request through (see admit())."""
+        return self.opened_at is not None and now - self.opened_at < self.cooldown_s
+
+    def admit(self, now):
+        """Whether a request may go out now. Past the cooldown only the first
+        caller is admitted, as the trial; everyone else is refused until it
+        has an answer."""
+        if self.opened_at is None:
+            return True
+        if self.is_open(now) or self.probing:
+            return False
+        self.probing = True
+        return True
+
+    def succeeded(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def failed(self, now):
+        self.probing = False
+        self.failures += 1
+        half_open = self.opened_at is not None
+        if half_open or self.failures >= self.failures_to_trip:
+            self.opened_at = now
+            self.trips += 1
+
+
+class HttpGuard:
+    def __init__(self, deadline_s=None, failures_to_trip=FAILURES_TO_TRIP,
+                 cooldown_s=COOLDOWN_S, clock=time.monotonic, offline=False,
+                 essential_hosts=ESSENTIAL_HOSTS):
+        self.offline = offline
+        self.essential_hosts = frozenset(essential_hosts)
+        self.failures_to_trip = failures_to_trip
+        self.cooldown_s = cooldown_s
+        self.clock = clock
+        self.breakers = {}  # host -> CircuitBreaker
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.refused = 0
+        self.begin(deadline_s)
+
+    def begin(self, deadline_s=None):
+        """Start a run: the deadline is `deadline_s` seconds from now (None
+        for no deadline). Breakers carry over from earlier runs, so a host
+        that just failed stays refused until its cooldown is up."""
+        with self._lock:
+            self.deadline_s = deadline_s
+            self.deadline = None if deadline_s is None else self.clock() + deadline_s
+
+    @property
+    def degraded(self):
+        """True once the deadline has passed or an essential host's breaker
+        is open, and always when offline. An open breaker on any other host
+        refuses only that host's requests."""
+        with self._lock:
+            return self._degraded(self.clock())
+
+    def _degraded(self, now):
+        return (self.offline
+                or (self.deadline is not None and now >= self.deadline)
+                or any(breaker.is_open(now) for host, breaker in self.breakers.items()
+                       if host in self.essential_hosts))
+
+    @property
+    def trouble(self):
+        """Failed plus refused requests so far. Compare before and after a
+        piece of work to see whether it ran into any."""
+        with self._lock:
+            return self.failures + self.refused
+
+    def get(self, url, timeout, **kwargs):
+        """requests.get(), or Offline if the guard won't let it through.
+        Responses are returned whatever their status, as requests does;
+        only the breaker looks at it."""
+        return self._send('get', url, timeout, **kwargs)
+
+    def head(self, url, timeout, **kwargs):
+        """requests.head(), as get()."""
+        return self._send('head', url, timeout, **kwargs)
+
+    def _send(self, method, url, timeout, **kwargs):
+        import requests
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            now = self.clock()
+            breaker = self.breakers.setdefault(
+                host, CircuitBreaker(self.failures_to_trip, self.cooldown_s))
+            if self._degraded(now):
+                self.refused += 1
+                raise Offline(self._reason(now))
+            if not breaker.admit(now):
+                self.refused += 1
+                raise Offline(f"circuit open for {host}")
+            if self.deadline is not None:
+                timeout = min(timeout, self.deadline - now)
+            self.requests += 1
+
+        try:
+            response = getattr(requests, method)(url, timeout=timeout, **kwargs)
+        except Exception:
+            # Not only RequestException: whatever a request raises counts, so
+            # a trial can't leave its breaker waiting for an answer forever
+            self._failed(breaker)
+            raise
+        if response.status_code >= 500 or response.status_code == 429:
+            self._failed(breaker)
+        else:
+            with self._lock:
+                breaker.succeeded()
+        return response
+
+    def _failed(self, breaker):
+        with self._lock:
+            self.failures += 1
+            breaker.failed(self.clock())
+
+    def _reason(self, now):
+        """Why requests are being refused, or None if none are."""
+        if self.offline:
+            return "offline: this guard makes no requests"
+        if self.deadline is not None and now >= self.deadline:
+            return f"run deadline ({self.deadline_s:g}s) passed"
+        hosts = sorted(host for host, breaker in self.breakers.items() if breaker.is_open(now))
+        return f"circuit open for {', '.join(hosts)}" if hosts else None
+
+    def snapshot(self):
+        """Counters, the deadline and each host's breaker state, as plain JSON."""
+        with self._lock:
+            now = self.clock()
+            return {
+                'degraded': self._degraded(now),
+                'reason': self._reason(now),
+                'deadline_s': self.deadline_s,
+                'remaining_s': (None if self.deadline is None
+                                else round(max(0.0, self.deadline - now), 3)),
+                'requests': self.requests,
+                'failures': self.failures,
+                'refused': self.refused,
+                'hosts': {host: {'open': breaker.is_open(now),
+                                 'probing': breaker.probing,
+                                 'failures_in_a_row': breaker.failures,
+                                 'trips': breaker.trips}
+                          for host, breaker in sorted(self.breakers.items())},
+            }
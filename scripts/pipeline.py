@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Runs the image stages of the weekly update in one process:
+
+1. tierlist — automated_tierlist_updater.py (public/tierlist.png)
+2. art      — export_episode_art.py (public/episode-art/)
+3. cards    — export_share_cards.py (public/episode-share/, public/brand/)
+
+Each stage calls the same code as running its script, so the outputs are
+byte-identical either way. What running them together saves is the repeated
+startup: PIL is imported once, and capsules, fonts and public/episodes.json
+go through one shared in-memory cache (run_cache.py) instead of being decoded
+again by every process.
+
+The art stage reads public/episodes.json, so run scripts/fetch-episodes.js
+first. CI runs:
+
+    node scripts/fetch-episodes.js
+    python scripts/pipeline.py --incremental --optional art,cards --jobs 0
+
+Pick stages with --stages (e.g. `--stages art,cards` after a feed-only
+change). Stages always run in the order above. The art and card stages only
+rebuild outputs whose inputs changed (build_manifest.py); --force rebuilds
+them all.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import run_cache  # noqa: E402
+
+STAGES = ('tierlist', 'art', 'cards')
+
+
+def run_tierlist(args):
+    from automated_tierlist_updater import AutomatedTierListUpdater
+
+    updater = AutomatedTierListUpdater(verbose=args.verbose, credentials_path=args.credentials)
+    return updater.update_tier_list(
+        output_path=args.output,
+        save_debug=args.debug,
+        incremental=args.incremental,
+        deadline=args.deadline
+    )
+
+
+def run_art(args):
+    import export_episode_art
+    return export_episode_art.main(['--force'] if args.force else []) == 0
+
+
+def run_cards(args):
+    import export_share_cards
+    argv = ['--jobs', str(args.jobs)] + (['--force'] if args.force else [])
+    return export_share_cards.main(argv) == 0
+
+
+RUNNERS = {'tierlist': run_tierlist, 'art': run_art, 'cards': run_cards}
+
+
+def stage_list(value):
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+    return names
+
+
+def run_pipeline(stages, args, optional=()):
+    """Run `stages` in pipeline order. A required stage failing stops the
+    run; an optional one is reported and the run carries on (the later stages
+    fall back to whatever is already on disk). Returns True if no required
+    stage failed."""
+    ok = True
+    cache = run_cache.shared()
+    for name in STAGES:
+        if name not in stages:
+            continue
+        print(f"\n━━ {name} ━━")
+        start = time.perf_counter()
+        try:
+            passed = RUNNERS[name](args)
+        except Exception as e:
+            print(f"❌ {name} stage raised: {e}")
+            passed = False
+        elapsed = time.perf_counter() - start
+        print(f"━━ {name}: {'done' if passed else 'FAILED'} in {elapsed:.1f}s ━━")
+
+        if not passed:
+            if name in optional:
+                print(f"⚠️ {name} is optional — continuing")
+            else:
+                ok = False
+                break
+
+    print(f"\nShared cache: {cache.hits} hits, {cache.misses} misses")
+    print(f"Process: {run_cache.format_process_stats()}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the tier list, episode art and share card stages in one process')
+    parser.add_argument('--stages', type=stage_list, default=list(STAGES),
+                        help=f"comma-separated stages to run (default: {','.join(STAGES)})")
+    parser.add_argument('--optional', type=stage_list, default=[],
+                        help='stages whose failure is reported but does not fail the run')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Verbose tier list output')
+    parser.add_argument('--debug', action='store_true',
+                        help='Save tier list debug info to scripts/debug/')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Incremental episode ingestion (see automated_tierlist_updater.py)')
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help='Seconds of Steam traffic the tier list stage may spend before '
+                             'drawing the remaining tiles from cached art')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild all episode art and share cards, even if up to date')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Render share cards in N processes (0 = one per core)')
+    parser.add_argument('--credentials', default='credentials.json',
+                        help='Google API credentials file, relative to scripts/')
+    parser.add_argument('--output', default='../public/tierlist.png',
+                        help='Tier list output path, relative to scripts/')
+    args = parser.parse_args()
+
+    # The tier list code resolves its caches relative to scripts/
+    os.chdir(SCRIPTS_DIR)
+
+    if run_pipeline(args.stages, args, optional=args.optional):
+        print("\n🎉 Pipeline completed successfully!")
+        return 0
+    print("\n💥 Pipeline failed!")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Shared by the local HTTP services (share_card_server.py, tierlist_server.py):
+an in-memory LRU of encoded responses, bounded by bytes, in which concurrent
+requests for the same key wait on one build instead of each starting their
+own; and the latency percentiles they report on /metrics.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+LATENCY_WINDOW = 1000
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of `values`, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+class ResponseCache:
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> bytes, least recent first
+        self._bytes = 0
+        self._inflight = {}            # key -> Future of the bytes
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """(bytes, how) for `key`, calling build() on a miss. `how` is
+        "memory", "coalesced" (another request was already building it; this
+        one waited for its result) or "built". A build's exception is raised
+        in every request that waited on it, and nothing is cached."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key], "memory"
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result(), "coalesced"
+
+        try:
+            data = build()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._remember(key, data)
+            del self._inflight[key]
+        future.set_result(data)
+        return data, "built"
+
+    def _remember(self, key, data):
+        if len(data) > self.budget_bytes:
+            return  # too big to keep; don't evict everything for it
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.budget_bytes:
+            _, dropped = self._entries.popitem(last=False)
+            self._bytes -= len(dropped)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        with self._lock:
+            return self._bytes
+
+
+class LatencyLog:
+    """The last LATENCY_WINDOW durations (ms) of each named step."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, ms):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(ms)
+
+    def values(self, name):
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def summary(self):
+        """{name: {"count", "p50_ms", "p95_ms"}} over the window."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        return {name: {"count": len(values),
+                       "p50_ms": round(percentile(values, 0.5), 1),
+                       "p95_ms": round(percentile(values, 0.95), 1)}
+                for name, values in samples.items()}
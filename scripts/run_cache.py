@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+In-memory cache shared by everything that runs in one process.
+
+The tier list, episode art and share card stages all read the same inputs:
+Steam capsules, fonts, public/episodes.json. Run separately, each process
+decodes them again. Run together (pipeline.py), they share one RunCache, so
+each capsule is decoded once, each font size is loaded once, and so on.
+
+Entries for files are keyed on the file's path, size and mtime, so a file
+rewritten during the run (e.g. a capsule re-downloaded) is read again rather
+than served stale. Cached images are shared, not copied: treat them as
+read-only (resize/convert/copy return new images; paste/draw onto a copy).
+"""
+
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+# Decoded 600x900 capsules are ~1.6MB each; this holds a season's worth twice over
+DEFAULT_BUDGET_BYTES = 512 * 1024 * 1024
+
+
+class RunCache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> (value, cost), least recent first
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build, cost=0):
+        """The cached value for `key`, calling build() to make it on a miss.
+        `cost` (bytes, or a callable taking the value) counts against the
+        budget; least recently used entries are dropped to stay under it.
+
+        build() runs outside the lock so threads can decode in parallel; two
+        threads missing on the same key at once may both build it.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        value = build()
+        size = cost(value) if callable(cost) else cost
+        if size > self.budget_bytes:
+            return value  # too big to keep; don't evict everything for it
+        with self._lock:
+            if key in self._entries:
+                return value
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.budget_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self.evictions += 1
+            return value
+
+    def discard(self, key):
+        """Drop `key`'s entry, if there is one."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        with self._lock:
+            return self._bytes
+
+    def stats(self):
+        """Entries, bytes held, budget and hit/miss/eviction counts."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes,
+                    "budget_bytes": self.budget_bytes, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
+
+    @staticmethod
+    def _file_key(kind, path, *extra):
+        stat = os.stat(path)
+        return (kind, os.path.abspath(path), stat.st_size, stat.st_mtime_ns) + extra
+
+    def image(self, path):
+        """A decoded image, in the mode it's stored in."""
+        return self.get(self._file_key('image', path), lambda: load_image(path),
+                        cost=image_bytes)
+
+    def resized(self, path, size, mode=None):
+        """The image at `path`, optionally converted to `mode`, then LANCZOS
+        resized to `size` — the same pixels as doing it by hand."""
+        from PIL import Image
+
+        def build():
+            img = self.image(path)
+            if mode:
+                img = img.convert(mode)
+            return img.resize(size, Image.LANCZOS)
+
+        return self.get(self._file_key('resized', path, tuple(size), mode), build,
+                        cost=image_bytes)
+
+    def font(self, path, size, variation=None):
+        """A TrueType font at `size`, with a named variation (e.g. "Bold") set."""
+        from PIL import ImageFont
+
+        def load():
+            font = ImageFont.truetype(path, size)
+            if variation:
+                font.set_variation_by_name(variation)
+            return font
+
+        return self.get(self._file_key('font', path, size, variation), load)
+
+    def json(self, path):
+        """Parsed JSON. Shared, so don't mutate it."""
+        def load():
+            with open(path, encoding='utf-8') as handle:
+                return json.load(handle)
+
+        return self.get(self._file_key('json', path), load)
+
+
+def load_image(path):
+    """The image at `path`, decoded, with its file already closed. Unlike a
+    bare Image.open(), which holds the file open until the image is loaded
+    or garbage collected."""
+    from PIL import Image
+    with Image.open(path) as img:
+        img.load()
+    return img
+
+
+def process_stats():
+    """Peak resident memory (bytes) and open file descriptors of this
+    process, for run summaries and /metrics. Either is None where the
+    platform can't say."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak *= 1 if sys.platform == 'darwin' else 1024  # bytes on macOS, KiB elsewhere
+    except ImportError:
+        peak = None
+    for fd_dir in ('/proc/self/fd', '/dev/fd'):
+        try:
+            fds = len(os.listdir(fd_dir)) - 1  # less the one listing the directory
+            break
+        except OSError:
+            continue
+    else:
+        fds = None
+    return {"peak_rss_bytes": peak, "open_fds": fds}
+
+
+def format_process_stats(stats=None):
+    """process_stats() as one line, e.g. "peak RSS 212.4MB, 9 open files"."""
+    stats = stats or process_stats()
+    parts = []
+    if stats["peak_rss_bytes"] is not None:
+        parts.append(f"peak RSS {stats['peak_rss_bytes'] / 1024 / 1024:.1f}MB")
+    if stats["open_fds"] is not None:
+        parts.append(f"{stats['open_fds']} open files")
+    return ", ".join(parts) or "no process stats on this platform"
+
+
+def image_bytes(img):
+    """What a decoded image costs against a budget."""
+    return img.width * img.height * len(img.getbands())
+
+
+_shared = RunCache()
+
+
+def shared():
+    """The process-wide cache every stage uses."""
+    return _shared
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+On-demand share cards: a small local HTTP service that renders
+/episode-share/<slug>.jpg when it's asked for, rather than when the batch job
+last ran.
+
+A freshly published episode otherwise previews with the generic card until
+the next cron run exports its art and card. Here the card is drawn with
+export_share_cards' template from public/episodes.json (re-read whenever
+fetch-episodes.js rewrites it) and the episode's art — public/episode-art/
+if it's been exported, otherwise the capsule in scripts/steam_images/,
+sized the way export_episode_art would.
+
+Each request is answered from, in order:
+
+1. memory: an LRU of encoded cards, bounded by `memory_bytes` (see request_cache.py)
+2. the batch output, public/episode-share/<slug>.jpg, if the build manifest
+   says it's current for the same inputs
+3. disk: scripts/.cache/share-cards/, cards this service rendered before
+4. a render
+
+All keyed on the card's build signature (see export_share_cards.card_signature),
+so an edited title or new art is a new card, never a stale one. Concurrent
+requests for the same card wait on one render instead of starting their own.
+
+    python scripts/share_card_server.py [--port 8788] [--memory-mb 64]
+
+    /episode-share/<slug>.jpg  the card; 404 for an unknown slug or no art
+    /healthz                   200
+    /metrics                   where requests were answered from, and p50/p95
+                               latency over the last 1000 requests
+
+`python3 bench_share_card_server.py` checks the p95 targets.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import export_episode_art  # noqa: E402
+import export_share_cards as cards  # noqa: E402
+import run_cache  # noqa: E402
+from build_manifest import BuildManifest, file_digest, state_path  # noqa: E402
+from request_cache import LatencyLog, ResponseCache, percentile  # noqa: E402
+
+# 8787 is --watch's health port
+DEFAULT_PORT = 8788
+# A card is ~150KB encoded, so this holds a few hundred
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+CARD_PATH = re.compile(r"^/episode-share/([a-z0-9-]+)\.jpg$")
+
+
+class ShareCardServer:
+    def __init__(self, memory_bytes=DEFAULT_MEMORY_BYTES, cache_dir=None):
+        self.cache_dir = cache_dir or state_path("share-cards")
+        self.memory = ResponseCache(memory_bytes)   # signature -> JPEG bytes
+        self._digests = {}             # (path, size, mtime) -> sha256
+        self._lock = threading.Lock()
+        # One render at a time: the fonts are shared FreeType faces, which
+        # aren't safe to draw with from two threads at once
+        self._render_lock = threading.Lock()
+        self._mark = None
+        self._index = None
+        self._manifest = BuildManifest()   # for signatures; is_current reloads
+        self._shared = None
+        self.latencies = LatencyLog()
+        self.counts = {"memory": 0, "batch": 0, "disk": 0, "rendered": 0,
+                       "coalesced": 0, "not_found": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def _digest(self, path):
+        """file_digest, memoized per (path, size, mtime)."""
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._digests:
+                return self._digests[key]
+        digest = file_digest(path)
+        with self._lock:
+            self._digests[key] = digest
+        return digest
+
+    def episode(self, slug):
+        if not os.path.exists(cards.EPISODES_JSON):
+            return None
+        for episode in run_cache.shared().json(cards.EPISODES_JSON).get("episodes", []):
+            if episode.get("slug") == slug:
+                return episode
+        return None
+
+    def art_source(self, episode):
+        """(path, True if it's the exported art or False for a raw capsule),
+        or None if the episode has neither."""
+        exported = cards.art_path(episode)
+        if os.path.exists(exported):
+            return exported, True
+        capsule = self._index.find(episode["title"]) if self._index else None
+        if capsule is None:
+            # Rescan: the tier list stage may have downloaded it since
+            self._index = export_episode_art.CapsuleIndex(export_episode_art.CACHE_DIR)
+            capsule = self._index.find(episode["title"])
+        return (capsule, False) if capsule else None
+
+    def _template(self):
+        if self._shared is None:
+            self._shared = cards.template_inputs(self._manifest)
+        return self._shared
+
+    # ------------------------------------------------------------------
+    # Cards
+    # ------------------------------------------------------------------
+
+    def card(self, slug):
+        """(JPEG bytes, signature) of `slug`'s card, or None if there's no such
+        episode or no art for it."""
+        episode = self.episode(slug)
+        source = episode and self.art_source(episode)
+        if not source:
+            self._count("not_found")
+            return None
+        path, exported = source
+        signature = cards.card_signature(self._manifest, self._template(), episode,
+                                         self._digest(path))
+
+        def build():
+            try:
+                data, where = self._load_or_render(episode, path, exported, signature)
+            except Exception:
+                self._count("errors")
+                raise
+            self._count(where)
+            return data
+
+        data, how = self.memory.get(signature, build)
+        if how != "built":
+            self._count(how)
+        return data, signature
+
+    def _load_or_render(self, episode, path, exported, signature):
+        """(JPEG bytes, where they came from) for a card not in memory."""
+        batch = cards.card_path(episode)
+        if exported and BuildManifest().is_current(batch, signature):
+            with open(batch, "rb") as handle:
+                return handle.read(), "batch"
+
+        cached = os.path.join(self.cache_dir, f"{episode['slug']}-{signature[:16]}.jpg")
+        if os.path.exists(cached):
+            with open(cached, "rb") as handle:
+                return handle.read(), "disk"
+
+        data = self.render(episode, path, exported)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{cached}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, cached)
+        return data, "rendered"
+
+    def render(self, episode, path, exported):
+        from PIL import Image
+        with self._render_lock:
+            if exported:
+                with Image.open(path) as src:
+                    art = src.convert("RGB")
+            else:
+                capsule = run_cache.shared().image(path)
+                height = round(capsule.height * export_episode_art.TARGET_WIDTH / capsule.width)
+                art = run_cache.shared().resized(
+                    path, (export_episode_art.TARGET_WIDTH, height), mode="RGB")
+            if self._mark is None:
+                self._mark = cards.show_mark(cards.MARK, 15)
+            card, _ = cards.episode_card(episode, art, self._mark, digest=self._digest(path))
+            return cards.encode(card)
+
+    def _count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def snapshot(self):
+        with self._lock:
+            metrics = dict(self.counts)
+        metrics["memory_cards"] = len(self.memory)
+        metrics["memory_bytes"] = self.memory.size_bytes
+        latencies = self.latencies.values("request")
+        for name, fraction in (("p50_ms", 0.5), ("p95_ms", 0.95)):
+            value = percentile(latencies, fraction)
+            metrics[name] = None if value is None else round(value, 1)
+        metrics["process"] = run_cache.process_stats()
+        return metrics
+
+    def serve(self, port=DEFAULT_PORT, host="127.0.0.1"):
+        """Serve cards from a daemon thread. Returns the server (port 0 picks a
+        free port: see server.server_address)."""
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                started = time.perf_counter()
+                match = CARD_PATH.match(self.path.split("?")[0])
+                if match:
+                    try:
+                        found = service.card(match.group(1))
+                    except Exception as e:
+                        self.reply(500, "application/json",
+                                   json.dumps({"error": str(e)}).encode("utf-8"))
+                        return
+                    if found is None:
+                        self.reply(404, "application/json", b'{"error": "no card"}')
+                        return
+                    data, signature = found
+                    etag = f'"{signature[:32]}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.reply(304, None, b"", etag)
+                    else:
+                        self.reply(200, "image/jpeg", data, etag)
+                    service.latencies.record("request", (time.perf_counter() - started) * 1000)
+                elif self.path == "/healthz":
+                    self.reply(200, "application/json", b'{"status": "ok"}')
+                elif self.path == "/metrics":
+                    self.reply(200, "application/json",
+                               json.dumps(service.snapshot(), indent=2).encode("utf-8"))
+                else:
+                    self.reply(404, "application/json", b'{"error": "not found"}')
+
+            def reply(self, status, content_type, payload, etag=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                if etag:
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", "public, max-age=300")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve share cards on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_BYTES // (1024 * 1024),
+                        help="in-memory card cache budget (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    server = ShareCardServer(memory_bytes=args.memory_mb * 1024 * 1024).serve(args.port, args.host)
+    host, port = server.server_address[:2]
+    print(f"Serving share cards on http://{host}:{port}/episode-share/<slug>.jpg")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Offline tests for the alias registry (aliases.json / aliases.py).
+
+Run with:
+
+    cd scripts && python3 test_aliases.py
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from aliases import REGISTRY_PATH, AliasRegistry
+
+VAMPIRE = "Vampire Crawlers: The Turbo Wildcard from Vampire Survivors"
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_lookups():
+    print("Lookups:")
+    ok = True
+    reg = AliasRegistry.load()
+    ok &= check(reg.tier_name("Spelunky HD") == "Spelunky"
+                and reg.tier_name(VAMPIRE) == "Vampire Crawlers",
+                "episode titles map to the doc's name")
+    ok &= check(reg.tier_name("spelunky  hd!") == "Spelunky",
+                "lookups ignore case, punctuation and spacing")
+    ok &= check(reg.tier_name("Balatro") == "Balatro", "unregistered names pass through")
+    ok &= check(reg.key(VAMPIRE) == reg.key("vampire crawlers"),
+                "both names of a game share one key, in either direction")
+    ok &= check(reg.app_id(VAMPIRE) == 3265700 and reg.app_id("Everything Is Crab") == 3526710
+                and reg.app_id("Balatro") is None,
+                "pinned app IDs resolve from any of a game's names")
+    return ok
+
+
+def test_validation():
+    print("Validation:")
+    ok = True
+    reg = AliasRegistry([
+        {"name": "Hades", "aliases": ["Hades II"]},
+        {"name": "Hades 2", "aliases": ["Hades II", "hades-2"], "steam_app_id": 1145350},
+        {"name": "Hades Deluxe", "steam_app_id": 1145350},
+        {"name": "Old Game", "aliases": ["Old Game Remastered"]},
+    ])
+    problems = reg.validate(episode_titles=["Hades", "Hades II", "Hades Deluxe"],
+                            cached_ids={"hades 2": 999})
+    joined = "\n".join(problems)
+    ok &= check("'Hades II' is claimed by both 'Hades' and 'Hades 2'" in joined,
+                "an alias claimed by two games is a conflict")
+    ok &= check("Steam app 1145350 is pinned for both" in joined,
+                "one app ID pinned for two games is a conflict")
+    ok &= check("game_ids.json caches 999" in joined,
+                "a pin that disagrees with game_ids.json is a conflict")
+    ok &= check("redundant: alias 'hades-2'" in joined,
+                "an alias that only differs in case/punctuation is flagged")
+    ok &= check("dead: 'Old Game' has no episode" in joined
+                and "dead: alias 'Old Game Remastered'" in joined,
+                "entries and aliases nothing uses are dead")
+    ok &= check(AliasRegistry.load().fingerprint != reg.fingerprint,
+                "the fingerprint (which keys the episode ledger) follows the contents")
+    return ok
+
+
+def test_repo_registry():
+    print("scripts/aliases.json:")
+    episodes_path = os.path.join(os.path.dirname(os.path.dirname(REGISTRY_PATH)),
+                                 "public", "episodes.json")
+    with open(episodes_path, encoding='utf-8') as handle:
+        titles = [episode['title'] for episode in json.load(handle)['episodes']]
+    problems = AliasRegistry.load().validate(episode_titles=titles)
+    return check(not problems, "no conflicting or dead entries" +
+                 (f" (got: {'; '.join(problems)})" if problems else ""))
+
+
+if __name__ == "__main__":
+    results = [
+        test_lookups(),
+        test_validation(),
+        test_repo_registry(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Offline tests for incremental episode art / share card builds, and the
+episode art sizes and placeholders.
+
+Points the exporters at a throwaway tree with synthetic capsules, so nothing
+in public/ or steam_images/ is touched. Run with:
+
+    cd scripts && python3 test_build_manifest.py
+"""
+
+import base64
+import io
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import build_manifest
+import export_episode_art
+import export_share_cards
+from build_manifest import BuildManifest
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_manifest():
+    print("Manifest:")
+    ok = True
+    root = tempfile.mkdtemp()
+    manifest_path = os.path.join(root, "build_manifest.json")
+    output = os.path.join(root, "out.jpg")
+    with open(output, "wb") as handle:
+        handle.write(b"v1")
+
+    manifest = BuildManifest(manifest_path)
+    signature = manifest.signature(source="abc", encoder={"quality": 90})
+    ok &= check(not manifest.is_current(output, signature), "unrecorded outputs are stale")
+    manifest.record(output, signature)
+    manifest.save()
+
+    manifest = BuildManifest(manifest_path)
+    ok &= check(manifest.is_current(output, signature), "recorded outputs are current after a reload")
+    ok &= check(not manifest.is_current(output, manifest.signature(source="abc",
+                                                                   encoder={"quality": 80})),
+                "a changed input makes it stale")
+    with open(output, "wb") as handle:
+        handle.write(b"edited by hand")
+    ok &= check(not manifest.is_current(output, signature),
+                "an output that isn't the file that was written is stale")
+    manifest.record(output, signature)
+    manifest.save()
+    ok &= check(BuildManifest(manifest_path).is_current(output, signature)
+                and not BuildManifest(manifest_path, force=True).is_current(output, signature),
+                "force treats everything as stale")
+    return ok
+
+
+def point_exporters_at(root):
+    public = os.path.join(root, "public")
+    cache_dir = os.path.join(root, "steam_images")
+    for path in (public, cache_dir):
+        os.makedirs(path)
+    export_episode_art.CACHE_DIR = cache_dir
+    export_episode_art.EPISODES_JSON = export_share_cards.EPISODES_JSON = \
+        os.path.join(public, "episodes.json")
+    export_episode_art.OUTPUT_DIR = export_share_cards.ART_DIR = \
+        os.path.join(public, "episode-art")
+    export_episode_art.META_JSON = os.path.join(public, "episode-art.json")
+    export_share_cards.OUTPUT_DIR = os.path.join(public, "episode-share")
+    export_share_cards.BRAND_DIR = os.path.join(public, "brand")
+    export_share_cards.SHOW_CARD = os.path.join(public, "brand", "share-card.jpg")
+    export_share_cards.SHOW_COVER = os.path.join(public, "brand", "cover-1080.webp")
+    build_manifest.MANIFEST_PATH = os.path.join(root, "build_manifest.json")
+    return public, cache_dir
+
+
+def write_episodes(public, episodes):
+    with open(os.path.join(public, "episodes.json"), "w", encoding="utf-8") as handle:
+        json.dump({"episodes": episodes}, handle)
+
+
+def settle(*directories):
+    """Backdate every output, so rebuilt() can tell what the next run wrote."""
+    for directory in directories:
+        for name in os.listdir(directory):
+            os.utime(os.path.join(directory, name), (1, 1))
+
+
+def rebuilt(directory):
+    return sorted(name for name in os.listdir(directory)
+                  if os.stat(os.path.join(directory, name)).st_mtime != 1)
+
+
+def test_incremental_exports():
+    print("Incremental exports:")
+    ok = True
+    saved = build_manifest.MANIFEST_PATH
+    root = tempfile.mkdtemp()
+    public, cache_dir = point_exporters_at(root)
+    try:
+        for name, color in (("Balatro", (200, 30, 30)), ("Spelunky", (30, 30, 200))):
+            Image.new("RGB", (600, 900), color).save(os.path.join(cache_dir, f"{name}_capsule.jpg"))
+        episodes = [{"title": "Balatro", "slug": "balatro", "number": 1, "duration": "1h"},
+                    {"title": "Spelunky", "slug": "spelunky", "number": 2, "duration": "1h"}]
+        write_episodes(public, episodes)
+
+        export_episode_art.main([])
+        export_share_cards.main([])
+        art, cards = os.path.join(public, "episode-art"), os.path.join(public, "episode-share")
+        ok &= check(rebuilt(art) == ["balatro.webp", "spelunky.webp"]
+                    and rebuilt(cards) == ["balatro.jpg", "spelunky.jpg"],
+                    "the first run builds everything")
+
+        settle(art, cards)
+        export_episode_art.main([])
+        export_share_cards.main([])
+        ok &= check(rebuilt(art) == [] and rebuilt(cards) == [],
+                    "a run with nothing new writes nothing")
+
+        episodes[1]["number"] = 3
+        episodes[0]["description"] = "Not drawn on the card"
+        write_episodes(public, episodes)
+        export_episode_art.main([])
+        export_share_cards.main([])
+        ok &= check(rebuilt(art) == [], "unchanged capsules aren't re-encoded")
+        ok &= check(rebuilt(cards) == ["spelunky.jpg"],
+                    "only the card whose drawn fields changed is re-rendered")
+
+        settle(art, cards)
+        Image.new("RGB", (600, 900), (30, 200, 30)).save(os.path.join(cache_dir, "Balatro_capsule.jpg"))
+        export_episode_art.main([])
+        export_share_cards.main([])
+        ok &= check(rebuilt(art) == ["balatro.webp"] and rebuilt(cards) == ["balatro.jpg"],
+                    "new capsule art rebuilds that episode's art and card")
+
+        settle(art, cards)
+        with open(os.path.join(cards, "spelunky.jpg"), "ab") as handle:
+            handle.write(b"\0")
+        export_share_cards.main([])
+        ok &= check(rebuilt(cards) == ["spelunky.jpg"], "a modified output is rebuilt")
+
+        settle(art, cards)
+        export_episode_art.main(["--force"])
+        export_share_cards.main(["--force"])
+        ok &= check(len(rebuilt(art)) == 2 and len(rebuilt(cards)) == 2,
+                    "--force rebuilds everything")
+    finally:
+        build_manifest.MANIFEST_PATH = saved
+    return ok
+
+
+def test_art_meta():
+    print("Art sizes and placeholders:")
+    ok = True
+    saved = build_manifest.MANIFEST_PATH, export_episode_art.art_meta
+    root = tempfile.mkdtemp()
+    public, cache_dir = point_exporters_at(root)
+    meta_json = os.path.join(public, "episode-art.json")
+    analysed = []
+    export_episode_art.art_meta = lambda img: analysed.append(img.size) or saved[1](img)
+    try:
+        capsule = Image.new("RGB", (600, 900), (200, 30, 30))
+        capsule.paste((240, 240, 240), (0, 0, 600, 200))
+        capsule.save(os.path.join(cache_dir, "Balatro_capsule.jpg"), quality=95)
+        Image.new("RGB", (600, 800), (30, 30, 200)).save(
+            os.path.join(cache_dir, "Spelunky_capsule.jpg"), quality=95)
+        write_episodes(public, [{"title": "Balatro", "slug": "balatro"},
+                                {"title": "Spelunky", "slug": "spelunky"},
+                                {"title": "No Art Yet", "slug": "no-art-yet"}])
+
+        export_episode_art.main([])
+        with open(meta_json, encoding="utf-8") as handle:
+            meta = json.load(handle)
+        ok &= check(sorted(meta) == ["balatro", "spelunky"], "one entry per exported WebP")
+        with Image.open(os.path.join(public, "episode-art", "spelunky.webp")) as webp:
+            size = list(webp.size)
+        ok &= check([meta["spelunky"]["width"], meta["spelunky"]["height"]] == size == [460, 613],
+                    "with the WebP's exact size")
+        red, green, blue = (int(meta["balatro"]["color"][i:i + 2], 16) for i in (1, 3, 5))
+        ok &= check(red > 180 and green < 60 and blue < 60,
+                    f"the dominant colour, not the average ({meta['balatro']['color']})")
+        prefix = "data:image/webp;base64,"
+        placeholder = meta["balatro"]["placeholder"]
+        with Image.open(io.BytesIO(base64.b64decode(placeholder[len(prefix):]))) as tiny:
+            ok &= check(placeholder.startswith(prefix) and tiny.size == (8, 12)
+                        and len(placeholder) < 300,
+                        f"and an 8px-wide placeholder ({len(placeholder)} characters)")
+
+        settle(public)
+        analysed.clear()
+        export_episode_art.main(["--force"])
+        ok &= check(analysed == [] and "episode-art.json" not in rebuilt(public),
+                    "re-encoding unchanged art reuses its placeholder and leaves the file alone")
+
+        Image.new("RGB", (600, 900), (30, 200, 30)).save(os.path.join(cache_dir, "Balatro_capsule.jpg"))
+        export_episode_art.main([])
+        with open(meta_json, encoding="utf-8") as handle:
+            ok &= check(analysed == [(460, 690)] and json.load(handle)["balatro"] != meta["balatro"],
+                        "new capsule art is analysed again")
+
+        os.remove(build_manifest.state_path("art_meta.json"))
+        settle(os.path.join(public, "episode-art"))
+        analysed.clear()
+        export_episode_art.main([])
+        ok &= check(len(analysed) == 2 and rebuilt(os.path.join(public, "episode-art")) == [],
+                    "a lost cache recomputes placeholders without re-encoding the WebPs")
+    finally:
+        build_manifest.MANIFEST_PATH, export_episode_art.art_meta = saved
+    return ok
+
+
+if __name__ == "__main__":
+    results = [
+        test_manifest(),
+        test_incremental_exports(),
+        test_art_meta(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Offline tests for export_episode_art's capsule index.
+
+Builds a throwaway capsule cache, so no network or real art is needed. Run
+with:
+
+    cd scripts && python3 test_capsule_index.py
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from export_episode_art import CapsuleIndex, find_capsule
+
+CACHED = ["Balatro", "Binding_of_Isaac", "Spelunky", "Vampire_Crawlers", "Slay_the_Spire"]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def make_cache(root):
+    for name in CACHED:
+        for suffix in ("_capsule.jpg", ".jpg"):
+            open(os.path.join(root, name + suffix), "wb").close()
+
+
+def test_resolution(root):
+    print("Resolution:")
+    ok = True
+    index = CapsuleIndex(root)
+    ok &= check(len(index.by_filename) == len(CACHED), "indexes only *_capsule.jpg files")
+    ok &= check(index.find("Balatro").endswith("Balatro_capsule.jpg"),
+                "exact filename guesses hit")
+    ok &= check(index.find("Spelunky HD").endswith("Spelunky_capsule.jpg")
+                and index.find("Vampire Crawlers: The Turbo Wildcard from Vampire Survivors")
+                .endswith("Vampire_Crawlers_capsule.jpg"),
+                "aliases.json names are tried first")
+    ok &= check(index.find("SLAY THE SPIRE!").endswith("Slay_the_Spire_capsule.jpg"),
+                "case and punctuation are ignored")
+    ok &= check(index.find("Binding of Isaac: Rebirth").endswith("Binding_of_Isaac_capsule.jpg"),
+                "subtitles after a colon are dropped")
+    ok &= check(index.find("Pathogenic") is None, "unknown games miss")
+    ok &= check(find_capsule("Balatro", index) == index.find("Balatro"),
+                "find_capsule resolves against a given index")
+    return ok
+
+
+def test_suggestions(root):
+    print("Miss suggestions:")
+    ok = True
+    index = CapsuleIndex(root)
+    ok &= check(index.suggest("The Binding of Isaac") == ["Binding_of_Isaac"],
+                "a near-miss suggests the closest cached capsule")
+    ok &= check(index.suggest("Slay the Spire 2")[:1] == ["Slay_the_Spire"],
+                "sequels point at the original")
+    ok &= check(index.suggest("Pathogenic") == [], "nothing close, no suggestions")
+    return ok
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        make_cache(tmp)
+        results = [
+            test_resolution(tmp),
+            test_suggestions(tmp),
+        ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Offline unit tests for the updater's inputs: episode ingestion, episode
+matching and the Google Doc cache.
+
+No network or Google credentials needed — these feed canned RSS, title lists
+and a fake Docs client straight into AutomatedTierListUpdater. Run with:
+
+    cd scripts && python3 test_episode_matching.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import automated_tierlist_updater
+from aliases import AliasRegistry
+from automated_tierlist_updater import AutomatedTierListUpdater, _max_weight_assignment
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>RoguePod LiteCast</title>
+<item><title>Pathogenic</title><guid>g48</guid><pubDate>Wed, 05 Aug 2026 09:00:00 GMT</pubDate></item>
+<item><title>Everything is Crab</title><guid>g47</guid><pubDate>Wed, 22 Jul 2026 09:00:00 GMT</pubDate></item>
+<item><title>Gambonanza</title><guid>g46</guid><pubDate>Wed, 08 Jul 2026 09:00:00 GMT</pubDate></item>
+<item><title>Spelunky HD</title><guid>g45</guid><pubDate>Wed, 24 Jun 2026 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+RELEASED = ["Balatro", "Slay the Spire", "Crypt of the NecroDancer", "Spelunky",
+            "Vampire Crawlers", "The Binding of Isaac: Rebirth", "Risk of Rain Returns",
+            "Hades", "Curious Expedition", "Bonus: Roguelikes, Roguelites, and Metaprogression"]
+TIER_GAMES = ["Balatro", "Slay the Spire", "Crypt of the Necrodancer", "Spelunky",
+              "Vampire Crawlers", "Binding of Isaac Rebirth", "Risk of Rain: Returns",
+              "Hades", "The Curious Expedition", "Hades 2", "Mewgenics"]
+
+
+def make_updater():
+    # Skip __init__: no Google client, no generator, ledger in a temp dir
+    u = AutomatedTierListUpdater.__new__(AutomatedTierListUpdater)
+    u.verbose = False
+    u.aliases = AliasRegistry([{"name": "Spelunky", "aliases": ["Spelunky HD"]}])
+    u.state_dir = tempfile.mkdtemp()
+    u.ledger_path = os.path.join(u.state_dir, "episode_ledger.json")
+    u.doc_cache_path = os.path.join(u.state_dir, "tier_doc.json")
+    u.google_doc_id = "doc"
+    u.docs_service = None
+    u.doc_revision_id = None
+    return u
+
+
+class FakeDocs:
+    """Stands in for docs_service; records the `fields` of each request."""
+
+    def __init__(self, revision, text):
+        self.revision, self.text, self.requests = revision, text, []
+
+    def documents(self):
+        return self
+
+    def get(self, documentId, fields=None):
+        self.requests.append(fields)
+        return self
+
+    def execute(self):
+        document = {'revisionId': self.revision}
+        if self.requests[-1] != 'revisionId':
+            document['body'] = {'content': [{'paragraph': {'elements': [
+                {'textRun': {'content': line + "\n"}}]}} for line in self.text]}
+        return document
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_feed_watermark(u):
+    print("Feed watermark:")
+    ok = True
+    full = u._parse_feed(io.BytesIO(FEED))
+    ok &= check([e['guid'] for e in full] == ["g48", "g47", "g46", "g45"],
+                "no watermark parses every item, newest first")
+    head = u._parse_feed(io.BytesIO(FEED), {"guid": "g47", "pub_date": "Wed, 22 Jul 2026 09:00:00 GMT"})
+    ok &= check([e['guid'] for e in head] == ["g48", "g47"],
+                "stops at (and includes) the watermark episode")
+    pulled = u._parse_feed(io.BytesIO(FEED), {"guid": "gone", "pub_date": "Wed, 15 Jul 2026 09:00:00 GMT"})
+    ok &= check([e['guid'] for e in pulled] == ["g48", "g47", "g46"],
+                "falls back to pubDate when the watermark episode was pulled")
+    return ok
+
+
+def test_ingestion_reuses_ledger(u):
+    print("Incremental ingestion:")
+    ok = True
+    feeds = [FEED]
+    u._fetch_calls = []
+
+    def fake_fetch(max_retries=3, watermark=None):
+        u._fetch_calls.append(watermark)
+        return u._parse_feed(io.BytesIO(feeds[0]), watermark)
+
+    u.fetch_rss_episodes = fake_fetch
+    ledger = u.load_ledger()
+    episodes = u.ingest_episodes(ledger)
+    ok &= check([e['game'] for e in episodes]
+                == ["Pathogenic", "Everything is Crab", "Gambonanza", "Spelunky"],
+                "cold ledger extracts every episode (name mappings applied)")
+    u.save_ledger(ledger)
+
+    feeds[0] = FEED.replace(b"<item><title>Pathogenic",
+                            b"<item><title>Episode 49: Mewgenics - Review</title><guid>g49</guid>"
+                            b"<pubDate>Wed, 19 Aug 2026 09:00:00 GMT</pubDate></item>"
+                            b"<item><title>Pathogenic")
+    u._extract_game_name_calls = 0
+    original = u._extract_game_name
+
+    def counting_extract(title):
+        u._extract_game_name_calls += 1
+        return original(title)
+
+    u._extract_game_name = counting_extract
+    ledger = u.load_ledger()
+    episodes = u.ingest_episodes(ledger)
+    ok &= check(u._fetch_calls[-1]['guid'] == "g48",
+                "second run fetches with the saved watermark")
+    ok &= check(u._extract_game_name_calls == 1,
+                "only the new episode goes through extraction")
+    ok &= check([e['game'] for e in episodes][:2] == ["Mewgenics", "Pathogenic"]
+                and len(episodes) == 5,
+                "new episode merged ahead of the ledger's episodes")
+    return ok
+
+
+def test_incremental_matching_matches_full(u):
+    print("Incremental matching:")
+    ok = True
+    full_matched, full_details = u.fuzzy_match_games(RELEASED, TIER_GAMES)
+
+    ledger = {}
+    u.fuzzy_match_games(RELEASED[:-3], TIER_GAMES[:-2], ledger)
+    inc_matched, inc_details = u.fuzzy_match_games(RELEASED, TIER_GAMES, ledger)
+    ok &= check(inc_matched == full_matched,
+                "same matched set as a full run after new episodes and doc entries")
+    ok &= check(sorted(map(str, inc_details)) == sorted(map(str, full_details)),
+                "same match details (titles and scores)")
+
+    calls = []
+    original = automated_tierlist_updater.SequenceMatcher
+
+    class CountingMatcher(original):
+        def ratio(self):
+            calls.append(1)
+            return super().ratio()
+
+    automated_tierlist_updater.SequenceMatcher = CountingMatcher
+    try:
+        again_matched, _ = u.fuzzy_match_games(RELEASED, TIER_GAMES, ledger)
+    finally:
+        automated_tierlist_updater.SequenceMatcher = original
+    ok &= check(not calls and again_matched == full_matched,
+                "unchanged inputs replay from the ledger with no scoring")
+    return ok
+
+
+def test_one_to_one_assignment(u):
+    print("One-to-one assignment:")
+    ok = True
+    matched, details = u.fuzzy_match_games(["Risk of Rain Returns"],
+                                           ["Risk of Rain", "Risk of Rain 2"])
+    ok &= check(len(details) == 1 and details[0]['tier_game'] == "Risk of Rain 2",
+                "two doc entries can't both claim one episode (closer one wins)")
+    # Greedy per-entry picks A->X and leaves B unmatched; the optimum pairs both
+    edges = {("A", "X"): 0.9, ("A", "Y"): 0.8, ("B", "X"): 0.85}
+    ok &= check(_max_weight_assignment(edges) == {"A": "Y", "B": "X"},
+                "assignment maximizes total similarity, not first come first served")
+    matched, details = u.fuzzy_match_games(["Hades", "Hades II"], ["Hades", "Hades 2"])
+    ok &= check({(d['tier_game'], d['episode_title']) for d in details}
+                == {("Hades", "Hades"), ("Hades 2", "Hades II")},
+                "exact matches are taken before fuzzy ones")
+    ok &= check(set(details[0]) == {'tier_game', 'episode_title', 'similarity'},
+                "match_details keep their shape")
+    return ok
+
+
+def test_doc_revision_cache(u):
+    print("Google Doc revision cache:")
+    ok = True
+    u.docs_service = FakeDocs("rev-1", ["S Tier: Balatro, Hades", "A Tier: Peglin"])
+    tiers = u.fetch_tier_list()
+    ok &= check(tiers == {'S': ['Balatro', 'Hades'], 'A': ['Peglin']},
+                "first fetch parses the doc")
+    ok &= check(u.docs_service.requests[-1] == AutomatedTierListUpdater.DOC_TEXT_FIELDS,
+                "content request uses the text-only field mask")
+
+    u.docs_service.requests.clear()
+    u.docs_service.text = ["S Tier: Something else entirely"]
+    ok &= check(u.fetch_tier_list() == tiers and u.docs_service.requests == ['revisionId'],
+                "unchanged revision reuses the cached parse without fetching content")
+
+    u.docs_service.revision = "rev-2"
+    ok &= check(u.fetch_tier_list() == {'S': ['Something else entirely']},
+                "new revision refetches and reparses")
+    u.docs_service = None
+    return ok
+
+
+if __name__ == "__main__":
+    u = make_updater()
+    results = [
+        test_feed_watermark(u),
+        test_ingestion_reuses_ledger(u),
+        test_incremental_matching_matches_full(u),
+        test_one_to_one_assignment(u),
+        test_doc_revision_cache(u),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Offline tests for the per-episode highlighted tier lists: the composed
+layout, what a variant changes, parallel encoding and the export script.
+
+Runs in a throwaway directory with synthetic capsules and Steam lookups
+stubbed out, so nothing touches steam_images/, public/ or the network. Run
+with:
+
+    cd scripts && python3 test_highlights.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageChops
+
+import build_manifest
+import export_tierlist_highlights
+from tier_list_generator import TierListGenerator, highlight, highlight_base
+
+TIERS = {
+    'S': ['Balatro', 'Hades'],
+    'A': ['Slay the Spire'],
+    'B': ['Spelunky 2', 'Dead Cells'],
+}
+COLORS = [(200, 30, 30), (30, 200, 30), (30, 30, 200), (200, 200, 30), (30, 200, 200)]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def make_generator():
+    # Fresh working dir: the generator's cache paths are relative to it
+    os.chdir(tempfile.mkdtemp())
+    generator = TierListGenerator(verbose=False)
+    generator.search_steam_game = lambda name, persist=True: None  # offline
+    games = [game for games in TIERS.values() for game in games]
+    for game, color in zip(games, COLORS):
+        Image.new('RGB', (600, 900), color).save(
+            os.path.join(generator.cache_dir, f"{generator._safe_filename(game)}_capsule.jpg"))
+    return generator
+
+
+def same(a, b):
+    return ImageChops.difference(a.convert('RGB'), b.convert('RGB')).getbbox() is None
+
+
+def test_variants():
+    print("Variants:")
+    ok = True
+    generator = make_generator()
+    canvas, boxes = generator.compose_tier_list(TIERS)
+    ok &= check(set(boxes) == {game for games in TIERS.values() for game in games},
+                "every game has a tile rectangle")
+    ok &= check(boxes['Hades'] == (110 + 6 + 150, 0, 110 + 6 + 300, 225),
+                "at its place on the canvas")
+
+    label_right = min(box[0] for box in boxes.values())
+    base = highlight_base(canvas, 'dim', label_right)
+    variant = highlight(canvas, base, boxes['Hades'])
+    left, top, right, bottom = boxes['Hades']
+    inner = (left + 10, top + 10, right - 10, bottom - 10)
+    ok &= check(same(variant.crop(inner), canvas.crop(inner)), "the game's tile is as rendered")
+    ok &= check(same(variant.crop(boxes['Balatro']), base.crop(boxes['Balatro']))
+                and not same(base.crop(boxes['Balatro']), canvas.crop(boxes['Balatro'])),
+                "the other tiles are dimmed")
+    labels = (0, 0, label_right, canvas.height)
+    ok &= check(same(variant.crop(labels), canvas.crop(labels)), "the tier labels are not")
+    ok &= check(highlight_base(canvas, 'outline', label_right) is canvas,
+                "outline variants start from the tier list itself")
+
+    out = tempfile.mkdtemp()
+    hades, celeste = os.path.join(out, 'hades.jpg'), os.path.join(out, 'x.jpg')
+    written = generator.generate_highlights(TIERS, {hades: 'Hades', celeste: 'Celeste'})
+    ok &= check(written == {hades: 'Hades'} and not os.path.exists(celeste),
+                "games that aren't on the tier list are skipped")
+    try:
+        generator.generate_highlights(TIERS, {}, style='sepia')
+        ok &= check(False, "an unknown style is rejected")
+    except ValueError:
+        ok &= check(True, "an unknown style is rejected")
+    return ok
+
+
+def test_parallel():
+    print("Parallel encoding:")
+    ok = True
+    generator = make_generator()
+    serial, parallel = tempfile.mkdtemp(), tempfile.mkdtemp()
+    games = ['Balatro', 'Slay the Spire', 'Dead Cells']
+    for style in ('dim', 'outline'):
+        generator.generate_highlights(
+            TIERS, {os.path.join(serial, f"{style}-{game}.jpg"): game for game in games},
+            style=style)
+        generator.generate_highlights(
+            TIERS, {os.path.join(parallel, f"{style}-{game}.jpg"): game for game in games},
+            style=style, jobs=2)
+
+    def read(directory, name):
+        with open(os.path.join(directory, name), "rb") as handle:
+            return handle.read()
+
+    names = sorted(os.listdir(serial))
+    ok &= check(len(names) == 6 and names == sorted(os.listdir(parallel))
+                and all(read(serial, name) == read(parallel, name) for name in names),
+                "jobs=2 writes the same bytes as one process")
+    return ok
+
+
+def test_export():
+    print("Export:")
+    ok = True
+    generator = make_generator()
+    root = os.getcwd()
+    episodes = os.path.join(root, "episodes.json")
+    with open(episodes, "w", encoding="utf-8") as handle:
+        json.dump({"episodes": [
+            {"slug": "hades", "title": "Hades"},
+            {"slug": "hades-revisited", "title": "Hades: Revisited"},
+            {"slug": "slay-the-spire", "title": "Slay the Spire: The Watcher"},
+            {"slug": "celeste", "title": "Celeste"},
+        ]}, handle)
+    tierlist = os.path.abspath("../public/tierlist.png")
+    os.makedirs(".cache")
+    render_manifest = os.path.join(root, ".cache", "render_manifest.json")
+    with open(render_manifest, "w", encoding="utf-8") as handle:
+        json.dump({tierlist: generator.render_signature(TIERS)}, handle)
+
+    export_tierlist_highlights.EPISODES_JSON = episodes
+    export_tierlist_highlights.TIERLIST = tierlist
+    export_tierlist_highlights.RENDER_MANIFEST = render_manifest
+    export_tierlist_highlights.OUTPUT_DIR = output = os.path.join(root, "highlights")
+    export_tierlist_highlights.GENERATOR_DIR = root
+    build_manifest.MANIFEST_PATH = os.path.join(root, "build_manifest.json")
+
+    ok &= check(export_tierlist_highlights.main([]) == 0, "exports")
+    ok &= check(sorted(os.listdir(output)) == ["hades-revisited.jpg", "hades.jpg",
+                                               "slay-the-spire.jpg"],
+                "one per episode whose game is on the tier list, by name before the colon too")
+    with open(os.path.join(output, "hades.jpg"), "rb") as first, \
+            open(os.path.join(output, "hades-revisited.jpg"), "rb") as second:
+        ok &= check(first.read() == second.read(),
+                    "two episodes of one game each get the game's highlight")
+    ok &= check(Image.open(os.path.join(output, "hades.jpg")).size == (110 + 6 + 14 * 150, 3 * 225 + 2 * 6),
+                "the size of the tier list")
+
+    mtime = os.path.getmtime(os.path.join(output, "hades.jpg"))
+    export_tierlist_highlights.main([])
+    ok &= check(os.path.getmtime(os.path.join(output, "hades.jpg")) == mtime,
+                "a second run rewrites nothing")
+    export_tierlist_highlights.main(["--style", "outline"])
+    ok &= check(os.path.getmtime(os.path.join(output, "hades.jpg")) != mtime,
+                "a new style rewrites every variant")
+    return ok
+
+
+if __name__ == "__main__":
+    cwd = os.getcwd()
+    saved = build_manifest.MANIFEST_PATH
+    try:
+        results = [
+            test_variants(),
+            test_parallel(),
+            test_export(),
+        ]
+    finally:
+        os.chdir(cwd)
+        build_manifest.MANIFEST_PATH = saved
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Offline tests for the run deadline, the per-host circuit breakers and the
+generator's degraded mode when Steam is down.
+
+requests is replaced by a fake that times out (or answers) on demand, and
+the generator runs in a throwaway directory, so nothing touches the network,
+steam_images/ or public/. Run with:
+
+    cd scripts && python3 test_http_guard.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import types
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from automated_tierlist_updater import AutomatedTierListUpdater
+from http_guard import HttpGuard, Offline
+from tier_list_generator import TierListGenerator
+
+
+class FakeRequests(types.ModuleType):
+    """Stands in for the requests module. Every request is recorded, then
+    answered with `status` or, if `down` (or its host is in `hosts_down`),
+    a timeout."""
+
+    class RequestException(Exception):
+        pass
+
+    class Timeout(RequestException):
+        pass
+
+    def __init__(self, down=False, status=200):
+        super().__init__("requests")
+        self.down, self.status, self.calls = down, status, []
+        self.hosts_down = set()
+        self.during = None  # called mid-request, e.g. to race another one
+
+    def get(self, url, timeout=None, **kwargs):
+        self.calls.append((url, timeout))
+        if self.during:
+            self.during()
+        if self.down or urlsplit(url).hostname in self.hosts_down:
+            raise self.Timeout(f"timed out: {url}")
+        return types.SimpleNamespace(status_code=self.status, raise_for_status=lambda: None,
+                                     json=lambda: {"items": []})
+
+    head = get
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def refused(guard, url):
+    try:
+        guard.get(url, timeout=10)
+    except Offline:
+        return True
+    return False
+
+
+def test_breaker(fake):
+    print("Circuit breaker:")
+    ok = True
+    clock = Clock()
+    guard = HttpGuard(failures_to_trip=3, cooldown_s=60, clock=clock,
+                      essential_hosts=("store.example",))
+    cdn, store = "https://cdn.example/a.jpg", "https://store.example/api"
+
+    fake.down = True
+    for _ in range(2):
+        try:
+            guard.get(cdn, timeout=10)
+        except fake.Timeout:
+            pass
+    fake.down = False
+    guard.get(cdn, timeout=10)
+    ok &= check(not guard.degraded, "a success resets the count of failures in a row")
+
+    fake.status = 503
+    for _ in range(3):
+        guard.get(cdn, timeout=10)
+    fake.status = 200
+    calls = len(fake.calls)
+    ok &= check(refused(guard, cdn) and len(fake.calls) == calls,
+                "three 5xx in a row open the host's breaker: its requests are refused")
+    ok &= check(not guard.degraded and not refused(guard, store) and len(fake.calls) == calls + 1,
+                "other hosts are still asked, and the run isn't degraded")
+    snapshot = guard.snapshot()
+    ok &= check(snapshot["hosts"]["cdn.example"]["open"] and snapshot["refused"] == 1
+                and "cdn.example" in snapshot["reason"],
+                "the snapshot says which host tripped and counts the refusals")
+
+    clock.now += 61
+    fake.status = 500
+    guard.get(cdn, timeout=10)
+    ok &= check(refused(guard, cdn), "after the cooldown one trial goes out; a failure reopens it")
+
+    clock.now += 61
+    fake.status = 404
+    raced = []
+    fake.during = lambda: raced.append(refused(guard, cdn))
+    guard.get(cdn, timeout=10)
+    fake.during = None
+    ok &= check(raced == [True], "while the trial is out, the host's other requests are refused")
+    ok &= check(not refused(guard, cdn) and guard.snapshot()["hosts"]["cdn.example"]["trips"] == 2,
+                "a trial that gets any answer short of 5xx/429 closes it")
+
+    fake.down = True
+    for _ in range(3):
+        try:
+            guard.get(store, timeout=10)
+        except fake.Timeout:
+            pass
+    fake.down = False
+    ok &= check(guard.degraded and refused(guard, cdn) and "store.example" in guard.snapshot()["reason"],
+                "an essential host's open breaker degrades the run: every host is refused")
+    fake.status = 200
+    return ok
+
+
+def test_deadline(fake):
+    print("Run deadline:")
+    ok = True
+    clock = Clock()
+    guard = HttpGuard(clock=clock)
+    guard.begin(30)
+    clock.now += 25
+    guard.get("https://cdn.example/a.jpg", timeout=10)
+    ok &= check(fake.calls[-1][1] == 5, "timeouts are clamped to the time left")
+    clock.now += 5
+    ok &= check(guard.degraded and refused(guard, "https://cdn.example/a.jpg")
+                and "deadline" in guard.snapshot()["reason"],
+                "nothing goes out once it has passed")
+    guard.begin(None)
+    ok &= check(not guard.degraded, "the next run starts with a fresh deadline")
+    return ok
+
+
+def make_generator():
+    # Fresh working dir: the generator's cache paths are relative to it
+    os.chdir(tempfile.mkdtemp())
+    g = TierListGenerator(verbose=False)
+    Image.new('RGB', (600, 900), 'crimson').save(os.path.join(g.cache_dir, "Balatro_capsule.jpg"))
+    Image.new('RGB', (460, 215), 'navy').save(os.path.join(g.cache_dir, "Hades.jpg"))
+    return g
+
+
+def test_degraded_render(fake):
+    print("Degraded render:")
+    ok = True
+    g = make_generator()
+    tiers = {'S': ['Balatro', 'Hades'], 'A': ['Noita', 'Dead Cells', 'Peglin']}
+    g.search_cache["peglin"] = {"term": "Peglin", "fetched": time.time() - g.SEARCH_CACHE_TTL - 1,
+                                "items": [{"type": "app", "name": "Peglin", "id": 1296610}]}
+
+    fake.down, fake.calls[:] = True, []
+    started = time.perf_counter()
+    g.generate_tier_list(tiers, "tierlist.png")
+    elapsed = time.perf_counter() - started
+    ok &= check(len(fake.calls) == 3 and g.net.snapshot()["hosts"]["store.steampowered.com"]["open"],
+                "three timed-out searches trip the breaker; nothing else is requested")
+    ok &= check(elapsed < 5, f"and the render doesn't wait on Steam ({elapsed:.2f}s)")
+    ok &= check(g.degraded_tiles == {'Hades': 'fallback', 'Noita': 'placeholder',
+                                     'Dead Cells': 'placeholder', 'Peglin': 'placeholder'},
+                "every tile drawn without Steam is reported, with the art it had")
+    ok &= check(g.last_render_signature['degraded'] == ['Dead Cells', 'Hades', 'Noita', 'Peglin'],
+                "and recorded in the render signature")
+    ok &= check(g._storesearch("Peglin")[0]["id"] == 1296610,
+                "an expired search is used when Steam can't be asked")
+    ok &= check(len(g.tiles) == 1, "degraded tiles aren't kept in the tile pool")
+
+    # The next run: Steam is back
+    fake.down, fake.calls[:] = False, []
+    g.net = HttpGuard()
+    updater = AutomatedTierListUpdater.__new__(AutomatedTierListUpdater)
+    updater.generator = g
+    recorded = dict(g.last_render_signature)
+    planned = g.render_signature(tiers)
+    ok &= check(recorded != planned
+                and "backfill Hades" in updater._describe_render_changes(recorded, planned),
+                "the next run doesn't treat the output as up to date")
+    g.generate_tier_list(tiers, "tierlist.png")
+    ok &= check(fake.calls and not g.degraded_tiles and 'degraded' not in g.last_render_signature,
+                "and, with Steam back, asks again and renders normally")
+
+    g = make_generator()
+    g.net.begin(0)
+    fake.calls[:] = []
+    g.generate_tier_list(tiers, "tierlist.png")
+    ok &= check(not fake.calls and set(g.degraded_tiles) == {'Hades', 'Noita', 'Dead Cells', 'Peglin'},
+                "with no time left, nothing is requested and cached art is used")
+    return ok
+
+
+def test_cdn_outage(fake):
+    print("CDN outage:")
+    ok = True
+    g = make_generator()
+    g.game_id_cache.update({"peglin": 1296610, "noita": 881100})
+    fake.calls[:] = []
+    fake.hosts_down = {"steamcdn-a.akamaihd.net", "shared.fastly.steamstatic.com"}
+    try:
+        g.generate_tier_list({'S': ['Balatro', 'Peglin', 'Noita']}, "tierlist.png")
+    finally:
+        fake.hosts_down = set()
+    hosts = [urlsplit(url).hostname for url, _ in fake.calls]
+    snapshot = g.net.snapshot()
+    ok &= check(snapshot["hosts"]["steamcdn-a.akamaihd.net"]["open"] and not g.net.degraded,
+                "the capsule CDN's breaker opens, but the run isn't degraded")
+    last_cdn = max(i for i, host in enumerate(hosts) if host == "steamcdn-a.akamaihd.net")
+    ok &= check("store.steampowered.com" in hosts[last_cdn + 1:],
+                "the store is still asked once the CDN is refused")
+    ok &= check(g.degraded_tiles == {'Peglin': 'placeholder', 'Noita': 'placeholder'},
+                "only the tiles that needed the CDN are degraded")
+    return ok
+
+
+def test_capsule_hosts(fake):
+    print("Capsule lookup with one CDN down:")
+    ok = True
+    g = make_generator()
+    fake.calls[:] = []
+    fake.hosts_down = {"steamcdn-a.akamaihd.net"}
+    try:
+        urls = [g._find_capsule_url(app_id) for app_id in range(1, 6)]
+        ok &= check(g.net.snapshot()["hosts"]["steamcdn-a.akamaihd.net"]["open"]
+                    and all(url and urlsplit(url).hostname == "shared.fastly.steamstatic.com"
+                            for url in urls),
+                    "games looked up after its breaker opens still get the other CDN's capsule")
+        fake.status, fake.calls[:] = 404, []
+        ok &= check(g._find_capsule_url(6) is None
+                    and any(urlsplit(url).hostname == "api.steampowered.com"
+                            for url, _ in fake.calls),
+                    "and with no capsule on it, the store API is still asked")
+    finally:
+        fake.hosts_down, fake.status = set(), 200
+    return ok
+
+
+if __name__ == "__main__":
+    cwd = os.getcwd()
+    fake = FakeRequests()
+    saved, sys.modules["requests"] = sys.modules.get("requests"), fake
+    try:
+        results = [
+            test_breaker(fake),
+            test_deadline(fake),
+            test_degraded_render(fake),
+            test_cdn_outage(fake),
+            test_capsule_hosts(fake),
+        ]
+    finally:
+        os.chdir(cwd)
+        if saved is None:
+            del sys.modules["requests"]
+        else:
+            sys.modules["requests"] = saved
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Offline tests for the single-process pipeline and its shared cache.
+
+Stage runners are stubbed and images are synthetic, so nothing under public/
+is touched. Run with:
+
+    cd scripts && python3 test_pipeline.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageChops
+
+import pipeline
+from run_cache import RunCache
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_run_cache():
+    print("Shared cache:")
+    ok = True
+    path = os.path.join(tempfile.mkdtemp(), "capsule.jpg")
+    Image.radial_gradient('L').resize((60, 90)).convert('RGB').save(path, quality=90)
+
+    cache = RunCache()
+    first = cache.image(path)
+    ok &= check(cache.image(path) is first and cache.hits == 1,
+                "a second read of the same file is served from memory")
+    with Image.open(path) as src:
+        by_hand = src.convert('RGB').resize((30, 45), Image.LANCZOS)
+    ok &= check(ImageChops.difference(cache.resized(path, (30, 45), 'RGB'), by_hand).getbbox()
+                is None, "resized variants are pixel-identical to resizing by hand")
+
+    time.sleep(0.01)
+    Image.new('RGB', (60, 90), 'red').save(path)
+    ok &= check(cache.image(path).getpixel((0, 0))[0] > 200,
+                "a rewritten file is read again, not served stale")
+
+    small = RunCache(budget_bytes=100)
+    small.get('a', lambda: 'A', cost=60)
+    small.get('b', lambda: 'B', cost=60)
+    calls = []
+    small.get('a', lambda: calls.append('a') or 'A', cost=60)
+    ok &= check(calls == ['a'], "least recently used entries are dropped over budget")
+    return ok
+
+
+def test_stage_selection():
+    print("Stage selection:")
+    ok = True
+    ran = []
+    results = {'tierlist': True, 'art': False, 'cards': True}
+    original = dict(pipeline.RUNNERS)
+    for name in pipeline.STAGES:
+        pipeline.RUNNERS[name] = lambda args, name=name: ran.append(name) or results[name]
+    try:
+        ok &= check(pipeline.run_pipeline(['cards', 'tierlist'], None) and ran == ['tierlist', 'cards'],
+                    "runs only the selected stages, in pipeline order")
+        ran.clear()
+        ok &= check(not pipeline.run_pipeline(list(pipeline.STAGES), None) and ran == ['tierlist', 'art'],
+                    "a failed required stage stops the run")
+        ran.clear()
+        ok &= check(pipeline.run_pipeline(list(pipeline.STAGES), None, optional=['art'])
+                    and ran == ['tierlist', 'art', 'cards'],
+                    "a failed optional stage is reported and the run continues")
+    finally:
+        pipeline.RUNNERS.update(original)
+
+    try:
+        pipeline.stage_list("tierlist,posters")
+        rejected = False
+    except Exception:
+        rejected = True
+    ok &= check(rejected, "unknown stage names are rejected")
+    return ok
+
+
+if __name__ == "__main__":
+    results = [
+        test_run_cache(),
+        test_stage_selection(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
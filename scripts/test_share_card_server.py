@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Offline tests for the on-demand share card service.
+
+Points the exporters at a throwaway tree with synthetic art and capsules, so
+nothing in public/ is touched. Run with:
+
+    cd scripts && python3 test_share_card_server.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import build_manifest
+import export_episode_art
+import export_share_cards
+from request_cache import percentile
+from share_card_server import ShareCardServer
+
+EPISODES = [
+    {"slug": "balatro", "title": "Balatro", "number": 1, "duration": "1h 12m"},
+    {"slug": "spelunky", "title": "Spelunky", "number": 2, "duration": "58m"},
+]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def make_tree(root):
+    """Exported art for Balatro; only a cached capsule for Spelunky, as for an
+    episode published since the last batch run."""
+    public = os.path.join(root, "public")
+    art_dir = os.path.join(public, "episode-art")
+    capsules = os.path.join(root, "steam_images")
+    os.makedirs(art_dir)
+    os.makedirs(capsules)
+    Image.new("RGB", (460, 690), (200, 60, 40)).save(os.path.join(art_dir, "balatro.webp"))
+    Image.new("RGB", (600, 900), (40, 90, 200)).save(os.path.join(capsules, "Spelunky_capsule.jpg"))
+    write_episodes(public, EPISODES)
+
+    export_share_cards.EPISODES_JSON = os.path.join(public, "episodes.json")
+    export_share_cards.ART_DIR = art_dir
+    export_share_cards.OUTPUT_DIR = os.path.join(public, "episode-share")
+    export_share_cards.SHOW_COVER = os.path.join(public, "brand", "cover-1080.webp")
+    export_episode_art.CACHE_DIR = capsules
+    build_manifest.MANIFEST_PATH = os.path.join(root, "build_manifest.json")
+    return public
+
+
+def write_episodes(public, episodes):
+    path = os.path.join(public, "episodes.json")
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"episodes": episodes}, handle)
+    os.utime(path, ns=(time.time_ns(), time.time_ns()))
+
+
+def test_cards():
+    print("Cards:")
+    ok = True
+    root = tempfile.mkdtemp()
+    public = make_tree(root)
+    cache_dir = os.path.join(root, "share-cards")
+
+    service = ShareCardServer(cache_dir=cache_dir)
+    served, _ = service.card("balatro")
+    ok &= check(service.counts["rendered"] == 1, "a card nobody has built is rendered")
+    export_share_cards.main([])
+    with open(os.path.join(public, "episode-share", "balatro.jpg"), "rb") as handle:
+        ok &= check(served == handle.read(), "byte-identical to the batch exporter's card")
+
+    ok &= check(service.card("balatro")[0] == served and service.counts["memory"] == 1,
+                "a repeat is answered from memory")
+    fresh = ShareCardServer(cache_dir=cache_dir)
+    ok &= check(fresh.card("balatro")[0] == served and fresh.counts["batch"] == 1,
+                "a new process serves the current batch output without rendering")
+
+    capsule_card = fresh.card("spelunky")
+    ok &= check(capsule_card is not None and capsule_card[0][:2] == b"\xff\xd8",
+                "an episode with only a cached capsule still gets a card")
+    ok &= check(ShareCardServer(cache_dir=cache_dir).card("spelunky")[0] == capsule_card[0],
+                "and the next process finds it in the disk cache")
+    ok &= check(fresh.card("no-such-episode") is None, "an unknown slug has no card")
+
+    renamed = [dict(EPISODES[0], title="Balatro: The Return"), EPISODES[1]]
+    write_episodes(public, renamed)
+    retitled, _ = fresh.card("balatro")
+    ok &= check(retitled != served, "an edited title is a new card, not the cached one")
+
+    small = ShareCardServer(memory_bytes=len(served) + 1, cache_dir=cache_dir)
+    small.card("balatro")
+    small.card("spelunky")
+    ok &= check(small.snapshot()["memory_cards"] == 1, "memory stays within its byte budget")
+    return ok
+
+
+def test_coalescing():
+    print("Concurrent requests:")
+    ok = True
+    make_tree(tempfile.mkdtemp())
+    service = ShareCardServer(cache_dir=tempfile.mkdtemp())
+    render = service.render
+
+    def slow_render(*args):
+        time.sleep(0.3)  # long enough for every request to arrive mid-render
+        return render(*args)
+
+    service.render = slow_render
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.card("balatro")[0]))
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ok &= check(service.counts["rendered"] == 1 and service.counts["coalesced"] == 5,
+                "six requests for the same card render it once")
+    ok &= check(len(results) == 6 and len(set(results)) == 1, "and all get the same bytes")
+    return ok
+
+
+def test_http():
+    print("HTTP:")
+    ok = True
+    make_tree(tempfile.mkdtemp())
+    server = ShareCardServer(cache_dir=tempfile.mkdtemp()).serve(0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/episode-share/balatro.jpg") as response:
+            etag = response.headers["ETag"]
+            ok &= check(response.status == 200 and response.headers["Content-Type"] == "image/jpeg",
+                        "serves the card as a JPEG")
+        request = urllib.request.Request(f"{base}/episode-share/balatro.jpg",
+                                         headers={"If-None-Match": etag})
+        try:
+            urllib.request.urlopen(request)
+            status = 200
+        except urllib.error.HTTPError as e:
+            status = e.code
+        ok &= check(status == 304, "a matching ETag gets 304")
+        for path in ("/episode-share/nope.jpg", "/episode-share/../secrets.jpg"):
+            try:
+                urllib.request.urlopen(base + path)
+                status = 200
+            except urllib.error.HTTPError as e:
+                status = e.code
+            ok &= check(status == 404, f"{path} is 404")
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            metrics = json.load(response)
+        ok &= check(metrics["rendered"] == 1 and metrics["not_found"] == 1
+                    and metrics["p95_ms"] is not None,
+                    "/metrics counts where cards came from and reports latency")
+    finally:
+        server.shutdown()
+    ok &= check(percentile([5, 1, 4, 2, 3], 0.95) == 5 and percentile([], 0.5) is None,
+                "nearest-rank percentiles")
+    return ok
+
+
+if __name__ == "__main__":
+    saved = build_manifest.MANIFEST_PATH
+    try:
+        results = [
+            test_cards(),
+            test_coalescing(),
+            test_http(),
+        ]
+    finally:
+        build_manifest.MANIFEST_PATH = saved
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
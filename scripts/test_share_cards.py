@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Offline tests for rendering share cards across worker processes.
+
+Points the exporter at a throwaway tree with synthetic episode art, so
+nothing in public/ is touched. Run with:
+
+    cd scripts && python3 test_share_cards.py
+"""
+
+import colorsys
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import build_manifest
+import export_share_cards
+
+EPISODES = [
+    {"slug": "balatro", "title": "Balatro", "number": 1, "duration": "1h 12m"},
+    {"slug": "spelunky", "title": "Spelunky", "number": 2, "duration": "58m"},
+    {"slug": "hades", "title": "Hades", "number": 3, "duration": "1h 30m"},
+]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def make_tree(root, episodes, corrupt=()):
+    public = os.path.join(root, "public")
+    art_dir = os.path.join(public, "episode-art")
+    os.makedirs(art_dir)
+    for i, episode in enumerate(episodes):
+        path = os.path.join(art_dir, f"{episode['slug']}.webp")
+        if episode["slug"] in corrupt:
+            with open(path, "wb") as handle:
+                handle.write(b"not an image")
+        else:
+            Image.new("RGB", (460, 690), (60 * i, 200 - 50 * i, 90)).save(path)
+    with open(os.path.join(public, "episodes.json"), "w", encoding="utf-8") as handle:
+        json.dump({"episodes": episodes}, handle)
+
+    export_share_cards.EPISODES_JSON = os.path.join(public, "episodes.json")
+    export_share_cards.ART_DIR = art_dir
+    export_share_cards.OUTPUT_DIR = os.path.join(public, "episode-share")
+    export_share_cards.SHOW_COVER = os.path.join(public, "brand", "cover-1080.webp")
+    build_manifest.MANIFEST_PATH = os.path.join(root, "build_manifest.json")
+    return export_share_cards.OUTPUT_DIR
+
+
+def digests(directory):
+    result = {}
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), "rb") as handle:
+            result[name] = hashlib.md5(handle.read()).hexdigest()
+    return result
+
+
+def colorsys_accent(img):
+    """accent() as it was, one colorsys call per pixel: the reference."""
+    small = img.convert("RGB").resize((64, 96), Image.LANCZOS)
+    buckets = {}
+    for r, g, b in small.getdata():
+        hue, sat, val = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+        if sat < 0.35 or val < 0.25:
+            continue
+        weight = sat * val
+        acc = buckets.setdefault(int(hue * 18), [0.0, 0.0, 0.0, 0.0])
+        acc[0] += r * weight
+        acc[1] += g * weight
+        acc[2] += b * weight
+        acc[3] += weight
+    if not buckets:
+        return (120, 130, 150)
+    r, g, b, weight = max(buckets.values(), key=lambda a: a[3])
+    hue, sat, val = colorsys.rgb_to_hsv(r / weight / 255, g / weight / 255, b / weight / 255)
+    r, g, b = colorsys.hsv_to_rgb(hue, min(sat * 1.15, 1.0), max(val, 0.72))
+    return (round(r * 255), round(g * 255), round(b * 255))
+
+
+def test_accent():
+    print("Accent colour:")
+    ok = True
+    repo_art = sorted(glob.glob(os.path.join(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))), "public", "episode-art", "*.webp")))[:12]
+    images = [Image.open(path).convert("RGB") for path in repo_art]
+    images.append(Image.new("RGB", (64, 96), (40, 40, 40)))                 # no saturated pixels
+    images.append(Image.radial_gradient("L").convert("RGB").resize((120, 180)))
+    worst = max(max(abs(a - b) for a, b in zip(export_share_cards.accent(img),
+                                                 colorsys_accent(img)))
+                for img in images)
+    ok &= check(worst <= 1, f"matches the per-pixel colorsys version to within 1 per channel "
+                            f"({len(images)} images, worst {worst})")
+    ok &= check(export_share_cards.accent(images[-2]) == (120, 130, 150),
+                "grey art gets the fallback colour")
+
+    root = tempfile.mkdtemp()
+    make_tree(root, EPISODES)
+    export_share_cards.main([])
+    analysed = []
+    original = export_share_cards.accent
+    export_share_cards.accent = lambda img: analysed.append(img) or original(img)
+    try:
+        export_share_cards.main(["--force"])
+    finally:
+        export_share_cards.accent = original
+    ok &= check(analysed == [], "a rebuild reuses the cached colours instead of analysing the art")
+    with open(os.path.join(root, "accents.json"), encoding="utf-8") as handle:
+        cached = json.load(handle)["accents"]
+    ok &= check(len(cached) == len(EPISODES), "colours are cached per art hash")
+    return ok
+
+
+def test_parallel_matches_serial():
+    print("Parallel rendering:")
+    ok = True
+    serial_dir = make_tree(tempfile.mkdtemp(), EPISODES)
+    export_share_cards.main(["--jobs", "1"])
+    serial = digests(serial_dir)
+    parallel_dir = make_tree(tempfile.mkdtemp(), EPISODES)
+    exit_code = export_share_cards.main(["--jobs", "3"])
+    ok &= check(exit_code == 0 and len(serial) == 3, "--jobs 3 renders every card")
+    ok &= check(digests(parallel_dir) == serial, "and the cards are byte-identical to a serial run")
+    return ok
+
+
+def test_errors_are_aggregated():
+    print("Failures:")
+    ok = True
+    output_dir = make_tree(tempfile.mkdtemp(), EPISODES, corrupt={"spelunky"})
+    exit_code = export_share_cards.main(["--jobs", "2"])
+    ok &= check(exit_code == 1, "a failed card fails the run")
+    ok &= check(sorted(os.listdir(output_dir)) == ["balatro.jpg", "hades.jpg"],
+                "the other cards still render")
+    manifest = build_manifest.BuildManifest()
+    built = sorted(os.path.basename(key) for key in manifest.entries)
+    ok &= check(built == ["balatro.jpg", "hades.jpg"],
+                "the failed card isn't recorded as built, so the next run retries it")
+
+    # Art removed after the run decided which cards to render
+    make_tree(tempfile.mkdtemp(), EPISODES)
+    original = export_share_cards.write_episode_card
+    export_share_cards.write_episode_card = lambda episode, mark, key=None: (
+        None if episode["slug"] == "hades" else original(episode, mark, key))
+    try:
+        exit_code = export_share_cards.main(["--jobs", "1"])
+    finally:
+        export_share_cards.write_episode_card = original
+    built = sorted(os.path.basename(key) for key in build_manifest.BuildManifest().entries)
+    ok &= check(exit_code == 1 and built == ["balatro.jpg", "spelunky.jpg"],
+                "art that disappears mid-run fails its card without aborting the rest")
+    return ok
+
+
+if __name__ == "__main__":
+    # Workers must get their paths from the parent, not from a forked copy
+    # of the test's module globals: spawn (the macOS default) has no fork
+    multiprocessing.set_start_method("spawn")
+    saved = build_manifest.MANIFEST_PATH
+    try:
+        results = [
+            test_accent(),
+            test_parallel_matches_serial(),
+            test_errors_are_aggregated(),
+        ]
+    finally:
+        build_manifest.MANIFEST_PATH = saved
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
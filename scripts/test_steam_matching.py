@@ -2,7 +2,8 @@
 """Offline unit tests for the Steam search matching in tier_list_generator.
 
 No network needed — these test the scoring logic that decides which Steam
-search result (if any) is the game we asked for. Run with:
+search result (if any) is the game we asked for, and the cache of raw search
+results it scores (storesearch is stubbed out). Run with:
 
     cd scripts && python3 test_steam_matching.py
 """
@@ -10,6 +11,8 @@ search result (if any) is the game we asked for. Run with:
 import os
 import sys
 import tempfile
+import time
+import types
 
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -115,14 +118,79 @@ def test_threshold(g):
     return ok
 
 
+class FakeStoresearch:
+    """Stands in for the requests module: answers storesearch from a dict
+    of {term: [item names]} and counts the calls."""
+
+    def __init__(self, results):
+        self.results, self.calls = results, []
+
+    def get(self, url, timeout=None):
+        term = url.split("term=")[1].split("&")[0].replace("%20", " ")
+        self.calls.append(term)
+        items = [{"type": "app", "name": name, "id": 1000 + i, "price": {}}
+                 for i, name in enumerate(self.results.get(term, []))]
+        return types.SimpleNamespace(status_code=200, raise_for_status=lambda: None,
+                                     json=lambda: {"total": len(items), "items": items})
+
+
+def test_search_cache():
+    print("Search result cache:")
+    ok = True
+    os.chdir(tempfile.mkdtemp())
+    g = TierListGenerator(verbose=False)
+    fake = FakeStoresearch({"Balatro": ["Balatro Soundtrack", "Balatro"],
+                            "Gambonanza": ["Gwent: The Witcher Card Game"]})
+    saved, sys.modules["requests"] = sys.modules.get("requests"), fake
+    try:
+        ok &= check(g.search_steam_game("Balatro") == 1001, "a search picks the best match")
+        ok &= check(g.search_steam_game("Gambonanza") is None, "an unmatched name gets no ID")
+
+        g = TierListGenerator(verbose=False)  # next run: cache read from disk
+        g.search_steam_game("Gambonanza")
+        g.search_steam_game("gambonanza!")
+        ok &= check(fake.calls == ["Balatro", "Gambonanza"],
+                    "an unmatched name isn't searched again while its results are fresh")
+        ok &= check(g.search_cache["balatro"]["items"][0] == {"type": "app", "name": "Balatro Soundtrack", "id": 1000},
+                    "results are cached raw, trimmed to type/name/id, per normalized name")
+        ok &= check(g.plan_tile("Gambonanza", (150, 225)) == "unmatched",
+                    "the dry-run plan knows an unmatched name costs no requests")
+
+        g.search_cache["gambonanza"]["fetched"] = time.time() - g.SEARCH_CACHE_TTL - 1
+        g.search_steam_game("Gambonanza")
+        ok &= check(fake.calls[-1] == "Gambonanza", "stale results are searched again")
+
+        # A scoring change, seen without the network
+        g.NON_GAME_TOKENS = ()
+        g.MIN_MATCH_SCORE = 0.1
+        calls = len(fake.calls)
+        results = {r["term"]: r for r in g.rescore_search_cache()}
+        ok &= check(len(fake.calls) == calls, "re-scoring makes no requests")
+        ok &= check(results["Balatro"]["cached"] == 1001 and results["Balatro"]["app_id"] == 1001
+                    and results["Gambonanza"]["cached"] is None
+                    and results["Gambonanza"]["app_id"] == 1000,
+                    "and reports what the current rules pick for every cached query")
+    finally:
+        if saved is None:
+            del sys.modules["requests"]
+        else:
+            sys.modules["requests"] = saved
+    return ok
+
+
 if __name__ == "__main__":
+    cwd = os.getcwd()
     g = make_generator()
-    results = [
-        test_normalization(g),
-        test_sequel_handling(g),
-        test_non_game_entries(g),
-        test_threshold(g),
-    ]
+    try:
+        results = [
+            test_normalization(g),
+            test_sequel_handling(g),
+            test_non_game_entries(g),
+            test_threshold(g),
+            test_search_cache(),
+        ]
+    finally:
+        os.chdir(cwd)
     if all(results):
         print("\nAll tests passed ✅")
         sys.exit(0)
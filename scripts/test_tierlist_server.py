@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Offline tests for the on-demand tier list service: variants, the
+canonical cache key, warm tiles and request coalescing.
+
+Runs in a throwaway directory with synthetic capsules, so nothing touches
+steam_images/; requests is replaced by a fake that records any request the
+service makes (it should make none). Run with:
+
+    cd scripts && python3 test_tierlist_server.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from tierlist_server import BadRequest, TierListServer, WarmTileGenerator
+
+TIERS = {
+    'S': ['Balatro', 'Hades'],
+    'A': ['Slay the Spire'],
+    'B': ['Spelunky 2', 'Dead Cells'],
+}
+COLORS = [(200, 30, 30), (30, 200, 30), (30, 30, 200), (200, 200, 30), (30, 200, 200)]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def make_service(**kwargs):
+    # Fresh working dir: the generator's cache paths are relative to it
+    os.chdir(tempfile.mkdtemp())
+    generator = WarmTileGenerator(verbose=False)
+    games = [game for games in TIERS.values() for game in games]
+    for game, color in zip(games, COLORS):
+        Image.new('RGB', (600, 900), color).save(
+            os.path.join(generator.cache_dir, f"{generator._safe_filename(game)}_capsule.jpg"))
+
+    os.makedirs(".cache")
+    with open(os.path.join(".cache", "render_manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump({os.path.abspath("../public/tierlist.png"): generator.render_signature(TIERS)},
+                  handle)
+    with open(os.path.join(".cache", "episode_ledger.json"), "w", encoding="utf-8") as handle:
+        json.dump({
+            'episodes': [
+                {'game': 'Hades', 'pub_date': 'Wed, 07 Jan 2026 10:00:00 GMT'},
+                {'game': 'Slay the Spire', 'pub_date': 'Wed, 17 Dec 2025 10:00:00 GMT'},
+                {'game': 'Balatro', 'pub_date': 'Wed, 25 Dec 2024 10:00:00 GMT'},
+            ],
+            'matches': [{'tier_game': game, 'episode_title': game}
+                        for game in ('Balatro', 'Hades', 'Slay the Spire')],
+        }, handle)
+    return TierListServer(generator, **kwargs)
+
+
+class FakeRequests(types.ModuleType):
+    """Stands in for the requests module, recording every request."""
+
+    class RequestException(Exception):
+        pass
+
+    def __init__(self):
+        super().__init__("requests")
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        raise self.RequestException(f"no network in tests: {url}")
+
+    head = get
+
+
+def files():
+    """Every file under the working directory, with its size and mtime."""
+    found = {}
+    for root, _, names in os.walk("."):
+        for name in names:
+            stat = os.stat(os.path.join(root, name))
+            found[os.path.join(root, name)] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+def decode(data):
+    return Image.open(io.BytesIO(data))
+
+
+def test_variants():
+    print("Variants:")
+    ok = True
+    service = make_service()
+
+    data, _, timings = service.tier_list("")
+    path = os.path.join(tempfile.mkdtemp(), "tierlist.png")
+    WarmTileGenerator().generate_tier_list(TIERS, path)
+    with open(path, "rb") as handle:
+        ok &= check(data == handle.read(),
+                    "the default is the last rendered tier list, byte-identical to a batch render")
+    ok &= check({'resolve', 'tiles', 'render', 'total'} <= set(timings),
+                "reports resolve, tiles and render timings")
+
+    only_s = decode(service.tier_list("tier=S")[0])
+    ok &= check(only_s.size == (110 + 6 + 14 * 150, 225), "tier=S is one tier")
+    wide = decode(service.tier_list("tile_width=100&max_games_per_row=2")[0])
+    ok &= check(wide.size == (110 + 6 + 2 * 100, 3 * 150 + 2 * 6),
+                "tile_width and max_games_per_row re-lay it out")
+    years = service.variant("year=2025")[0]
+    ok &= check(years == {'A': ['Slay the Spire']}, "year keeps that year's episodes")
+    explicit = service.variant("A=Hades&S=Balatro&S=Balatro")[0]
+    ok &= check(explicit == {'S': ['Balatro'], 'A': ['Hades']}, "tier data can be passed as query input")
+    ok &= check(service.tier_list("year=1999") is None, "a filter that leaves no games has no tier list")
+
+    for query in ("tile_width=5", "tile_width=big", "tier=Z", "colour=red"):
+        try:
+            service.variant(query)
+            ok &= check(False, f"{query} is rejected")
+        except BadRequest:
+            ok &= check(True, f"{query} is rejected")
+    return ok
+
+
+def test_caching():
+    print("Caching:")
+    ok = True
+    service = make_service()
+    service.tier_list("tier=S&tier=A")
+    service.tier_list("tier=A&tier=S&tile_width=150")
+    service.tier_list("S=Balatro&S=Hades&A=Slay+the+Spire")
+    ok &= check(service.counts["rendered"] == 1 and service.counts["memory"] == 2,
+                "queries that come to the same picture share one cache entry")
+
+    misses = service.generator.tiles.misses
+    service.tier_list("tier=B")
+    service.tier_list("")
+    ok &= check(service.generator.tiles.misses == misses + 2,
+                "a new variant only loads the tiles it hasn't used yet")
+
+    before = service.tier_list("tier=S")[1]
+    Image.new('RGB', (600, 900), (90, 90, 90)).save(
+        os.path.join(service.generator.cache_dir, "Balatro_capsule.jpg"))
+    os.utime(os.path.join(service.generator.cache_dir, "Balatro_capsule.jpg"), ns=(1, 1))
+    ok &= check(service.tier_list("tier=S")[1] != before, "new art is a new cache entry")
+    return ok
+
+
+def test_coalescing():
+    print("Concurrent requests:")
+    ok = True
+    service = make_service()
+    render = service.render
+
+    def slow_render(*args):
+        time.sleep(0.3)  # long enough for every request to arrive mid-render
+        return render(*args)
+
+    service.render = slow_render
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.tier_list("tier=S")[0]))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ok &= check(service.counts["rendered"] == 1 and service.counts["coalesced"] == 4,
+                "five requests for the same variant render it once")
+    ok &= check(len(results) == 5 and len(set(results)) == 1, "and all get the same bytes")
+    return ok
+
+
+def test_unknown_names(fake):
+    print("Names with no art:")
+    ok = True
+    service = make_service()
+    generator = service.generator
+    # A name Steam was searched for before, and one with a known app ID
+    generator.search_cache["peglin"] = {"term": "Peglin", "fetched": time.time(),
+                                        "items": [{"type": "app", "name": "Peglin", "id": 1296610}]}
+    generator.game_id_cache["noita"] = 881100
+    query = "A=Peglin&A=Noita&B=Not+A+Real+Game"
+
+    before, fake.calls[:] = files(), []
+    data, _, timings = service.tier_list(query)
+    ok &= check(not fake.calls and generator.net.snapshot()["requests"] == 0,
+                "a query naming games with no art makes no Steam requests")
+    ok &= check(files() == before,
+                "and writes nothing: no game_ids.json, steam_images/ or search cache")
+    ok &= check(decode(data).size[0] > 0 and not generator.degraded_tiles,
+                "they're drawn as placeholders, not reported as degraded")
+
+    misses = generator.tiles.misses
+    service.tier_list(query + "&max_games_per_row=2")
+    ok &= check(generator.tiles.misses == misses,
+                "placeholder tiles are pooled like any other")
+    return ok
+
+
+def test_http():
+    print("HTTP:")
+    ok = True
+    server = make_service().serve(0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def status(path):
+        try:
+            with urllib.request.urlopen(base + path):
+                return 200
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    try:
+        with urllib.request.urlopen(f"{base}/tierlist.png?tier=S") as response:
+            ok &= check(response.headers["Content-Type"] == "image/png"
+                        and "render;dur=" in response.headers["Server-Timing"],
+                        "serves the PNG with its Server-Timing")
+        ok &= check(status("/tierlist.png?tile_width=9000") == 400, "a bad parameter is 400")
+        ok &= check(status("/tierlist.png?year=1999") == 404, "no matching games is 404")
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            metrics = json.load(response)
+        ok &= check(metrics["rendered"] == 1 and metrics["bad_request"] == 1
+                    and metrics["timings"]["render"]["count"] == 1,
+                    "/metrics has the counts and per-step timings")
+        ok &= check(metrics["tiles"]["entries"] == 2 and "open_fds" in metrics["process"]
+                    and "peak_rss_bytes" in metrics["process"],
+                    "and the tile pool and process memory and file counts")
+    finally:
+        server.shutdown()
+    return ok
+
+
+if __name__ == "__main__":
+    cwd = os.getcwd()
+    fake = FakeRequests()
+    saved, sys.modules["requests"] = sys.modules.get("requests"), fake
+    try:
+        results = [
+            test_variants(),
+            test_caching(),
+            test_coalescing(),
+            test_unknown_names(fake),
+            test_http(),
+        ]
+        results.append(check(not fake.calls, "no test made a request"))
+    finally:
+        os.chdir(cwd)
+        if saved is None:
+            del sys.modules["requests"]
+        else:
+            sys.modules["requests"] = saved
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Offline tests for the generator's tile caches: staged prefetch art, cache
+warm-up, pre-scaled tiles, the in-memory tile pool and the dry-run tile plan.
+
+Runs in a throwaway directory with synthetic capsules and Steam lookups
+stubbed out, so nothing touches steam_images/ or the network. Run with:
+
+    cd scripts && python3 test_tile_cache.py
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageChops, ImageDraw
+
+import run_cache
+from tier_list_generator import TierListGenerator
+
+
+def make_capsule(path, color):
+    img = Image.new('RGB', (600, 900), color)
+    draw = ImageDraw.Draw(img)
+    for i in range(0, 600, 40):
+        draw.line([(i, 0), (600 - i, 900)], fill=(255 - color[0], i % 255, 90), width=7)
+    img.save(path, quality=92)
+
+
+def make_generator():
+    # Fresh working dir: the generator's cache paths are relative to it
+    os.chdir(tempfile.mkdtemp())
+    g = TierListGenerator(verbose=False)
+    g.search_steam_game = lambda name, persist=True: None  # offline
+    return g
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_warm_up(g):
+    print("Cache warm-up:")
+    ok = True
+    os.makedirs(g.staging_dir, exist_ok=True)
+    make_capsule(os.path.join(g.cache_dir, "Balatro_capsule.jpg"), (200, 30, 30))
+    make_capsule(os.path.join(g.staging_dir, "Mewgenics_capsule.jpg"), (30, 200, 30))
+    Image.new('RGB', (460, 215), 'navy').save(os.path.join(g.staging_dir, "Obscure_Game.jpg"))
+
+    failed = g.warm_tile_cache(["Balatro", "Mewgenics", "Obscure Game", "Nobody Knows"])
+    ok &= check(failed == ["Nobody Knows"], "reports the names with no art at all")
+    ok &= check(len(os.listdir(g.tile_cache_dir)) == 2,
+                "pre-scales a tile for each capsule, released or staged")
+    ok &= check(not os.path.exists(os.path.join(g.cache_dir, "Mewgenics_capsule.jpg")),
+                "warm-up leaves unreleased art staged, out of steam_images/")
+    return ok
+
+
+def test_scaled_tiles(g):
+    print("Pre-scaled tiles:")
+    ok = True
+    size = (150, 225)
+    with Image.open(os.path.join(g.cache_dir, "Balatro_capsule.jpg")) as src:
+        fresh = src.resize(size, Image.Resampling.LANCZOS)
+
+    calls = []
+    original = g.get_game_tile_image
+    g.get_game_tile_image = lambda name: calls.append(name) or original(name)
+
+    cached = g.get_scaled_tile("Balatro", size).convert('RGB')
+    ok &= check(not calls, "a warm tile skips decoding and resizing the capsule")
+    ok &= check(ImageChops.difference(cached, fresh).getbbox() is None,
+                "cached tile is pixel-identical to a fresh resize")
+
+    g.get_scaled_tile("Mewgenics", size)
+    ok &= check(os.path.exists(os.path.join(g.cache_dir, "Mewgenics_capsule.jpg"))
+                and not os.path.exists(os.path.join(g.staging_dir, "Mewgenics_capsule.jpg")),
+                "rendering a game promotes its staged capsule into steam_images/")
+
+    make_capsule(os.path.join(g.cache_dir, "Balatro_capsule.jpg"), (20, 20, 200))
+    calls.clear()
+    g.get_scaled_tile("Balatro", size)
+    ok &= check(calls == ["Balatro"], "replaced capsule art invalidates its cached tile")
+    return ok
+
+
+def test_tile_pool(g):
+    print("Tile pool:")
+    ok = True
+    size = (150, 225)
+    for name, color in (("Hades", (120, 20, 20)), ("Noita", (20, 120, 20)),
+                        ("Dead Cells", (20, 20, 120))):
+        make_capsule(os.path.join(g.cache_dir, f"{g._safe_filename(name)}_capsule.jpg"), color)
+    Image.new('RGB', (460, 215), 'navy').save(os.path.join(g.cache_dir, "Header_Only.jpg"))
+
+    fds = run_cache.process_stats()["open_fds"]
+    pool = TierListGenerator(verbose=False, tile_pool_bytes=2 * 150 * 225 * 3)
+    pool.search_steam_game = g.search_steam_game
+    tiles = [pool.get_scaled_tile(name, size) for name in ("Hades", "Noita", "Dead Cells")]
+    header = pool.get_steam_header_image("Header Only")
+    ok &= check(all(getattr(img, 'fp', None) is None for img in tiles + [header]),
+                "tiles and headers come back decoded, with their files closed")
+    stats = pool.tiles.stats()
+    ok &= check(stats["entries"] == 2 and stats["bytes"] <= stats["budget_bytes"]
+                and stats["evictions"] == 1,
+                "the pool stays within its byte budget, least recently used out first")
+    ok &= check(pool.get_scaled_tile("Dead Cells", size) is tiles[2]
+                and pool.get_scaled_tile("Hades", size) is not tiles[0],
+                "a pooled tile is reused; an evicted one is loaded again")
+
+    pool.generate_tier_list({'S': ["Hades", "Noita", "Dead Cells", "Header Only"]},
+                            "pool.png")
+    if fds is not None:
+        ok &= check(run_cache.process_stats()["open_fds"] == fds,
+                    "rendering leaves no art files open")
+    return ok
+
+
+def test_tile_plan(g):
+    print("Dry-run tile plan:")
+    ok = True
+    size = (150, 225)
+    make_capsule(os.path.join(g.staging_dir, "Peglin_capsule.jpg"), (90, 90, 200))
+    g.game_id_cache["obscure game"] = "12345"
+    plans = {name: g.plan_tile(name, size)
+             for name in ["Balatro", "Mewgenics", "Peglin", "Obscure Game", "Nobody Knows"]}
+    ok &= check(plans == {"Balatro": "warm", "Mewgenics": "warm", "Peglin": "staged",
+                          "Obscure Game": "probe", "Nobody Knows": "search"},
+                f"classifies tiles from disk state alone ({plans})")
+    ok &= check(g.plan_tile("Balatro", (100, 150)) == "resize",
+                "a new tile size needs a resize")
+
+    tiers = {'S': ["Balatro"], 'A': ["Nobody Knows"]}
+    before = g.render_signature(tiers)
+    g.generate_tier_list(tiers, "tierlist.png")
+    ok &= check(g.last_render_signature == before,
+                "the planned signature is what the render records")
+    make_capsule(os.path.join(g.cache_dir, "Balatro_capsule.jpg"), (10, 120, 10))
+    ok &= check(g.render_signature(tiers) != before, "new art changes the signature")
+    return ok
+
+
+if __name__ == "__main__":
+    g = make_generator()
+    results = [
+        test_warm_up(g),
+        test_scaled_tiles(g),
+        test_tile_pool(g),
+        test_tile_plan(g),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
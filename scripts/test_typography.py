@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Offline tests for the share cards' typography layer: each cached or
+searched result must match what plain ImageDraw calls produce.
+
+Uses the vendored fonts only. Run with:
+
+    cd scripts && python3 test_typography.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageDraw
+
+import typography
+from export_share_cards import GROTESK, INTER, grotesk, inter
+
+TITLES = [
+    "Balatro",
+    "Vampire Crawlers: The Turbo Wildcard from Vampire Survivors",
+    "The Binding of Isaac: Rebirth",
+    "Slay the Spire",
+    "Monster Train 2",
+    "Risk of Rain Returns",
+    "Supercalifragilisticexpialidocious Roguelite Deckbuilder Adventure",
+    "A B C D E F G H I J K L M N O P Q R S T U V W X Y Z",
+]
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def linear_fit_lines(draw, text, loader, max_width, high, low, max_lines=2):
+    """The walk from `high` down in 2px steps that fit_lines replaced."""
+    font, lines = loader(low), [text]
+    for size in range(high, low - 1, -2):
+        font = loader(size)
+        lines, current = [], ""
+        for word in text.split():
+            trial = f"{current} {word}".strip()
+            if draw.textlength(trial, font=font) <= max_width:
+                current = trial
+            else:
+                lines.append(current)
+                current = word
+        if current:
+            lines.append(current)
+        if len(lines) <= max_lines:
+            return font, lines
+    return font, lines[:max_lines]
+
+
+def test_fonts():
+    print("Fonts:")
+    ok = True
+    ok &= check(grotesk(40) is grotesk(40) and inter(21) is typography.font(INTER, 21, "Regular"),
+                "one font object per face, size and weight")
+    ok &= check(grotesk(40) is not grotesk(40, "Medium") and grotesk(40) is not grotesk(42),
+                "different sizes and weights are different fonts")
+    draw = ImageDraw.Draw(Image.new("RGBA", (10, 10)))
+    ok &= check(all(typography.advance(inter(19, "Medium"), name)
+                    == draw.textlength(name, font=inter(19, "Medium"))
+                    for name in ("Spotify", "Apple Podcasts", "Overcast")),
+                "advances match ImageDraw.textlength")
+    return ok
+
+
+def test_fit_lines():
+    print("Title fitting:")
+    ok = True
+    draw = ImageDraw.Draw(Image.new("RGBA", (10, 10)))
+    loader = lambda size: typography.font(GROTESK, size, "Bold")  # noqa: E731
+    mismatches = []
+    for title in TITLES:
+        for width in (300, 520, 640):
+            expected = linear_fit_lines(draw, title, loader, width, 76, 36)
+            got = typography.fit_lines(title, loader, width, 76, 36)
+            if (got[0].size, got[1]) != (expected[0].size, expected[1]):
+                mismatches.append(f"{title} @ {width}px")
+    ok &= check(not mismatches, "binary search picks the same size and lines as the linear walk" +
+                (f" (differs for: {'; '.join(mismatches)})" if mismatches else ""))
+    font, lines = typography.fit_lines(TITLES[-2], loader, 120, 76, 36)
+    ok &= check(font.size == 36 and len(lines) == 2,
+                "nothing fits: the smallest size, truncated to max_lines")
+    return ok
+
+
+def test_tracked():
+    print("Tracked text:")
+    ok = True
+    font = inter(23, "Bold")
+    for xy in ((120, 80), (120.5, 80.25), (77.3, 41.9)):
+        background = Image.new("RGBA", (700, 160), (30, 32, 40, 255))
+        direct, stamped = background.copy(), background.copy()
+        draw = ImageDraw.Draw(direct)
+        x, y = xy
+        for char in "EPISODE 48":
+            draw.text((x, y), char, font=font, fill=(255, 59, 48))
+            x += draw.textlength(char, font=font) + 2.8
+        typography.tracked(stamped, xy, "EPISODE 48", font, (255, 59, 48), 2.8)
+        ok &= check(direct.tobytes() == stamped.tobytes(),
+                    f"sprite at {xy} is byte-identical to per-character draw.text")
+
+    before = typography._glyph_mask.cache_info().misses
+    typography.tracked(Image.new("RGBA", (700, 160)), (120, 80), "EPISODE 48", font, (0, 0, 0), 2.8)
+    ok &= check(typography._glyph_mask.cache_info().misses == before,
+                "repeated strings reuse their rasterized glyphs")
+
+    for xy in ((300, 500), (312.5, 497.75)):
+        direct = Image.new("RGBA", (900, 630), (30, 32, 40, 255))
+        stamped = direct.copy()
+        ImageDraw.Draw(direct).text(xy, "RoguePod LiteCast", font=grotesk(30), fill=(255, 255, 255))
+        typography.draw_text(stamped, xy, "RoguePod LiteCast", grotesk(30), (255, 255, 255))
+        ok &= check(direct.tobytes() == stamped.tobytes(),
+                    f"draw_text at {xy} is byte-identical to draw.text, kerning included")
+    return ok
+
+
+if __name__ == "__main__":
+    results = [
+        test_fonts(),
+        test_fit_lines(),
+        test_tracked(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Offline tests for how update_tier_list schedules and fails its steps, and
+for the --dry-run plan.
+
+The feed, doc, Steam and render steps are replaced with stubs, so no network,
+credentials or image work is needed. Run with:
+
+    cd scripts && python3 test_updater_pipeline.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from aliases import AliasRegistry
+from automated_tierlist_updater import AutomatedTierListUpdater, _run_stages
+from http_guard import HttpGuard
+from run_cache import RunCache
+from tier_list_generator import TierListGenerator
+
+
+class StubGenerator:
+    TILE_WIDTH = 150
+    TILE_PLAN_COST = TierListGenerator.TILE_PLAN_COST
+
+    def __init__(self, plans=None):
+        self.rendered = None
+        self.prefetched = None
+        self.last_render_signature = None
+        self.plans = plans or {}
+        self.art = {}
+        self.tiles = RunCache()
+        self.net = HttpGuard()
+        self.degraded_tiles = {}
+
+    def prefetch_tile_art(self, game_names):
+        self.prefetched = list(game_names)
+        return 0
+
+    def generate_tier_list(self, tiers, output_path):
+        self.rendered = tiers
+        self.last_render_signature = self.render_signature(tiers)
+        open(output_path, 'wb').close()
+
+    def plan_tile(self, game_name, size):
+        return self.plans.get(game_name, 'warm')
+
+    def render_signature(self, tiers):
+        games = [g for t in tiers.values() for g in t]
+        return {'layout': {}, 'tiers': tiers, 'tiles': {g: self.art.get(g) for g in games}}
+
+
+def make_updater(episodes=None, tiers=None, doc_delay=0):
+    u = AutomatedTierListUpdater.__new__(AutomatedTierListUpdater)
+    u.verbose = False
+    u.aliases = AliasRegistry([])
+    u.state_dir = tempfile.mkdtemp()
+    u.ledger_path = os.path.join(u.state_dir, "episode_ledger.json")
+    u.generator = StubGenerator()
+    u.fetch_rss_episodes = lambda **kwargs: list(episodes or [])
+    u.fetch_tier_list = lambda: time.sleep(doc_delay) or dict(tiers or {})
+    return u
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_stage_graph():
+    print("Stage graph:")
+    ok = True
+
+    def slow(value):
+        def fn(**_):
+            time.sleep(0.2)
+            return value
+        return fn
+
+    start = time.perf_counter()
+    results, timings = _run_stages([
+        ('a', (), slow(1)),
+        ('b', (), slow(2)),
+        ('c', ('a', 'b'), lambda a, b: a + b),
+    ])
+    elapsed = time.perf_counter() - start
+    ok &= check(results['c'] == 3 and elapsed < 0.35,
+                f"independent stages overlap ({elapsed:.2f}s for two 0.2s stages)")
+    ok &= check(set(timings) == {'a', 'b', 'c'}, "every stage is timed")
+
+    ran = []
+    results, _ = _run_stages([
+        ('a', (), lambda: None),
+        ('b', (), lambda: time.sleep(0.05) or 'ok'),
+        ('c', ('a',), lambda a: ran.append('c')),
+        ('d', ('b',), lambda b: ran.append('d')),
+    ])
+    ok &= check(not ran and results == {'b': 'ok'},
+                "a failure lets running stages finish but starts no new ones")
+
+    def boom():
+        raise ValueError("boom")
+
+    try:
+        _run_stages([('a', (), boom), ('b', ('a',), lambda a: a)])
+        raised = False
+    except ValueError:
+        raised = True
+    ok &= check(raised, "exceptions propagate like they did when the steps ran inline")
+    return ok
+
+
+def test_update_outcomes():
+    print("update_tier_list outcomes:")
+    ok = True
+    episodes = [{'title': 'Balatro', 'pub_date': 'x'}, {'title': 'Peglin', 'pub_date': 'y'}]
+    tiers = {'S': ['Balatro'], 'A': ['Peglin', 'Mewgenics']}
+
+    u = make_updater(episodes, tiers)
+    ok &= check(u.update_tier_list(output_path=os.path.join(u.state_dir, "t.png")) is True,
+                "succeeds when every stage does")
+    ok &= check(u.generator.rendered == {'S': ['Balatro'], 'A': ['Peglin']},
+                "renders only released games")
+    ok &= check(u.generator.prefetched == ['Balatro', 'Peglin', 'Mewgenics'],
+                "prefetches art for every doc game, released or not")
+
+    # The doc arrives after the feed has failed, so Steam must never start
+    u = make_updater([], tiers, doc_delay=0.1)
+    ok &= check(u.update_tier_list() is False and u.generator.rendered is None
+                and u.generator.prefetched is None,
+                "feed failure fails the run before any Steam or render work")
+
+    u = make_updater(episodes, {})
+    ok &= check(u.update_tier_list() is False and u.generator.prefetched is None,
+                "doc failure fails the run and skips Steam prefetch")
+
+    u = make_updater(episodes, {'S': ['Unrelated Game']})
+    ok &= check(u.update_tier_list() is False,
+                "no matches still fails the run")
+
+    u = make_updater(episodes, tiers)
+    output = os.path.join(u.state_dir, "t.png")
+    u.update_tier_list(output_path=output, skip_unchanged=True)
+    u.generator.rendered = None
+    ok &= check(u.update_tier_list(output_path=output, skip_unchanged=True) is True
+                and u.generator.rendered is None and u.last_output_changed is False,
+                "skip_unchanged succeeds without re-rendering an up-to-date image")
+    return ok
+
+
+def dry_run(u, output_path):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        success = u.plan_update(output_path=output_path, save_debug=False)
+    return success, out.getvalue()
+
+
+def test_dry_run():
+    print("Dry run plan:")
+    ok = True
+    episodes = [{'title': 'Balatro', 'pub_date': 'x'}, {'title': 'Peglin', 'pub_date': 'y'}]
+    tiers = {'S': ['Balatro'], 'A': ['Peglin', 'Mewgenics']}
+    u = make_updater(episodes, tiers)
+    u.generator = StubGenerator(plans={'Peglin': 'search'})
+    output = os.path.join(u.state_dir, "tierlist.png")
+
+    success, report = dry_run(u, output)
+    ok &= check(success and u.generator.rendered is None and u.generator.prefetched is None,
+                "plans without rendering or prefetching Steam art")
+    ok &= check("1 cache hits" in report and "search, probes + download: Peglin" in report,
+                "groups tiles by how much work they need")
+    ok &= check("up to 6 Steam requests, 1 image downloads, 1 tile resizes" in report,
+                "predicts the Steam traffic and image work")
+    ok &= check("would be created" in report, "reports a missing output")
+
+    u.generator.plans = {}
+    u.update_tier_list(output_path=output)
+    _, report = dry_run(u, output)
+    ok &= check(f"{output}: unchanged" in report, "same games and art: output unchanged")
+
+    u.fetch_tier_list = lambda: {'S': ['Peglin'], 'A': ['Balatro']}
+    u.generator.art = {'Peglin': 'capsule:abc'}
+    _, report = dry_run(u, output)
+    ok &= check("Peglin A→S" in report and "Balatro S→A" in report
+                and "new art for Peglin" in report,
+                "names the moves and art changes that would change the output")
+
+    u = make_updater(episodes, {'S': ['Unrelated Game']})
+    ok &= check(dry_run(u, output)[0] is False, "fails when the real run would")
+    return ok
+
+
+if __name__ == "__main__":
+    results = [
+        test_stage_graph(),
+        test_update_outcomes(),
+        test_dry_run(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
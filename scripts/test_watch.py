@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Offline tests for --watch: change detection, backoff and the health
+endpoint.
+
+The updater's probes and update are stubbed, so no network, credentials or
+rendering is needed. Run with:
+
+    cd scripts && python3 test_watch.py
+"""
+
+import io
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from automated_tierlist_updater import AutomatedTierListUpdater
+from tierlist_watch import TierListWatcher
+
+
+class StubUpdater:
+    """Just the updater surface the watcher uses."""
+
+    def __init__(self):
+        self.head, self.revision = "g48", "rev-1"
+        self.watermark, self.cached_revision = "g48", "rev-1"
+        self.runs = []
+        self.succeed = True
+        self.feed_error = None
+
+    def vprint(self, message):
+        pass
+
+    def probe_feed(self, validators):
+        if self.feed_error:
+            raise self.feed_error
+        if validators.get('etag') == self.head:
+            return None, validators  # 304
+        return self.head, {'etag': self.head}
+
+    def load_ledger(self):
+        return {'watermark': {'guid': self.watermark}}
+
+    def fetch_doc_revision(self):
+        return self.revision
+
+    def _load_doc_cache(self):
+        return {'revision_id': self.cached_revision}
+
+    def update_tier_list(self, output_path, incremental=False, skip_unchanged=False,
+                         deadline=None):
+        self.runs.append((incremental, skip_unchanged))
+        if self.succeed:
+            self.watermark, self.cached_revision = self.head, self.revision
+        self.last_timings = {'feed': 0.1, 'render': 0.5}
+        self.last_output_changed = self.succeed
+        return self.succeed
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None):
+        self.status_code, self.headers = status, headers or {}
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response, self.headers = response, None
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        self.headers = headers
+        return self.response
+
+
+def check(condition, message):
+    status = "PASS" if condition else "FAIL"
+    print(f"  [{status}] {message}")
+    return condition
+
+
+def test_probe_feed():
+    print("Feed probe:")
+    ok = True
+    u = AutomatedTierListUpdater.__new__(AutomatedTierListUpdater)
+    u.rss_url = "https://feed.invalid/rss"
+    feed = (b"<rss><channel><item><title>Pathogenic</title><guid>g48</guid></item>"
+            b"<item><title>Everything is Crab</title><guid>g47</guid></item></channel></rss>")
+    u.session = FakeSession(FakeResponse(200, feed, {'ETag': '"abc"'}))
+    head, validators = u.probe_feed()
+    ok &= check(head == "g48" and validators['etag'] == '"abc"',
+                "reads the newest guid and keeps the ETag")
+    u.session = FakeSession(FakeResponse(304))
+    head, again = u.probe_feed(validators)
+    ok &= check(head is None and u.session.headers == {'If-None-Match': '"abc"'}
+                and again == validators,
+                "sends the ETag back; a 304 means unchanged")
+    return ok
+
+
+def test_change_detection():
+    print("Change detection and backoff:")
+    ok = True
+    u = StubUpdater()
+    w = TierListWatcher(u, min_interval=10, max_interval=40)
+
+    ok &= check(w.poll_once() == set() and not u.runs, "quiet poll runs nothing")
+    ok &= check(w.poll_once() == set() and w.interval == 22.5,
+                "quiet polls back off")
+    w.poll_once()
+    w.poll_once()
+    ok &= check(w.interval == 40, "backoff is capped at max_interval")
+
+    u.head = "g49"
+    ok &= check(w.poll_once() == {'feed'} and u.runs == [(True, True)],
+                "a new episode triggers one incremental update")
+    ok &= check(w.interval == 10, "a change resets the interval")
+    ok &= check(w.poll_once() == set() and len(u.runs) == 1,
+                "the next poll sees nothing new")
+
+    u.revision = "rev-2"
+    ok &= check(w.poll_once() == {'doc'}, "a doc edit triggers an update too")
+
+    u.head, u.succeed = "g50", False
+    w.poll_once()
+    u.succeed = True
+    ok &= check(w.pending == {'feed'} and w.poll_once() == {'feed'} and w.pending is None,
+                "a failed update is retried on the next poll")
+
+    u.feed_error, u.revision = OSError("offline"), None
+    before = w.metrics['poll_errors']
+    w.poll_once()
+    ok &= check(w.metrics['poll_errors'] == before + 1 and w.interval == 15,
+                "failing probes count as errors and back off")
+    return ok
+
+
+def test_health_endpoint():
+    print("Health endpoint:")
+    ok = True
+    u = StubUpdater()
+    w = TierListWatcher(u, min_interval=10, max_interval=40)
+    u.head = "g49"
+    w.poll_once()
+    server = w.serve(0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(base + "/healthz") as resp:
+            ok &= check(resp.status == 200 and json.load(resp)['status'] == 'ok',
+                        "/healthz is 200 while polls succeed")
+        with urllib.request.urlopen(base + "/metrics") as resp:
+            metrics = json.load(resp)
+        ok &= check(metrics['updates'] == 1 and metrics['last_run']['trigger'] == ['feed']
+                    and metrics['last_run']['timings'] == {'feed': 0.1, 'render': 0.5},
+                    "/metrics reports the last run and its stage timings")
+
+        w._last_ok_monotonic -= 40 * 3 + 1
+        try:
+            urllib.request.urlopen(base + "/healthz")
+            status = 200
+        except urllib.error.HTTPError as e:
+            status = e.code
+        ok &= check(status == 503, "/healthz goes 503 once polls have been failing too long")
+    finally:
+        server.shutdown()
+    return ok
+
+
+if __name__ == "__main__":
+    results = [
+        test_probe_feed(),
+        test_change_detection(),
+        test_health_endpoint(),
+    ]
+    if all(results):
+        print("\nAll tests passed ✅")
+        sys.exit(0)
+    print("\nSome tests FAILED ❌")
+    sys.exit(1)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+On-demand tier list variants: a small local HTTP service around
+TierListGenerator.generate_tier_list, for filtered or re-laid-out tier lists
+(one tier, bigger tiles, one year's games) without a batch run for each.
+
+    GET /tierlist.png?tier=S&tile_width=100&max_games_per_row=8
+    GET /tierlist.png?year=2025
+    GET /tierlist.png?S=Balatro&S=Hades&A=Slay+the+Spire
+
+Query parameters:
+
+    S, A, ... F        the tier data, one game per value (repeat for more).
+                       Without any, the tier list the updater last rendered to
+                       public/tierlist.png (from .cache/render_manifest.json)
+    tier               keep only these tiers (repeatable)
+    year               keep only games whose episode was published that year
+                       (from the updater's .cache/episode_ledger.json)
+    tile_width, max_games_per_row
+                       layout overrides (generate_tier_list's defaults otherwise)
+
+Encoded PNGs are cached in memory by a hash of the render signature (see
+TierListGenerator.render_signature): the layout, the tiers after filtering and
+the art behind each tile. So two queries that come to the same picture share
+one entry, and new art is never served stale. Concurrent requests for the same
+picture wait on one render. Tiles stay decoded in memory between renders, in
+a pool capped at --tile-mb and keyed on the art they're drawn from.
+
+The service only draws art that's already on disk: the names come from the
+query string, so it never asks Steam about them or saves anything it would
+learn (game_ids.json, steam_images/, the search cache). A game with no art on
+disk is drawn as a named placeholder; the updater's next run fetches art for
+the games it renders.
+
+Each response has a Server-Timing header (resolve: query to signature; tiles:
+loading any tiles not in memory; render: drawing and PNG encoding), and
+/metrics has p50/p95 of each, the tile pool's size and evictions, and the
+process's peak RSS and open file count.
+
+    python scripts/tierlist_server.py [--port 8789] [--memory-mb 64] [--tile-mb 128]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+import http_guard  # noqa: E402
+import run_cache  # noqa: E402
+from request_cache import LatencyLog, ResponseCache  # noqa: E402
+from tier_list_generator import TierListGenerator  # noqa: E402
+
+DEFAULT_PORT = 8789
+DEFAULT_OUTPUT = "../public/tierlist.png"
+# The production tier list is ~1-2MB as PNG
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+# Decoded tiles are ~100KB at the default size
+DEFAULT_TILE_BYTES = 128 * 1024 * 1024
+# Full-size capsules, decoded only to scale a tile that isn't on disk yet:
+# a few in flight, not every capsule the service has ever scaled
+DEFAULT_DECODE_BYTES = 32 * 1024 * 1024
+TIER_ORDER = ['S', 'A', 'B', 'C', 'D', 'E', 'F']
+# Bounds on what a query can ask for, so one request can't ask for a
+# gigapixel canvas
+TILE_WIDTH_RANGE = (30, 600)
+GAMES_PER_ROW_RANGE = (1, 40)
+MAX_GAMES = 300
+
+
+class BadRequest(ValueError):
+    """A query the service can't render; the message says why."""
+
+
+class WarmTileGenerator(TierListGenerator):
+    """A TierListGenerator for a long-lived process: a bigger tile pool, so
+    tiles stay decoded between renders, and its own small budget for
+    full-size capsules rather than the shared run cache's.
+
+    tile_source() is memoized per art file size and mtime, so a warm render
+    hashes nothing.
+
+    It never looks a game up: `net` refuses every request and
+    search_steam_game() finds nothing, so a query can't make the service
+    wait on Steam or write to game_ids.json, steam_images/ or the search
+    cache. Games with no art on disk are drawn as placeholders, and pooled
+    like any other tile.
+    """
+
+    def __init__(self, tile_bytes=DEFAULT_TILE_BYTES, decode_bytes=DEFAULT_DECODE_BYTES,
+                 **kwargs):
+        super().__init__(tile_pool_bytes=tile_bytes, **kwargs)
+        self.decoded = run_cache.RunCache(decode_bytes)
+        self.net = http_guard.HttpGuard(offline=True)
+        self._sources = {}
+
+    def search_steam_game(self, game_name, persist=True):
+        return None
+
+    def get_game_tile_image(self, game_name):
+        tile = super().get_game_tile_image(game_name)
+        # Not degraded: this generator never asks Steam, so there's nothing
+        # for a later render to backfill
+        self.degraded_tiles.pop(game_name, None)
+        return tile
+
+    def tile_source(self, game_name):
+        key = (game_name, self._art_stats(game_name))
+        if key not in self._sources:
+            self._sources[key] = super().tile_source(game_name)
+        return self._sources[key]
+
+
+class TierListServer:
+    def __init__(self, generator=None, memory_bytes=DEFAULT_MEMORY_BYTES,
+                 output_path=DEFAULT_OUTPUT, state_dir=".cache"):
+        self.generator = generator or WarmTileGenerator()
+        self.output_path = output_path
+        self.state_dir = state_dir
+        self.responses = ResponseCache(memory_bytes)
+        # One render at a time: generate_tier_list prints its progress, which
+        # is captured per render, and shares its fonts between calls
+        self._render_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.timings = LatencyLog()
+        self.counts = {"memory": 0, "coalesced": 0, "rendered": 0,
+                       "bad_request": 0, "not_found": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Tier data
+    # ------------------------------------------------------------------
+
+    def default_tiers(self):
+        """The tiers last rendered to output_path, or None."""
+        path = os.path.join(self.state_dir, "render_manifest.json")
+        if not os.path.exists(path):
+            return None
+        signature = run_cache.shared().json(path).get(os.path.abspath(self.output_path))
+        return signature and signature.get('tiers')
+
+    def release_years(self):
+        """{tier list game: year its episode was first published}, from the
+        updater's episode ledger; empty if there isn't one."""
+        path = os.path.join(self.state_dir, "episode_ledger.json")
+        if not os.path.exists(path):
+            return {}
+        ledger = run_cache.shared().json(path)
+        published = {}
+        for episode in ledger.get('episodes', []):  # newest first
+            try:
+                published[episode['game']] = parsedate_to_datetime(episode['pub_date']).year
+            except (KeyError, TypeError, ValueError):
+                continue
+        return {match['tier_game']: published[match['episode_title']]
+                for match in ledger.get('matches', []) if match['episode_title'] in published}
+
+    def variant(self, query):
+        """(tiers, tile_width, max_games_per_row) for a query string. Raises
+        BadRequest for one the service can't render."""
+        params = parse_qs(query, keep_blank_values=False)
+        unknown = sorted(set(params) - set(TIER_ORDER)
+                         - {'tier', 'year', 'tile_width', 'max_games_per_row'})
+        if unknown:
+            raise BadRequest(f"unknown parameter(s): {', '.join(unknown)}")
+
+        explicit = {tier: params[tier] for tier in TIER_ORDER if tier in params}
+        tiers = explicit or self.default_tiers()
+        if not tiers:
+            raise BadRequest("no tier data: pass S=..., A=... (no tier list has been rendered)")
+
+        if 'tier' in params:
+            keep = set(params['tier'])
+            if keep - set(TIER_ORDER):
+                raise BadRequest(f"tier must be one of {', '.join(TIER_ORDER)}")
+            tiers = {tier: games for tier, games in tiers.items() if tier in keep}
+        if 'year' in params:
+            year = self._int(params, 'year', (1900, 9999))
+            years = self.release_years()
+            tiers = {tier: [game for game in games if years.get(game) == year]
+                     for tier, games in tiers.items()}
+        tiers = {tier: list(dict.fromkeys(tiers[tier])) for tier in TIER_ORDER if tiers.get(tier)}
+        if sum(len(games) for games in tiers.values()) > MAX_GAMES:
+            raise BadRequest(f"more than {MAX_GAMES} games")
+
+        tile_width = self._int(params, 'tile_width', TILE_WIDTH_RANGE)
+        max_games_per_row = self._int(params, 'max_games_per_row', GAMES_PER_ROW_RANGE)
+        return (tiers, tile_width or self.generator.TILE_WIDTH,
+                max_games_per_row or self.generator.MAX_GAMES_PER_ROW)
+
+    @staticmethod
+    def _int(params, name, bounds):
+        if name not in params:
+            return None
+        try:
+            value = int(params[name][-1])
+        except ValueError:
+            raise BadRequest(f"{name} must be a whole number") from None
+        if not bounds[0] <= value <= bounds[1]:
+            raise BadRequest(f"{name} must be between {bounds[0]} and {bounds[1]}")
+        return value
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def tier_list(self, query):
+        """(PNG bytes, cache key, {step: ms}) for a query string, or None if
+        no games are left after filtering. Raises BadRequest."""
+        timings = {}
+        started = time.perf_counter()
+        try:
+            tiers, tile_width, max_games_per_row = self.variant(query)
+        except BadRequest:
+            self._count("bad_request")
+            raise
+        if not tiers:
+            self._count("not_found")
+            return None
+        signature = self.generator.render_signature(tiers, tile_width, max_games_per_row)
+        key = hashlib.sha256(json.dumps(signature, sort_keys=True).encode('utf-8')).hexdigest()
+        timings['resolve'] = (time.perf_counter() - started) * 1000
+
+        def build():
+            try:
+                return self.render(tiers, tile_width, max_games_per_row, timings)
+            except Exception:
+                self._count("errors")
+                raise
+
+        data, how = self.responses.get(key, build)
+        self._count("rendered" if how == "built" else how)
+        timings['total'] = (time.perf_counter() - started) * 1000
+        for step, ms in timings.items():
+            self.timings.record(step, ms)
+        return data, key, timings
+
+    def render(self, tiers, tile_width, max_games_per_row, timings):
+        """PNG bytes of a tier list, with the time spent on tiles and on
+        drawing and encoding added to `timings`."""
+        size = (tile_width, (tile_width * 3) // 2)
+        buffer = io.BytesIO()
+        with self._render_lock, contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for games in tiers.values():
+                for game in games:
+                    self.generator.get_scaled_tile(game, size)
+            timings['tiles'] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            self.generator.generate_tier_list(tiers, buffer, tile_width=tile_width,
+                                              max_games_per_row=max_games_per_row)
+            timings['render'] = (time.perf_counter() - started) * 1000
+        return buffer.getvalue()
+
+    def _count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def snapshot(self):
+        with self._lock:
+            metrics = dict(self.counts)
+        metrics["cached_tier_lists"] = len(self.responses)
+        metrics["cached_bytes"] = self.responses.size_bytes
+        metrics["timings"] = self.timings.summary()
+        metrics["tiles"] = self.generator.tiles.stats()
+        metrics["steam"] = self.generator.net.snapshot()
+        metrics["process"] = run_cache.process_stats()
+        return metrics
+
+    def serve(self, port=DEFAULT_PORT, host="127.0.0.1"):
+        """Serve tier lists from a daemon thread. Returns the server (port 0
+        picks a free port: see server.server_address)."""
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path == "/tierlist.png":
+                    try:
+                        found = service.tier_list(url.query)
+                    except BadRequest as e:
+                        self.reply(400, "application/json", json.dumps({"error": str(e)}).encode())
+                        return
+                    except Exception as e:
+                        self.reply(500, "application/json", json.dumps({"error": str(e)}).encode())
+                        return
+                    if found is None:
+                        self.reply(404, "application/json", b'{"error": "no games match"}')
+                        return
+                    data, key, timings = found
+                    headers = {
+                        "ETag": f'"{key[:32]}"',
+                        "Cache-Control": "public, max-age=300",
+                        "Server-Timing": ", ".join(f"{step};dur={ms:.1f}"
+                                                   for step, ms in timings.items()),
+                    }
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        self.reply(304, None, b"", headers)
+                    else:
+                        self.reply(200, "image/png", data, headers)
+                elif url.path == "/healthz":
+                    self.reply(200, "application/json", b'{"status": "ok"}')
+                elif url.path == "/metrics":
+                    self.reply(200, "application/json",
+                               json.dumps(service.snapshot(), indent=2).encode("utf-8"))
+                else:
+                    self.reply(404, "application/json", b'{"error": "not found"}')
+
+            def reply(self, status, content_type, payload, headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve tier list variants on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_BYTES // (1024 * 1024),
+                        help="in-memory tier list cache budget (default %(default)s)")
+    parser.add_argument("--tile-mb", type=int, default=DEFAULT_TILE_BYTES // (1024 * 1024),
+                        help="decoded tile pool budget (default %(default)s)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    # The generator's caches (steam_images/, .cache/) are relative to scripts/
+    os.chdir(SCRIPTS_DIR)
+    service = TierListServer(WarmTileGenerator(tile_bytes=args.tile_mb * 1024 * 1024,
+                                               verbose=args.verbose),
+                             memory_bytes=args.memory_mb * 1024 * 1024)
+    server = service.serve(args.port, args.host)
+    host, port = server.server_address[:2]
+    print(f"Serving tier lists on http://{host}:{port}/tierlist.png")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
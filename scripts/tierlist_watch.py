@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the tier list updater (`automated_tierlist_updater.py --watch`).
+
+Instead of waiting for the weekly cron, a long-running process polls for the
+two things that can change the tier list — a new episode in the RSS feed and
+an edit to the Google Doc — and runs an incremental update as soon as either
+moves. One updater lives for the whole process, so the Docs client, the feed
+connection, Steam ID caches and decoded art all stay warm between runs.
+
+Idle polls are nearly free: the feed is a conditional GET (a 304 has no body)
+and the doc is a revisionId-only request. The interval starts at
+`min_interval` and grows by BACKOFF each quiet or failed poll up to
+`max_interval`; any change resets it.
+
+Health and the last run's metrics are served as JSON on 127.0.0.1:
+
+    /healthz  200 while polls are succeeding, 503 once they've been failing
+              (or stalled) for longer than STALE_AFTER max intervals
+    /metrics  counters, current interval, and the last update's outcome,
+              per-stage timings and any tiles drawn without Steam
+"""
+
+import json
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKOFF = 1.5
+STALE_AFTER = 3
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class TierListWatcher:
+    def __init__(self, updater, output_path="../public/tierlist.png", min_interval=60,
+                 max_interval=1800, on_update=None, deadline=None):
+        self.updater = updater
+        self.output_path = output_path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.on_update = on_update  # shell command run after the image changes
+        self.deadline = deadline    # seconds of Steam traffic per update
+        self.interval = min_interval
+
+        self.feed_validators = {}
+        self.feed_head = None       # newest episode guid seen by the last probe
+        self.pending = None         # what changed, if the last update failed
+
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.metrics = {
+            'started_at': _now(),
+            'polls': 0,
+            'poll_errors': 0,
+            'changes': 0,
+            'updates': 0,
+            'update_failures': 0,
+            'last_poll': None,
+            'last_successful_poll': None,
+            'last_change': None,
+            'last_run': None,
+        }
+        self._last_ok_monotonic = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def detect_changes(self):
+        """What moved since the last update: a subset of {'feed', 'doc'}.
+        Raises if neither source could be checked."""
+        updater = self.updater
+        changes = set()
+        errors = []
+
+        try:
+            head, self.feed_validators = updater.probe_feed(self.feed_validators)
+            if head is not None:
+                self.feed_head = head
+            watermark = updater.load_ledger().get('watermark', {}).get('guid')
+            if self.feed_head and self.feed_head != watermark:
+                changes.add('feed')
+        except Exception as e:
+            errors.append(f"feed: {e}")
+
+        revision = updater.fetch_doc_revision()
+        if revision is None:
+            errors.append("doc: revision unavailable")
+        elif revision != updater._load_doc_cache().get('revision_id'):
+            changes.add('doc')
+
+        if len(errors) == 2:
+            raise RuntimeError('; '.join(errors))
+        for error in errors:
+            updater.vprint(f"⚠️  Watch probe: {error}")
+        return changes
+
+    def poll_once(self):
+        """One poll: probe, update if something changed, adjust the interval.
+        Returns the set of changes acted on (empty when idle or on error)."""
+        with self._lock:
+            self.metrics['polls'] += 1
+            self.metrics['last_poll'] = _now()
+        try:
+            changes = self.detect_changes() | (self.pending or set())
+        except Exception as e:
+            print(f"⚠️  Watch poll failed: {e}")
+            with self._lock:
+                self.metrics['poll_errors'] += 1
+            self.interval = min(self.interval * BACKOFF, self.max_interval)
+            return set()
+
+        with self._lock:
+            self.metrics['last_successful_poll'] = _now()
+        self._last_ok_monotonic = time.monotonic()
+
+        if not changes:
+            self.interval = min(self.interval * BACKOFF, self.max_interval)
+            return set()
+
+        print(f"\n👀 Change detected ({', '.join(sorted(changes))}) at {_now()}")
+        with self._lock:
+            self.metrics['changes'] += 1
+            self.metrics['last_change'] = _now()
+
+        ok = self.run_update(changes)
+        if ok:
+            self.pending = None
+            self.interval = self.min_interval
+        else:
+            # Keep retrying the same change, backing off like an idle poll
+            self.pending = changes
+            self.interval = min(self.interval * BACKOFF, self.max_interval)
+        return changes
+
+    def run_update(self, changes):
+        updater = self.updater
+        started = time.perf_counter()
+        try:
+            ok = updater.update_tier_list(self.output_path, incremental=True,
+                                          skip_unchanged=True, deadline=self.deadline)
+        except Exception as e:
+            print(f"❌ Update raised: {e}")
+            ok = False
+        changed = ok and getattr(updater, 'last_output_changed', False)
+
+        run = {
+            'at': _now(),
+            'trigger': sorted(changes),
+            'ok': ok,
+            'output_changed': changed,
+            'wall_time': round(time.perf_counter() - started, 3),
+            'timings': {name: round(seconds, 3)
+                        for name, seconds in getattr(updater, 'last_timings', {}).items()},
+        }
+        degraded = getattr(updater, 'last_degraded_tiles', None)
+        if degraded:
+            run['degraded_tiles'] = sorted(degraded)
+        if changed and self.on_update:
+            hook = subprocess.run(self.on_update, shell=True)
+            run['hook_exit_code'] = hook.returncode
+            if hook.returncode:
+                print(f"⚠️  --on-update command exited with {hook.returncode}")
+
+        with self._lock:
+            self.metrics['updates' if ok else 'update_failures'] += 1
+            self.metrics['last_run'] = run
+        return ok
+
+    def run(self):
+        """Poll until stop() is called (or the process is interrupted)."""
+        print(f"👀 Watching the feed and doc (every {self.min_interval:g}s, "
+              f"backing off to {self.max_interval:g}s when quiet)")
+        while not self._stop.is_set():
+            self.poll_once()
+            self.updater.vprint(f"Next poll in {self.interval:.0f}s")
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+
+    # ------------------------------------------------------------------
+    # Health endpoint
+    # ------------------------------------------------------------------
+
+    def snapshot(self):
+        with self._lock:
+            metrics = json.loads(json.dumps(self.metrics))
+        metrics['interval'] = round(self.interval, 1)
+        metrics['pending'] = sorted(self.pending or ())
+        return metrics
+
+    def healthy(self):
+        return time.monotonic() - self._last_ok_monotonic <= self.max_interval * STALE_AFTER
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve /healthz and /metrics from a daemon thread. Returns the server
+        (port 0 picks a free port: see server.server_address)."""
+        watcher = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/healthz':
+                    healthy = watcher.healthy()
+                    status = 200 if healthy else 503
+                    body = {'status': 'ok' if healthy else 'stale',
+                            'last_successful_poll': watcher.snapshot()['last_successful_poll']}
+                elif self.path == '/metrics':
+                    status, body = 200, watcher.snapshot()
+                else:
+                    status, body = 404, {'error': 'not found'}
+                payload = json.dumps(body, indent=2).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # keep the update log readable
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
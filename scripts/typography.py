@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Text setting for the share cards: fonts, measurement, title fitting and
+letter-spaced labels.
+
+Each of these was being redone per card. The fonts themselves are memoized
+in run_cache (one FreeType face per path, size and weight per process); on
+top of that this caches:
+
+- advances: textlength per (font, string), so the per-character spacing in
+  tracked() and the per-word trials in fit_lines() are measured once
+- title fitting: a binary search over the candidate sizes rather than a walk
+  down from the largest, wrapping at ~5 sizes instead of up to 21
+- glyph masks: the rasterized ink of a string at a sub-pixel offset, so
+  "LISTEN ON", the eyebrows, the platform names and the byline are rendered
+  by FreeType once per run and stamped onto every card after that
+
+All of it is byte-identical to drawing with ImageDraw directly: the masks are
+the ones ImageDraw would render at the same sub-pixel offsets, applied with
+the same fill-through-mask blend (tracked text one character at a time, as
+before).
+"""
+
+import functools
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import run_cache  # noqa: E402
+
+
+def font(path, size, weight):
+    """The TrueType font at `path`, `size`, with named variation `weight`."""
+    return run_cache.shared().font(path, size, weight)
+
+
+@functools.lru_cache(maxsize=4096)
+def advance(font, text):
+    """Width of `text` in `font`, as ImageDraw.textlength measures it on the
+    cards' RGB/RGBA canvases."""
+    return font.getlength(text, "L")
+
+
+def wrap(text, font, max_width):
+    """Greedy word wrap of `text` at `max_width`."""
+    lines, current = [], ""
+    for word in text.split():
+        trial = f"{current} {word}".strip()
+        if advance(font, trial) <= max_width:
+            current = trial
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def fit_lines(text, loader, max_width, high, low, max_lines=2, step=2):
+    """Largest size in high, high - step, ... low at which `text` wraps to at
+    most `max_lines`; the smallest size, truncated, if none does.
+
+    Binary search: a smaller size never needs more lines than a larger one.
+    """
+    sizes = list(range(high, low - 1, -step))
+    best = None
+    first, last = 0, len(sizes) - 1
+    while first <= last:
+        middle = (first + last) // 2
+        lines = wrap(text, loader(sizes[middle]), max_width)
+        if len(lines) <= max_lines:
+            best, last = (loader(sizes[middle]), lines), middle - 1
+        else:
+            first = middle + 1
+    if best is not None:
+        return best
+    smallest = loader(sizes[-1])
+    return smallest, wrap(text, smallest, max_width)[:max_lines]
+
+
+@functools.lru_cache(maxsize=2048)
+def _glyph_mask(font, text, fraction):
+    """The mask ImageDraw.text renders for `text` at sub-pixel offset
+    `fraction` = (x, y), cropped to its ink, and the mask's offset from the
+    integer origin. None if `text` has no ink."""
+    from PIL import Image, ImageDraw
+    pad = math.ceil(font.size * 2)
+    canvas = Image.new("L", (math.ceil(advance(font, text)) + pad * 2, pad * 2), 0)
+    # On a black L canvas with fill 255 the blend leaves exactly the mask
+    ImageDraw.Draw(canvas).text((pad + fraction[0], pad + fraction[1]), text, font=font, fill=255)
+    bbox = canvas.getbbox()
+    if bbox is None:
+        return None
+    return (bbox[0] - pad, bbox[1] - pad), canvas.crop(bbox)
+
+
+def draw_text(card, xy, text, font, fill):
+    """ImageDraw.Draw(card).text(xy, text, font=font, fill=fill), from cached
+    glyph masks: a string drawn at the same spot on every card (a label, the
+    show name) is rasterized once."""
+    x, y = xy
+    glyph = _glyph_mask(font, text, (math.modf(x)[0], math.modf(y)[0]))
+    if glyph is not None:
+        (dx, dy), mask = glyph
+        card.paste(fill, (int(x) + dx, int(y) + dy), mask)
+
+
+def tracked(card, xy, text, font, fill, tracking=0):
+    """Draw text on `card` with letter-spacing, which PIL has no native
+    support for."""
+    x, y = xy
+    for char in text:
+        draw_text(card, (x, y), char, font, fill)
+        x += advance(font, char) + tracking
@@ -5,21 +5,35 @@ import { Episode, episodePath, formatDate, isoDate } from '../data/episodes';
 /**
  * Game art comes from the tier list pipeline's Steam capsule cache. A brand new
  * episode may not have art exported yet, so the card falls back to a
- * typographic tile rather than a broken image.
+ * typographic tile rather than a broken image. Until the art loads, the tile
+ * shows its dominant colour under a blurred placeholder (artMeta).
  */
 const EpisodeCard: React.FC<{ episode: Episode }> = ({ episode }) => (
   <Link
     to={episodePath(episode.slug)}
     className="group flex flex-col border border-ink-600 bg-ink-800 transition-colors hover:border-ink-500"
   >
-    <div className="relative aspect-[3/4] overflow-hidden bg-ink-700">
+    <div
+      className="relative aspect-[3/4] overflow-hidden bg-ink-700"
+      style={episode.art && episode.artMeta ? { backgroundColor: episode.artMeta.color } : undefined}
+    >
+      {episode.art && episode.artMeta && (
+        <div
+          aria-hidden="true"
+          className="absolute inset-0 scale-110 bg-cover bg-center blur-md"
+          style={{ backgroundImage: `url(${episode.artMeta.placeholder})` }}
+        />
+      )}
       {episode.art ? (
         <img
           src={episode.art}
           alt=""
           aria-hidden="true"
           loading="lazy"
-          className="h-full w-full object-cover transition-transform duration-500 group-hover:scale-[1.04]"
+          decoding="async"
+          width={episode.artMeta?.width}
+          height={episode.artMeta?.height}
+          className="relative h-full w-full object-cover transition-transform duration-500 group-hover:scale-[1.04]"
         />
       ) : (
         <div className="flex h-full w-full items-center justify-center p-4">
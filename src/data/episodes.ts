@@ -6,6 +6,14 @@ export type EpisodeBlock = {
   list: boolean;
 };
 
+/** Exported art's pixel size, dominant colour and a tiny data-URI placeholder. */
+export type ArtMeta = {
+  width: number;
+  height: number;
+  color: string;
+  placeholder: string;
+};
+
 export type Episode = {
   slug: string;
   title: string;
@@ -21,6 +29,8 @@ export type Episode = {
   /** Per-episode Apple Podcasts URL, resolved at build time. */
   apple: string | null;
   art: string | null;
+  /** Missing from snapshots written before export_episode_art.py produced it. */
+  artMeta?: ArtMeta | null;
   /** 1200x630 social preview card. */
   share: string | null;
   blurb: string;
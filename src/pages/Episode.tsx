@@ -98,7 +98,10 @@ const Episode: React.FC = () => {
             <img
               src={episode.art}
               alt={`${episode.title} cover art`}
-              className="w-full max-w-[18rem] border border-ink-600"
+              width={episode.artMeta?.width}
+              height={episode.artMeta?.height}
+              style={episode.artMeta ? { backgroundColor: episode.artMeta.color } : undefined}
+              className="h-auto w-full max-w-[18rem] border border-ink-600"
             />
           ) : (
             <div className="flex aspect-[2/3] w-full max-w-[18rem] items-center justify-center border border-ink-600 bg-ink-800 p-6">